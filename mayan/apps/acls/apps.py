@@ -1,3 +1,8 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_save
+)
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.apps import MayanAppConfig
@@ -9,6 +14,11 @@ from mayan.apps.views.html_widgets import ObjectLinkWidget
 
 from .classes import ModelPermission
 from .events import event_acl_deleted, event_acl_edited
+from .handlers import (
+    handler_decision_cache_invalidate, handler_effective_acls_delete,
+    handler_effective_acls_permissions_changed,
+    handler_effective_acls_post_save, handler_effective_acls_pre_save
+)
 from .links import (
     link_acl_create, link_acl_delete, link_acl_permissions,
     link_global_acl_list
@@ -76,3 +86,52 @@ class ACLsApp(MayanAppConfig):
         menu_setup.bind_links(
             links=(link_global_acl_list,)
         )
+
+        Group = apps.get_model(app_label='auth', model_name='Group')
+        Role = apps.get_model(app_label='permissions', model_name='Role')
+        StoredPermission = apps.get_model(
+            app_label='permissions', model_name='StoredPermission'
+        )
+        User = get_user_model()
+
+        for model in (AccessControlList, Group, Role, StoredPermission):
+            post_delete.connect(
+                dispatch_uid='acls_handler_decision_cache_invalidate_delete_{}'.format(
+                    model._meta.label
+                ), receiver=handler_decision_cache_invalidate, sender=model
+            )
+            post_save.connect(
+                dispatch_uid='acls_handler_decision_cache_invalidate_save_{}'.format(
+                    model._meta.label
+                ), receiver=handler_decision_cache_invalidate, sender=model
+            )
+
+        for through in (
+            AccessControlList.permissions.through, Role.groups.through,
+            Role.permissions.through, User.groups.through
+        ):
+            m2m_changed.connect(
+                dispatch_uid='acls_handler_decision_cache_invalidate_m2m_{}'.format(
+                    through._meta.label
+                ), receiver=handler_decision_cache_invalidate, sender=through
+            )
+
+        # Connected for all senders since models register their
+        # inheritances after this app is ready.
+        m2m_changed.connect(
+            dispatch_uid='acls_handler_effective_acls_permissions_changed',
+            receiver=handler_effective_acls_permissions_changed,
+            sender=AccessControlList.permissions.through
+        )
+        post_delete.connect(
+            dispatch_uid='acls_handler_effective_acls_delete',
+            receiver=handler_effective_acls_delete
+        )
+        post_save.connect(
+            dispatch_uid='acls_handler_effective_acls_post_save',
+            receiver=handler_effective_acls_post_save
+        )
+        pre_save.connect(
+            dispatch_uid='acls_handler_effective_acls_pre_save',
+            receiver=handler_effective_acls_pre_save
+        )
@@ -0,0 +1,160 @@
+import hashlib
+import logging
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.encoding import force_bytes
+
+from .literals import (
+    DECISION_CACHE_USER_ATTRIBUTE, DECISION_CACHE_VERSION_KEY
+)
+from .settings import (
+    setting_decision_cache_name, setting_decision_cache_timeout
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class AccessControlListDecisionCache:
+    """
+    Two level cache of access control decisions.
+    The first level is stored in the user instance and lives as long as the
+    instance does, usually the duration of a request. The second level is
+    optional, is shared between processes using a Django cache, and expires
+    after a timeout.
+    Entries of both levels are versioned. Any change that could alter an
+    access decision increases the version and invalidates all entries.
+    """
+    _version = 0
+
+    @staticmethod
+    def get_key(permission, user, obj=None):
+        if obj is None:
+            content_type_id = None
+            object_id = None
+        else:
+            ContentType = apps.get_model(
+                app_label='contenttypes', model_name='ContentType'
+            )
+            content_type_id = ContentType.objects.get_for_model(
+                model=obj
+            ).pk
+            object_id = obj.pk
+
+        return (
+            user.pk, user.is_superuser, user.is_staff, permission.pk,
+            content_type_id, object_id
+        )
+
+    @staticmethod
+    def get_shared_cache():
+        if setting_decision_cache_timeout.value:
+            return caches[setting_decision_cache_name.value]
+
+    @staticmethod
+    def get_shared_key(key, version):
+        return hashlib.sha256(
+            force_bytes(
+                s='acls_decision_{}_{}'.format(
+                    version, '_'.join(map(str, key))
+                )
+            )
+        ).hexdigest()
+
+    @classmethod
+    def _get_user_cache(cls, user):
+        user_cache = getattr(user, DECISION_CACHE_USER_ATTRIBUTE, None)
+
+        if not user_cache or user_cache['version'] != cls._version:
+            shared_cache = cls.get_shared_cache()
+            if shared_cache:
+                shared_version = shared_cache.get(
+                    key=DECISION_CACHE_VERSION_KEY, default=0
+                )
+            else:
+                shared_version = None
+
+            user_cache = {
+                'entries': {}, 'shared_version': shared_version,
+                'version': cls._version
+            }
+            setattr(user, DECISION_CACHE_USER_ATTRIBUTE, user_cache)
+
+        return user_cache
+
+    @classmethod
+    def _invalidate_committed(cls):
+        logger.debug('invalidating committed access control decisions')
+
+        # Decisions evaluated in this process while the change was not
+        # committed are discarded too.
+        cls._version += 1
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            try:
+                shared_cache.incr(key=DECISION_CACHE_VERSION_KEY)
+            except ValueError:
+                shared_cache.set(
+                    key=DECISION_CACHE_VERSION_KEY, timeout=None, value=1
+                )
+
+    @classmethod
+    def get(cls, permission, user, obj=None):
+        """
+        Return the cached decision or None if there is no decision cached.
+        """
+        if not user.is_authenticated:
+            return None
+
+        key = cls.get_key(obj=obj, permission=permission, user=user)
+        user_cache = cls._get_user_cache(user=user)
+
+        try:
+            return user_cache['entries'][key]
+        except KeyError:
+            shared_cache = cls.get_shared_cache()
+            if shared_cache and user_cache['shared_version'] is not None:
+                value = shared_cache.get(
+                    key=cls.get_shared_key(
+                        key=key, version=user_cache['shared_version']
+                    )
+                )
+                if value is not None:
+                    user_cache['entries'][key] = value
+
+                return value
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Invalidate the decisions of this process immediately and the
+        decisions shared with the other processes once the change is
+        committed. Increasing the shared version before the commit would
+        allow other processes to evaluate the old rows and cache them
+        with the new version.
+        """
+        logger.debug('invalidating access control decisions')
+
+        cls._version += 1
+
+        transaction.on_commit(func=cls._invalidate_committed)
+
+    @classmethod
+    def set(cls, permission, user, value, obj=None):
+        if not user.is_authenticated:
+            return
+
+        key = cls.get_key(obj=obj, permission=permission, user=user)
+        user_cache = cls._get_user_cache(user=user)
+        user_cache['entries'][key] = value
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache and user_cache['shared_version'] is not None:
+            shared_cache.set(
+                key=cls.get_shared_key(
+                    key=key, version=user_cache['shared_version']
+                ), timeout=setting_decision_cache_timeout.value,
+                value=value
+            )
@@ -21,8 +21,15 @@ class ModelPermission:
 
     @classmethod
     def deregister(cls, model):
+        cls._field_query_functions.pop(model, None)
+        cls._manager_names.pop(model, None)
         cls._model_permissions.pop(model, None)
 
+        cls._inheritances.pop(model, None)
+        for models in cls._inheritances_reverse.values():
+            while model in models:
+                models.remove(model)
+
     @classmethod
     def get_classes(cls, as_content_type=False):
         ContentType = apps.get_model(
@@ -95,6 +102,32 @@ class ModelPermission:
 
         return cls._inheritances[model]
 
+    @classmethod
+    def get_inheritances_reverse(cls, model):
+        """
+        Return the models that inherit the access of a model as a list of
+        (model, inheritance) tuples. Includes models inheriting via a
+        generic foreign key which can inherit from any model.
+        """
+        from django.contrib.contenttypes.fields import GenericForeignKey
+
+        model = model._meta.concrete_model
+        result = []
+
+        for child_model, inheritances in cls._inheritances.items():
+            for inheritance in inheritances:
+                related_field = get_related_field(
+                    model=child_model,
+                    related_field_name=inheritance['field_name']
+                )
+
+                if isinstance(related_field, GenericForeignKey):
+                    result.append((child_model, inheritance))
+                elif related_field.related_model._meta.concrete_model == model:
+                    result.append((child_model, inheritance))
+
+        return result
+
     @classmethod
     def get_manager(cls, model):
         try:
@@ -0,0 +1,112 @@
+from django.apps import apps
+
+from .caches import AccessControlListDecisionCache
+from .classes import ModelPermission
+from .literals import EFFECTIVE_ACLS_UPDATE_INSTANCE_ATTRIBUTE
+from .settings import setting_effective_acls_enable
+
+
+def _get_inheritance_field_values(instance):
+    """
+    Return the values of the local fields that link an instance to the
+    objects from which it inherits access.
+    """
+    from django.contrib.contenttypes.fields import GenericForeignKey
+
+    result = {}
+
+    for inheritance in ModelPermission.get_inheritances(model=type(instance)):
+        field = instance._meta.get_field(
+            inheritance['field_name'].split('__')[0]
+        )
+
+        if isinstance(field, GenericForeignKey):
+            attnames = (
+                instance._meta.get_field(field.ct_field).attname,
+                field.fk_field
+            )
+        else:
+            attnames = (field.attname,)
+
+        for attname in attnames:
+            result[attname] = getattr(instance, attname)
+
+    return result
+
+
+def handler_decision_cache_invalidate(sender, **kwargs):
+    # Only react to the completed many to many changes.
+    if not kwargs.get('action', 'post').startswith('pre'):
+        AccessControlListDecisionCache.invalidate()
+
+
+def handler_effective_acls_delete(sender, instance, **kwargs):
+    if setting_effective_acls_enable.value:
+        try:
+            ModelPermission.get_inheritances(model=sender)
+        except KeyError:
+            if not ModelPermission.get_for_class(klass=sender):
+                return
+
+        EffectiveAccessControlList = apps.get_model(
+            app_label='acls', model_name='EffectiveAccessControlList'
+        )
+        EffectiveAccessControlList.objects.delete_for_object(obj=instance)
+
+
+def handler_effective_acls_permissions_changed(sender, instance, **kwargs):
+    # Only react to the completed many to many changes.
+    if setting_effective_acls_enable.value and not kwargs['action'].startswith('pre'):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+        EffectiveAccessControlList = apps.get_model(
+            app_label='acls', model_name='EffectiveAccessControlList'
+        )
+
+        if isinstance(instance, AccessControlList):
+            queryset = (instance,)
+        else:
+            # Reverse relation, the instance is the stored permission.
+            queryset = AccessControlList.objects.filter(
+                pk__in=kwargs['pk_set'] or ()
+            )
+
+        for acl in queryset:
+            EffectiveAccessControlList.objects.update_for_acl(acl=acl)
+
+
+def handler_effective_acls_pre_save(sender, instance, **kwargs):
+    if setting_effective_acls_enable.value and not instance._state.adding:
+        try:
+            field_values = _get_inheritance_field_values(instance=instance)
+        except KeyError:
+            return
+
+        old_field_values = sender._base_manager.filter(
+            pk=instance.pk
+        ).values(*field_values.keys()).first()
+
+        if old_field_values != field_values:
+            setattr(instance, EFFECTIVE_ACLS_UPDATE_INSTANCE_ATTRIBUTE, True)
+
+
+def handler_effective_acls_post_save(sender, instance, created, **kwargs):
+    if setting_effective_acls_enable.value:
+        try:
+            ModelPermission.get_inheritances(model=sender)
+        except KeyError:
+            return
+
+        EffectiveAccessControlList = apps.get_model(
+            app_label='acls', model_name='EffectiveAccessControlList'
+        )
+
+        if created:
+            EffectiveAccessControlList.objects.update_for_object(
+                created=True, obj=instance
+            )
+        elif instance.__dict__.pop(EFFECTIVE_ACLS_UPDATE_INSTANCE_ATTRIBUTE, False):
+            EffectiveAccessControlList.objects.update_for_object(
+                obj=instance
+            )
@@ -0,0 +1,9 @@
+DEFAULT_ACLS_DECISION_CACHE_NAME = 'default'
+DEFAULT_ACLS_DECISION_CACHE_TIMEOUT = 0
+DEFAULT_ACLS_EFFECTIVE_ACLS_ENABLE = False
+
+DECISION_CACHE_USER_ATTRIBUTE = '_acls_decision_cache'
+DECISION_CACHE_VERSION_KEY = 'acls_decision_cache_version'
+
+EFFECTIVE_ACLS_BULK_CREATE_BATCH_SIZE = 1000
+EFFECTIVE_ACLS_UPDATE_INSTANCE_ATTRIBUTE = '_acls_effective_update'
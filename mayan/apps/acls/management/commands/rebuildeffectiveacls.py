@@ -0,0 +1,10 @@
+from django.core import management
+
+from ...models import EffectiveAccessControlList
+
+
+class Command(management.BaseCommand):
+    help = 'Rebuild the effective access control entries from the ACLs.'
+
+    def handle(self, *args, **options):
+        EffectiveAccessControlList.objects.rebuild()
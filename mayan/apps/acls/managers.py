@@ -2,11 +2,12 @@ from functools import reduce
 import logging
 import operator
 
+from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import PermissionDenied
-from django.db import models
-from django.db.models import CharField, Q, Value
+from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.db import models, transaction
+from django.db.models import BooleanField, Case, CharField, Q, Value, When
 from django.db.models.functions import Cast, Concat
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext
@@ -17,8 +18,11 @@ from mayan.apps.common.utils import (
 from mayan.apps.permissions import Permission
 from mayan.apps.permissions.models import StoredPermission
 
+from .caches import AccessControlListDecisionCache
 from .exceptions import PermissionNotValidForClass
 from .classes import ModelPermission
+from .literals import EFFECTIVE_ACLS_BULK_CREATE_BATCH_SIZE
+from .settings import setting_effective_acls_enable
 
 logger = logging.getLogger(name=__name__)
 
@@ -230,6 +234,60 @@ class AccessControlListManager(models.Manager):
 
         return result
 
+    def _get_acl_query(self, queryset, stored_permission, user):
+        """
+        Return the query that filters the queryset to the objects for which
+        the user has been granted the permission via ACLs.
+        """
+        if setting_effective_acls_enable.value:
+            try:
+                ModelPermission.get_field_query_function(
+                    model=queryset.model
+                )
+            except KeyError:
+                # Models with a field query function are not included in
+                # the effective ACLs and use the ACL filters.
+                EffectiveAccessControlList = apps.get_model(
+                    app_label='acls', model_name='EffectiveAccessControlList'
+                )
+
+                return Q(
+                    pk__in=EffectiveAccessControlList.objects.filter(
+                        content_type=ContentType.objects.get_for_model(
+                            model=queryset.model
+                        ), role__groups__user=user,
+                        stored_permission=stored_permission
+                    ).values('object_id')
+                )
+
+        return reduce(
+            operator.or_, self._get_acl_filters(
+                queryset=queryset, stored_permission=stored_permission,
+                user=user
+            )
+        )
+
+    def _check_user_permission(self, permission, user):
+        result = AccessControlListDecisionCache.get(
+            permission=permission, user=user
+        )
+
+        if result is None:
+            try:
+                Permission.check_user_permissions(
+                    permissions=(permission,), user=user
+                )
+            except PermissionDenied:
+                result = False
+            else:
+                result = True
+
+            AccessControlListDecisionCache.set(
+                permission=permission, user=user, value=result
+            )
+
+        return result
+
     def check_access(self, obj, permissions, user):
         # Allow specific managers for models that have more than one
         # for example the Document model when checking for access for a trashed
@@ -249,45 +307,134 @@ class AccessControlListManager(models.Manager):
             manager = ModelPermission.get_manager(model=obj._meta.model)
             source_queryset = manager.all()
 
-        restricted_queryset = manager.none()
+        # Default relationship betweens permissions is OR.
         for permission in permissions:
-            # Default relationship betweens permissions is OR.
-            restricted_queryset = restricted_queryset | self.restrict_queryset(
-                permission=permission, queryset=source_queryset, user=user
+            result = AccessControlListDecisionCache.get(
+                obj=obj, permission=permission, user=user
             )
 
-        if restricted_queryset.filter(pk=obj.pk).exists():
-            return True
-        else:
-            raise PermissionDenied(
-                ugettext(message='Insufficient access for: %s') % force_text(
-                    s=obj
+            if result is None:
+                result = self.restrict_queryset(
+                    permission=permission, queryset=source_queryset,
+                    user=user
+                ).filter(pk=obj.pk).exists()
+
+                AccessControlListDecisionCache.set(
+                    obj=obj, permission=permission, user=user, value=result
                 )
+
+            if result:
+                return True
+
+        raise PermissionDenied(
+            ugettext(message='Insufficient access for: %s') % force_text(
+                s=obj
             )
+        )
+
+    def get_permitted_objects(self, objects, permissions, user):
+        """
+        Bulk version of `check_access`. Evaluate several permissions for a
+        list of objects using one query per model and return a dictionary
+        with the list of objects permitted for each permission.
+        The decisions are stored in the decision cache so that later calls
+        to `check_access` for the same objects don't cause more queries.
+        """
+        result = {permission: [] for permission in permissions}
+
+        if not user.is_authenticated:
+            return result
+
+        objects_by_model = {}
+        for obj in objects:
+            meta = getattr(obj, '_meta', None)
+
+            if not meta:
+                # Objects that are not models are not checked for access,
+                # same as `check_access`.
+                for permission in permissions:
+                    result[permission].append(obj)
+            else:
+                objects_by_model.setdefault(meta.model, []).append(obj)
+
+        for model, model_objects in objects_by_model.items():
+            manager = ModelPermission.get_manager(model=model)
+            source_queryset = manager.all()
+
+            annotations = {}
+            decisions = {}
+            pending_pk_list = set()
+
+            for index, permission in enumerate(permissions):
+                for obj in model_objects:
+                    decisions[(permission, obj.pk)] = AccessControlListDecisionCache.get(
+                        obj=obj, permission=permission, user=user
+                    )
+
+                pending_objects = [
+                    obj for obj in model_objects if decisions[
+                        (permission, obj.pk)
+                    ] is None
+                ]
+
+                if not pending_objects:
+                    continue
+
+                if self._check_user_permission(permission=permission, user=user):
+                    for obj in pending_objects:
+                        decisions[(permission, obj.pk)] = True
+                else:
+                    acl_query = self._get_acl_query(
+                        queryset=source_queryset,
+                        stored_permission=permission.stored_permission,
+                        user=user
+                    )
+
+                    annotations['acl_permission_{}'.format(index)] = Case(
+                        When(acl_query, then=Value(value=True)),
+                        default=Value(value=False),
+                        output_field=BooleanField()
+                    )
+                    pending_pk_list.update(obj.pk for obj in pending_objects)
+
+            if annotations:
+                queryset = source_queryset.filter(
+                    pk__in=pending_pk_list
+                ).annotate(**annotations).values('pk', *annotations.keys())
+
+                for row in queryset:
+                    for index, permission in enumerate(permissions):
+                        annotation_name = 'acl_permission_{}'.format(index)
+                        if annotation_name in row and decisions[(permission, row['pk'])] is None:
+                            decisions[(permission, row['pk'])] = row[annotation_name]
+
+            # Objects missing from the queryset, like those excluded by the
+            # model's permission manager, are not permitted.
+            for permission in permissions:
+                for obj in model_objects:
+                    value = bool(decisions[(permission, obj.pk)])
+
+                    AccessControlListDecisionCache.set(
+                        obj=obj, permission=permission, user=user, value=value
+                    )
+
+                    if value:
+                        result[permission].append(obj)
+
+        return result
 
     def restrict_queryset(self, permission, queryset, user):
         if not user.is_authenticated:
             return queryset.none()
 
         # Check directly granted permission via a role
-        try:
-            Permission.check_user_permissions(
-                permissions=(permission,), user=user
-            )
-        except PermissionDenied:
-            acl_filters = self._get_acl_filters(
-                queryset=queryset,
-                stored_permission=permission.stored_permission, user=user
+        if not self._check_user_permission(permission=permission, user=user):
+            return queryset.filter(
+                self._get_acl_query(
+                    queryset=queryset,
+                    stored_permission=permission.stored_permission, user=user
+                )
             )
-
-            final_query = None
-            for acl_filter in acl_filters:
-                if final_query is None:
-                    final_query = acl_filter
-                else:
-                    final_query = final_query | acl_filter
-
-            return queryset.filter(final_query)
         else:
             # User has direct permission assignment via a role, is superuser
             # or is staff. Return the entire queryset.
@@ -380,3 +527,256 @@ class AccessControlListManager(models.Manager):
 
         if acl.permissions.count() == 0:
             acl.delete()
+
+
+class EffectiveAccessControlListManager(models.Manager):
+    def _create_for_acl(self, acl, subtree):
+        """
+        Create the entries of an ACL for the objects of a subtree.
+        """
+        stored_permissions = list(acl.permissions.all())
+
+        if not stored_permissions:
+            return
+
+        entries = []
+        for model, queryset in subtree.items():
+            content_type = ContentType.objects.get_for_model(model=model)
+
+            for object_id in queryset.values_list('pk', flat=True).iterator():
+                for stored_permission in stored_permissions:
+                    entries.append(
+                        self.model(
+                            acl=acl, content_type=content_type,
+                            object_id=object_id, role_id=acl.role_id,
+                            stored_permission=stored_permission
+                        )
+                    )
+
+                if len(entries) >= EFFECTIVE_ACLS_BULK_CREATE_BATCH_SIZE:
+                    self.bulk_create(objs=entries)
+                    entries = []
+
+        if entries:
+            self.bulk_create(objs=entries)
+
+    def _get_ancestor_acls(self, obj, path=()):
+        """
+        Return the ACLs of the objects from which an object inherits access.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        result = {}
+
+        try:
+            inheritances = ModelPermission.get_inheritances(model=type(obj))
+        except KeyError:
+            return result
+
+        path = path + ((obj._meta.concrete_model, obj.pk),)
+
+        for inheritance in inheritances:
+            try:
+                parent_object = return_related(
+                    instance=obj, related_field=inheritance['field_name']
+                )
+            except (AttributeError, ObjectDoesNotExist):
+                parent_object = None
+
+            if parent_object is None:
+                continue
+
+            if (parent_object._meta.concrete_model, parent_object.pk) in path:
+                # Break inheritance cycles.
+                continue
+
+            queryset = AccessControlList.objects.filter(
+                content_type=ContentType.objects.get_for_model(
+                    model=parent_object
+                ), object_id=parent_object.pk
+            )
+            for acl in queryset:
+                result[acl.pk] = acl
+
+            result.update(
+                self._get_ancestor_acls(obj=parent_object, path=path)
+            )
+
+        return result
+
+    def _get_descendant_queries(self, model, queryset, path=()):
+        """
+        Return a list of (model, query) tuples that select the objects
+        that inherit access from the objects of the queryset.
+        """
+        result = []
+        path = path + (model,)
+
+        for child_model, inheritance in ModelPermission.get_inheritances_reverse(model=model):
+            child_model = child_model._meta.concrete_model
+
+            if child_model in path:
+                # Break inheritance cycles.
+                continue
+
+            related_field = get_related_field(
+                model=child_model,
+                related_field_name=inheritance['field_name']
+            )
+
+            if isinstance(related_field, GenericForeignKey):
+                recursive_related_reference = '__'.join(
+                    inheritance['field_name'].split('__')[0:-1]
+                )
+                if recursive_related_reference:
+                    recursive_related_reference = '{}__'.format(
+                        recursive_related_reference
+                    )
+
+                if inheritance['fk_field_cast']:
+                    object_id_queryset = queryset.annotate(
+                        clean_object_id=Cast(
+                            'pk', output_field=inheritance['fk_field_cast']()
+                        )
+                    ).values('clean_object_id')
+                else:
+                    object_id_queryset = queryset
+
+                query = Q(
+                    **{
+                        '{}{}'.format(
+                            recursive_related_reference, related_field.ct_field
+                        ): ContentType.objects.get_for_model(model=model),
+                        '{}{}__in'.format(
+                            recursive_related_reference, related_field.fk_field
+                        ): object_id_queryset
+                    }
+                )
+            else:
+                query = Q(
+                    **{'{}__in'.format(inheritance['field_name']): queryset}
+                )
+
+            result.append((child_model, query))
+            result.extend(
+                self._get_descendant_queries(
+                    model=child_model,
+                    queryset=child_model._base_manager.filter(
+                        query
+                    ).values('pk'), path=path
+                )
+            )
+
+        return result
+
+    def _get_subtree(self, obj, include_descendants=True):
+        """
+        Return a dictionary of querysets per model of an object and of the
+        objects that inherit access from it.
+        """
+        model = obj._meta.concrete_model
+        queryset = model._base_manager.filter(pk=obj.pk).values('pk')
+
+        queries = {}
+        if include_descendants:
+            for child_model, query in self._get_descendant_queries(model=model, queryset=queryset):
+                queries.setdefault(child_model, []).append(query)
+
+        result = {model: queryset}
+        for child_model, child_queries in queries.items():
+            child_queryset = child_model._base_manager.filter(
+                reduce(operator.or_, child_queries)
+            ).values('pk')
+
+            if child_model in result:
+                result[child_model] = result[child_model] | child_queryset
+            else:
+                result[child_model] = child_queryset
+
+        return result
+
+    def delete_for_object(self, obj):
+        self.filter(
+            content_type=ContentType.objects.get_for_model(model=obj),
+            object_id=obj.pk
+        ).delete()
+
+    def rebuild(self):
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        with transaction.atomic():
+            self.all().delete()
+
+            for acl in AccessControlList.objects.all():
+                self.update_for_acl(acl=acl)
+
+    def update_for_acl(self, acl):
+        """
+        Recreate the entries of an ACL.
+        """
+        with transaction.atomic():
+            self.filter(acl=acl).delete()
+
+            try:
+                obj = acl.content_object
+            except AttributeError:
+                # Model of the ACL's content type no longer exists.
+                obj = None
+
+            if obj is not None:
+                self._create_for_acl(acl=acl, subtree=self._get_subtree(obj=obj))
+
+    def update_for_object(self, obj, created=False):
+        """
+        Update the entries of an object and of the objects that inherit
+        access from it after the object is created or its parent changes.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        subtree = self._get_subtree(
+            include_descendants=not created, obj=obj
+        )
+
+        with transaction.atomic():
+            # Entries of the ACLs of the objects in the subtree don't
+            # depend on the parents of the object and are kept.
+            query = reduce(
+                operator.or_, [
+                    Q(
+                        content_type=ContentType.objects.get_for_model(
+                            model=model
+                        ), object_id__in=queryset
+                    ) for model, queryset in subtree.items()
+                ]
+            )
+
+            self.filter(query).exclude(
+                acl__in=AccessControlList.objects.filter(query)
+            ).delete()
+
+            for acl in self._get_ancestor_acls(obj=obj).values():
+                self._create_for_acl(acl=acl, subtree=subtree)
+
+    def update_for_queryset(self, queryset):
+        """
+        Bulk version of `update_for_object(created=True)` for objects
+        inserted without sending model signals. All the objects of the
+        queryset must inherit access from the same parents.
+        """
+        obj = queryset.first()
+
+        if obj is None:
+            return
+
+        model = obj._meta.concrete_model
+        subtree = {model: queryset.values('pk')}
+
+        with transaction.atomic():
+            for acl in self._get_ancestor_acls(obj=obj).values():
+                self._create_for_acl(acl=acl, subtree=subtree)
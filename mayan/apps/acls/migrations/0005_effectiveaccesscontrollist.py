@@ -0,0 +1,32 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('permissions', '0004_auto_20191213_0044'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('acls', '0004_auto_20210130_0322'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EffectiveAccessControlList',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('acl', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='effective_entries', to='acls.AccessControlList', verbose_name='Access entry')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.ContentType')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='effective_acls', to='permissions.Role', verbose_name='Role')),
+                ('stored_permission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='effective_acls', to='permissions.StoredPermission', verbose_name='Permission')),
+            ],
+            options={
+                'verbose_name': 'Effective access entry',
+                'verbose_name_plural': 'Effective access entries',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='effectiveaccesscontrollist',
+            index=models.Index(fields=['content_type', 'stored_permission', 'role', 'object_id'], name='acls_effect_content_5eaaee_idx'),
+        ),
+    ]
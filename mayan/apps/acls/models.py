@@ -14,7 +14,9 @@ from mayan.apps.events.decorators import method_event
 from mayan.apps.permissions.models import Role, StoredPermission
 
 from .events import event_acl_created, event_acl_deleted, event_acl_edited
-from .managers import AccessControlListManager
+from .managers import (
+    AccessControlListManager, EffectiveAccessControlListManager
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -118,6 +120,44 @@ class AccessControlList(ExtraDataModelMixin, models.Model):
         return super().save(*args, **kwargs)
 
 
+class EffectiveAccessControlList(models.Model):
+    """
+    Precomputed permission of a role for an object. There is an entry for
+    each permission of an ACL for the object of the ACL and for each of the
+    objects that inherit access from it. Entries are deleted when their
+    source ACL is deleted.
+    """
+    acl = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_entries',
+        to=AccessControlList, verbose_name=_('Access entry')
+    )
+    content_type = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='+', to=ContentType
+    )
+    object_id = models.PositiveIntegerField()
+    role = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_acls', to=Role,
+        verbose_name=_('Role')
+    )
+    stored_permission = models.ForeignKey(
+        on_delete=models.CASCADE, related_name='effective_acls',
+        to=StoredPermission, verbose_name=_('Permission')
+    )
+
+    objects = EffectiveAccessControlListManager()
+
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=(
+                    'content_type', 'stored_permission', 'role', 'object_id'
+                )
+            ),
+        )
+        verbose_name = _('Effective access entry')
+        verbose_name_plural = _('Effective access entries')
+
+
 class GlobalAccessControlListProxy(AccessControlList):
     class Meta:
         proxy = True
@@ -0,0 +1,41 @@
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.smart_settings.classes import SettingNamespace
+
+from .literals import (
+    DEFAULT_ACLS_DECISION_CACHE_NAME, DEFAULT_ACLS_DECISION_CACHE_TIMEOUT,
+    DEFAULT_ACLS_EFFECTIVE_ACLS_ENABLE
+)
+
+namespace = SettingNamespace(label=_('ACLs'), name='acls')
+
+setting_decision_cache_name = namespace.add_setting(
+    default=DEFAULT_ACLS_DECISION_CACHE_NAME,
+    global_name='ACLS_DECISION_CACHE_NAME', help_text=_(
+        'Name of the Django cache used to share access control decisions '
+        'between processes. The cache must be shared by all processes, '
+        'like a Redis or Memcached cache.'
+    )
+)
+setting_decision_cache_timeout = namespace.add_setting(
+    default=DEFAULT_ACLS_DECISION_CACHE_TIMEOUT,
+    global_name='ACLS_DECISION_CACHE_TIMEOUT', help_text=_(
+        'Time in seconds to keep access control decisions in the shared '
+        'cache. Changes to ACLs, roles, groups, and permissions invalidate '
+        'the cache as soon as they are committed. Other changes, like '
+        'moving an object to a different parent, become visible after '
+        'this time. '
+        'A value of 0 disables the shared cache.'
+    )
+)
+setting_effective_acls_enable = namespace.add_setting(
+    default=DEFAULT_ACLS_EFFECTIVE_ACLS_ENABLE,
+    global_name='ACLS_EFFECTIVE_ACLS_ENABLE', help_text=_(
+        'Resolve access control using a precomputed table of the '
+        'permissions each role has for each object, including the '
+        'permissions inherited from parent objects. The table is updated '
+        'when ACLs or the parents of objects change. Run the '
+        '"rebuildeffectiveacls" command after enabling this setting and '
+        'after changes made by bulk updates.'
+    )
+)
@@ -9,6 +9,7 @@ from mayan.apps.user_management.tests.mixins import UserTestCaseMixin
 from ..classes import ModelPermission
 from ..models import AccessControlList
 from ..permissions import permission_acl_edit, permission_acl_view
+from ..settings import setting_effective_acls_enable
 
 
 class ACLAPIViewTestMixin:
@@ -122,6 +123,19 @@ class ACLTestCaseMixin(RoleTestCaseMixin, UserTestCaseMixin):
         )
 
 
+class EffectiveACLTestMixin:
+    def setUp(self):
+        super().setUp()
+        self._effective_acls_enable_value = setting_effective_acls_enable.value
+        setting_effective_acls_enable.set(value=True)
+
+    def tearDown(self):
+        setting_effective_acls_enable.set(
+            value=self._effective_acls_enable_value
+        )
+        super().tearDown()
+
+
 class ACLTestMixin(RoleTestMixin):
     auto_create_test_role = True
     auto_create_acl_test_object = False
@@ -0,0 +1,192 @@
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.test import override_settings
+
+from mayan.apps.testing.tests.base import (
+    BaseTestCase, BaseTransactionTestCase
+)
+
+from ..caches import AccessControlListDecisionCache
+from ..literals import DECISION_CACHE_VERSION_KEY
+from ..models import AccessControlList
+from ..settings import setting_decision_cache_timeout
+
+from .mixins import ACLTestMixin
+
+
+class AccessControlListDecisionCacheTestCase(ACLTestMixin, BaseTestCase):
+    auto_create_acl_test_object = True
+
+    def _check_access(self):
+        return AccessControlList.objects.check_access(
+            obj=self.test_object, permissions=(self.test_permission,),
+            user=self._test_case_user
+        )
+
+    def test_check_access_cache_hit(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        self._check_access()
+
+        with self.assertNumQueries(num=0):
+            self._check_access()
+
+    def test_check_access_cache_grant_invalidation(self):
+        with self.assertRaises(expected_exception=PermissionDenied):
+            self._check_access()
+
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        try:
+            self._check_access()
+        except PermissionDenied:
+            self.fail('PermissionDenied exception was not expected.')
+
+    def test_check_access_cache_revoke_invalidation(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+        self._check_access()
+
+        self.revoke_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        with self.assertRaises(expected_exception=PermissionDenied):
+            self._check_access()
+
+    def test_check_access_cache_group_membership_invalidation(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+        self._check_access()
+
+        self._test_case_group.user_set.remove(self._test_case_user)
+
+        with self.assertRaises(expected_exception=PermissionDenied):
+            self._check_access()
+
+    def test_check_access_cache_role_permission_invalidation(self):
+        with self.assertRaises(expected_exception=PermissionDenied):
+            self._check_access()
+
+        self.grant_permission(permission=self.test_permission)
+
+        try:
+            self._check_access()
+        except PermissionDenied:
+            self.fail('PermissionDenied exception was not expected.')
+
+
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+        }
+    }
+)
+class AccessControlListDecisionSharedCacheTestCase(
+    ACLTestMixin, BaseTransactionTestCase
+):
+    """
+    Use a transaction test case to test the transaction.on_commit code
+    of the shared cache invalidation. Convert back to a normal test case
+    and use `captureOnCommitCallbacks` when upgraded to Django 3.2.
+    """
+    auto_create_acl_test_object = True
+
+    class FakeException(Exception):
+        """
+        Exception to force the transaction to roll back but not the test
+        itself.
+        """
+
+    def setUp(self):
+        super().setUp()
+        self.old_value = setting_decision_cache_timeout.value
+        setting_decision_cache_timeout.set(value=60)
+
+    def tearDown(self):
+        AccessControlListDecisionCache.get_shared_cache().clear()
+        setting_decision_cache_timeout.set(value=self.old_value)
+        super().tearDown()
+
+    def _check_access(self, user):
+        return AccessControlList.objects.check_access(
+            obj=self.test_object, permissions=(self.test_permission,),
+            user=user
+        )
+
+    def _get_shared_cache_version(self):
+        return AccessControlListDecisionCache.get_shared_cache().get(
+            key=DECISION_CACHE_VERSION_KEY, default=0
+        )
+
+    def test_shared_cache_hit(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        self._check_access(user=self._test_case_user)
+
+        # Use a new user instance to bypass the local cache.
+        user = self._test_case_user._meta.model.objects.get(
+            pk=self._test_case_user.pk
+        )
+
+        with self.assertNumQueries(num=0):
+            self._check_access(user=user)
+
+    def test_shared_cache_invalidation(self):
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        self._check_access(user=self._test_case_user)
+
+        self.revoke_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        user = self._test_case_user._meta.model.objects.get(
+            pk=self._test_case_user.pk
+        )
+
+        with self.assertRaises(expected_exception=PermissionDenied):
+            self._check_access(user=user)
+
+    def test_shared_cache_invalidation_after_commit(self):
+        shared_cache_version = self._get_shared_cache_version()
+
+        with transaction.atomic():
+            self.grant_access(
+                obj=self.test_object, permission=self.test_permission
+            )
+
+            self.assertEqual(
+                self._get_shared_cache_version(), shared_cache_version
+            )
+
+        self.assertNotEqual(
+            self._get_shared_cache_version(), shared_cache_version
+        )
+
+    def test_shared_cache_invalidation_rollback(self):
+        shared_cache_version = self._get_shared_cache_version()
+
+        try:
+            with transaction.atomic():
+                self.grant_access(
+                    obj=self.test_object, permission=self.test_permission
+                )
+                raise self.FakeException
+        except self.FakeException:
+            """Expected, the transaction was rolled back."""
+
+        self.assertEqual(
+            self._get_shared_cache_version(), shared_cache_version
+        )
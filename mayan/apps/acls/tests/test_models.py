@@ -7,9 +7,9 @@ from mayan.apps.events.classes import EventModelRegistry
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..classes import ModelPermission
-from ..models import AccessControlList
+from ..models import AccessControlList, EffectiveAccessControlList
 
-from .mixins import ACLTestMixin
+from .mixins import ACLTestMixin, EffectiveACLTestMixin
 
 
 class PermissionTestCase(ACLTestMixin, BaseTestCase):
@@ -166,6 +166,66 @@ class PermissionTestCase(ACLTestMixin, BaseTestCase):
         )
         self.assertTrue(self.test_object_child in result)
 
+    def test_get_permitted_objects_with_inherited_acl(self):
+        self._setup_child_parent_test_objects()
+
+        test_object_child_2 = self.TestModelChild.objects.create(
+            parent=self.TestModelParent.objects.create()
+        )
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        result = AccessControlList.objects.get_permitted_objects(
+            objects=(self.test_object_child, test_object_child_2),
+            permissions=(self.test_permission,), user=self._test_case_user
+        )
+        self.assertEqual(
+            result[self.test_permission], [self.test_object_child]
+        )
+
+    def test_get_permitted_objects_check_access_cache(self):
+        self._setup_child_parent_test_objects()
+
+        test_object_child_2 = self.TestModelChild.objects.create(
+            parent=self.TestModelParent.objects.create()
+        )
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        AccessControlList.objects.get_permitted_objects(
+            objects=(self.test_object_child, test_object_child_2),
+            permissions=(self.test_permission,), user=self._test_case_user
+        )
+
+        with self.assertNumQueries(num=0):
+            AccessControlList.objects.check_access(
+                obj=self.test_object_child,
+                permissions=(self.test_permission,),
+                user=self._test_case_user
+            )
+
+            with self.assertRaises(expected_exception=PermissionDenied):
+                AccessControlList.objects.check_access(
+                    obj=test_object_child_2,
+                    permissions=(self.test_permission,),
+                    user=self._test_case_user
+                )
+
+    def test_get_permitted_objects_with_role_permission(self):
+        self._create_acl_test_object()
+
+        self.grant_permission(permission=self.test_permission)
+
+        result = AccessControlList.objects.get_permitted_objects(
+            objects=(self.test_object,), permissions=(self.test_permission,),
+            user=self._test_case_user
+        )
+        self.assertEqual(result[self.test_permission], [self.test_object])
+
     def test_method_get_absolute_url(self):
         self._create_acl_test_object()
         self._create_test_acl()
@@ -625,3 +685,112 @@ class ProxyModelPermissionTestCase(ACLTestMixin, BaseTestCase):
                 user=self._test_case_user
             )
         )
+
+
+class EffectiveACLPermissionTestCase(EffectiveACLTestMixin, PermissionTestCase):
+    def _restrict_queryset_child(self):
+        return AccessControlList.objects.restrict_queryset(
+            permission=self.test_permission,
+            queryset=self.TestModelChild.objects.all(),
+            user=self._test_case_user
+        )
+
+    def test_effective_acls_usage(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        EffectiveAccessControlList.objects.all().delete()
+
+        self.assertFalse(
+            self.test_object_child in self._restrict_queryset_child()
+        )
+
+    def test_effective_acls_child_creation(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        test_object_child = self.TestModelChild.objects.create(
+            parent=self.test_object_parent
+        )
+
+        self.assertTrue(test_object_child in self._restrict_queryset_child())
+
+    def test_effective_acls_child_parent_change(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.test_object_child.parent = self.TestModelParent.objects.create()
+        self.test_object_child.save()
+
+        self.assertFalse(
+            self.test_object_child in self._restrict_queryset_child()
+        )
+
+        self.test_object_child.parent = self.test_object_parent
+        self.test_object_child.save()
+
+        self.assertTrue(
+            self.test_object_child in self._restrict_queryset_child()
+        )
+
+    def test_effective_acls_revoke(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+        self.revoke_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        self.assertFalse(
+            self.test_object_child in self._restrict_queryset_child()
+        )
+        self.assertEqual(EffectiveAccessControlList.objects.count(), 0)
+
+    def test_effective_acls_rebuild(self):
+        self._setup_child_parent_test_objects()
+
+        self.grant_access(
+            obj=self.test_object_parent, permission=self.test_permission
+        )
+
+        EffectiveAccessControlList.objects.all().delete()
+        EffectiveAccessControlList.objects.rebuild()
+
+        self.assertTrue(
+            self.test_object_child in self._restrict_queryset_child()
+        )
+
+
+class EffectiveACLInheritedPermissionTestCase(
+    EffectiveACLTestMixin, InheritedPermissionTestCase
+):
+    """
+    Repeat the inherited permission tests using the effective ACLs.
+    """
+
+
+class EffectiveACLGenericForeignKeyFieldModelTestCase(
+    EffectiveACLTestMixin, GenericForeignKeyFieldModelTestCase
+):
+    """
+    Repeat the generic foreign key tests using the effective ACLs.
+    """
+
+
+class EffectiveACLProxyModelPermissionTestCase(
+    EffectiveACLTestMixin, ProxyModelPermissionTestCase
+):
+    """
+    Repeat the proxy model tests using the effective ACLs.
+    """
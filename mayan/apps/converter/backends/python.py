@@ -1,7 +1,12 @@
+from collections import OrderedDict
+from contextlib import contextmanager
 import io
 import logging
+import os
+import re
 import shutil
 import struct
+import threading
 
 from PIL import Image
 import PyPDF2
@@ -10,22 +15,35 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, fs_cleanup, mkdtemp
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
 from ..settings import setting_graphics_backend_arguments
 
 from ..literals import (
-    DEFAULT_PDFTOPPM_DPI, DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH,
-    DEFAULT_PDFINFO_PATH, DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS
+    CONVERTER_PDF_FILE_CACHE_MAXIMUM_SIZE, DEFAULT_PDFTOPPM_DPI,
+    DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH, DEFAULT_PDFINFO_PATH,
+    DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS
 )
 
+try:
+    # Optional in process binding of the poppler library.
+    import poppler
+except ImportError:
+    poppler = None
+
 logger = logging.getLogger(name=__name__)
 pdftoppm_path = setting_graphics_backend_arguments.value.get(
     'pdftoppm_path', DEFAULT_PDFTOPPM_PATH
 )
 
+pdftoppm_dpi = format(
+    setting_graphics_backend_arguments.value.get(
+        'pdftoppm_dpi', DEFAULT_PDFTOPPM_DPI
+    )
+)
+
 try:
     pdftoppm = sh.Command(path=pdftoppm_path)
 except sh.CommandNotFound:
@@ -37,12 +55,6 @@ else:
         )
     )
 
-    pdftoppm_dpi = format(
-        setting_graphics_backend_arguments.value.get(
-            'pdftoppm_dpi', DEFAULT_PDFTOPPM_DPI
-        )
-    )
-
     pdftoppm = pdftoppm.bake(pdftoppm_format, '-r', pdftoppm_dpi)
 
 pdfinfo_path = setting_graphics_backend_arguments.value.get(
@@ -60,29 +72,203 @@ pillow_maximum_image_pixels = setting_graphics_backend_arguments.value.get(
 )
 Image.MAX_IMAGE_PIXELS = pillow_maximum_image_pixels
 
+regex_pdftoppm_page_number = re.compile(r'-(\d+)\.\w+$')
+
+
+class PDFFileCache:
+    """
+    Per process cache of the PDF files materialized as temporary files for
+    the rasterizer. Entries are keyed by the cache key of the converter and
+    evicted in least recently used order. Evicted entries that are in use
+    are removed when their last user finishes.
+    """
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+    maximum_size = CONVERTER_PDF_FILE_CACHE_MAXIMUM_SIZE
+
+    @classmethod
+    def _entry_release(cls, entry):
+        entry['users'] -= 1
+        if entry['evicted'] and not entry['users']:
+            entry['file_object'].close()
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            while cls._entries:
+                key, entry = cls._entries.popitem(last=False)
+                entry['evicted'] = True
+                if not entry['users']:
+                    entry['file_object'].close()
+
+    @classmethod
+    @contextmanager
+    def get_path(cls, file_object, key):
+        """
+        Return the path of a temporary file with the content of the file
+        object. The content is copied only when there is no entry for the
+        key or when the size of the file object changed.
+        """
+        file_object.seek(0, os.SEEK_END)
+        size = file_object.tell()
+        file_object.seek(0)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry and entry['size'] == size:
+                cls._entries.move_to_end(key=key)
+                entry['users'] += 1
+            else:
+                entry = None
+
+        if not entry:
+            temporary_file_object = NamedTemporaryFile()
+            shutil.copyfileobj(fsrc=file_object, fdst=temporary_file_object)
+            temporary_file_object.flush()
+            file_object.seek(0)
+
+            entry = {
+                'evicted': False, 'file_object': temporary_file_object,
+                'size': size, 'users': 1
+            }
+
+            with cls._lock:
+                entry_previous = cls._entries.pop(key, None)
+                if entry_previous:
+                    entry_previous['evicted'] = True
+                    if not entry_previous['users']:
+                        entry_previous['file_object'].close()
+
+                cls._entries[key] = entry
+
+                while len(cls._entries) > cls.maximum_size:
+                    key_evicted, entry_evicted = cls._entries.popitem(
+                        last=False
+                    )
+                    entry_evicted['evicted'] = True
+                    if not entry_evicted['users']:
+                        entry_evicted['file_object'].close()
+
+        try:
+            yield entry['file_object'].name
+        finally:
+            with cls._lock:
+                cls._entry_release(entry=entry)
+
 
 class Python(ConverterBase):
+    @contextmanager
+    def _get_pdf_path(self):
+        if self.cache_key:
+            with PDFFileCache.get_path(
+                file_object=self.file_object, key=self.cache_key
+            ) as path:
+                yield path
+        else:
+            with NamedTemporaryFile() as temporary_file_object:
+                self.file_object.seek(0)
+                shutil.copyfileobj(
+                    fsrc=self.file_object, fdst=temporary_file_object
+                )
+                temporary_file_object.flush()
+                self.file_object.seek(0)
+                yield temporary_file_object.name
+
+    def _render_pages_pdftoppm(self, path, first_page_number, last_page_number):
+        output_directory = mkdtemp()
+        try:
+            pdftoppm(
+                path, os.path.join(output_directory, 'page'),
+                f=first_page_number + 1, l=last_page_number + 1
+            )
+
+            # The page numbers in the output filenames are padded to the
+            # number of digits of the page count of the document.
+            for filename in sorted(os.listdir(output_directory)):
+                match = regex_pdftoppm_page_number.search(filename)
+                if match:
+                    filepath = os.path.join(output_directory, filename)
+                    image = Image.open(fp=filepath)
+                    image.load()
+                    os.unlink(filepath)
+                    yield int(match.group(1)) - 1, image
+        finally:
+            fs_cleanup(filename=output_directory)
+
+    def _render_pages_poppler(self, path, first_page_number, last_page_number):
+        document = poppler.load_from_file(path)
+        page_renderer = poppler.PageRenderer()
+        dpi = float(pdftoppm_dpi)
+
+        for page_number in range(first_page_number, last_page_number + 1):
+            rendered_image = page_renderer.render_page(
+                document.create_page(page_number), xres=dpi, yres=dpi
+            )
+            yield page_number, Image.frombytes(
+                'RGBA', (rendered_image.width, rendered_image.height),
+                rendered_image.data, 'raw', 'BGRA'
+            )
+
     def convert(self, *args, **kwargs):
         super().convert(*args, **kwargs)
 
         if self.mime_type == 'application/pdf' and pdftoppm:
-            new_file_object = NamedTemporaryFile()
-            input_filepath = new_file_object.name
-            self.file_object.seek(0)
-            shutil.copyfileobj(fsrc=self.file_object, fdst=new_file_object)
-            self.file_object.seek(0)
-            new_file_object.seek(0)
-
-            image_buffer = io.BytesIO()
-            try:
+            with self._get_pdf_path() as input_filepath:
+                image_buffer = io.BytesIO()
                 pdftoppm(
                     input_filepath, f=self.page_number + 1,
                     l=self.page_number + 1, _out=image_buffer
                 )
                 image_buffer.seek(0)
                 return Image.open(fp=image_buffer)
-            finally:
-                new_file_object.close()
+
+    def convert_pages(self, first_page_number, last_page_number):
+        """
+        Render a range of pages of a PDF file with a single call of the
+        rasterizer. Uses the in process poppler binding when installed and
+        falls back to pdftoppm otherwise.
+        """
+        with self._get_pdf_path() as path:
+            if poppler:
+                try:
+                    # Render all pages before yielding to be able to fall
+                    # back to pdftoppm on errors.
+                    images = list(
+                        self._render_pages_poppler(
+                            first_page_number=first_page_number,
+                            last_page_number=last_page_number, path=path
+                        )
+                    )
+                except Exception as exception:
+                    if not pdftoppm:
+                        raise
+
+                    logger.warning(
+                        'Error rendering pages with the poppler binding; '
+                        'falling back to pdftoppm; %s', exception
+                    )
+                else:
+                    yield from images
+                    return
+
+            yield from self._render_pages_pdftoppm(
+                first_page_number=first_page_number,
+                last_page_number=last_page_number, path=path
+            )
+
+    def seek_pages(self, first_page_number, last_page_number):
+        if self.mime_type == 'application/pdf' and (pdftoppm or poppler):
+            for page_number, image in self.convert_pages(
+                first_page_number=first_page_number,
+                last_page_number=last_page_number
+            ):
+                self.image = image
+                yield page_number
+        else:
+            yield from super().seek_pages(
+                first_page_number=first_page_number,
+                last_page_number=last_page_number
+            )
 
     def get_page_count(self):
         super().get_page_count()
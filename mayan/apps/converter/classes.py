@@ -76,7 +76,11 @@ class ConverterBase:
     def get_converter_class():
         return import_string(dotted_path=setting_graphics_backend.value)
 
-    def __init__(self, file_object, mime_type=None):
+    def __init__(self, file_object, cache_key=None, mime_type=None):
+        # Optional identifier of the content of the file object. Allows
+        # backends to reuse the work done for the same file between
+        # instances.
+        self.cache_key = cache_key
         self.file_object = file_object
         self.image = None
         self.mime_type = mime_type or get_mimetype(
@@ -116,17 +120,32 @@ class ConverterBase:
 
         return image_buffer
 
+    def get_pages(
+        self, first_page_number, last_page_number, output_format=None
+    ):
+        """
+        Return the image of each page of a range as a tuple of the page
+        number and the image buffer. Page numbers start with #0.
+        """
+        for page_number in self.seek_pages(
+            first_page_number=first_page_number,
+            last_page_number=last_page_number
+        ):
+            yield page_number, self.get_page(output_format=output_format)
+
     def get_page_count(self):
         try:
             self.soffice_file = self.to_pdf()
         except InvalidOfficeFormat as exception:
             logger.debug('Is not an office format document; %s', exception)
 
-    def seek_page(self, page_number):
+    def seek_page(self, page_number, load=True):
         """
         Seek the specified page number from the source file object.
         If the file is a paged image get the page if not convert it to a
         paged image format and return the specified page as an image.
+        Pass load=False to defer the decoding of paged images until the
+        image is used.
         """
         # Starting with #0.
         self.file_object.seek(0)
@@ -146,7 +165,17 @@ class ConverterBase:
             raise
         else:
             self.image.seek(page_number)
-            self.image.load()
+            if load:
+                self.image.load()
+
+    def seek_pages(self, first_page_number, last_page_number):
+        """
+        Seek each page of a range and yield its page number. Backends can
+        override this method to convert several pages at once.
+        """
+        for page_number in range(first_page_number, last_page_number + 1):
+            self.seek_page(page_number=page_number)
+            yield page_number
 
     def soffice(self):
         """
@@ -267,11 +296,17 @@ class ConverterBase:
         self.image = transformation.execute_on(image=self.image)
 
     def transform_many(self, transformations):
+        # Hide circular import.
+        from .transformations import TransformationPlanner
+
         if not self.image:
-            self.seek_page(page_number=0)
+            # Leave the decoding to the transformations to allow decoding
+            # a reduced size image.
+            self.seek_page(load=False, page_number=0)
 
-        for transformation in transformations:
-            self.image = transformation.execute_on(image=self.image)
+        self.image = TransformationPlanner(
+            transformations=transformations
+        ).execute_on(image=self.image)
 
 
 class Layer:
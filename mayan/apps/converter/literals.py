@@ -62,6 +62,9 @@ else:
     DEFAULT_PDFINFO_PATH = '/usr/bin/pdfinfo'
     DEFAULT_PDFTOPPM_PATH = '/usr/bin/pdftoppm'
 
+CONVERTER_PDF_FILE_CACHE_MAXIMUM_SIZE = 4
+CONVERTER_PDF_PAGE_BATCH_SIZE = 50
+
 DEFAULT_CONVERTER_ASSET_CACHE_MAXIMUM_SIZE = 10 * 2 ** 20  # 10 Megabytes
 DEFAULT_CONVERTER_ASSET_CACHE_TIME = '31556926'
 DEFAULT_CONVERTER_ASSET_CACHE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
@@ -91,7 +94,12 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'pillow_maximum_image_pixels': DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
 }
 
+LAYER_TRANSFORMATION_ARGUMENTS_CACHE_MAXIMUM_SIZE = 1000
+LAYER_TRANSFORMATION_PREFETCH_ATTRIBUTE = '_layer_transformations'
+
 STORAGE_NAME_ASSETS = 'converter__assets'
 STORAGE_NAME_ASSETS_CACHE = 'converter__assets_cache'
 
 TASK_ASSET_IMAGE_GENERATE_RETRY_DELAY = 10
+
+TRANSFORMATION_RESIZE_REDUCING_GAP = 3.0
@@ -0,0 +1,82 @@
+import time
+
+from django.core import management
+
+from ...backends.python import PDFFileCache
+from ...classes import ConverterBase
+from ...literals import CONVERTER_PDF_PAGE_BATCH_SIZE
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Compare the pages per second of rendering the pages of PDF files '
+        'one at a time and in batches.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths', help='PDF files to render.', metavar='PATH', nargs='+'
+        )
+        parser.add_argument(
+            '--batch-size', default=CONVERTER_PDF_PAGE_BATCH_SIZE,
+            dest='batch_size', help='Number of pages rendered per batch.',
+            type=int
+        )
+        parser.add_argument(
+            '--pages', default=0, dest='pages',
+            help='Maximum number of pages to render per file. 0 to render '
+            'all pages.', type=int
+        )
+
+    def handle(self, *args, **options):
+        converter_class = ConverterBase.get_converter_class()
+
+        for path in options['paths']:
+            with open(file=path, mode='rb') as file_object:
+                converter = converter_class(
+                    file_object=file_object, mime_type='application/pdf'
+                )
+                page_count = converter.get_page_count()
+                if options['pages']:
+                    page_count = min(page_count, options['pages'])
+
+                if not page_count:
+                    continue
+
+                start_time = time.time()
+                for page_number in range(page_count):
+                    converter = converter_class(
+                        file_object=file_object, mime_type='application/pdf'
+                    )
+                    converter.seek_page(page_number=page_number)
+                    converter.get_page()
+                elapsed_single = time.time() - start_time
+
+                PDFFileCache.clear()
+
+                start_time = time.time()
+                converter = converter_class(
+                    cache_key=path, file_object=file_object,
+                    mime_type='application/pdf'
+                )
+                for first_page_number in range(0, page_count, options['batch_size']):
+                    last_page_number = min(
+                        first_page_number + options['batch_size'], page_count
+                    ) - 1
+                    for page_number, image_buffer in converter.get_pages(
+                        first_page_number=first_page_number,
+                        last_page_number=last_page_number
+                    ):
+                        # Discard the image.
+                        pass
+                elapsed_batch = time.time() - start_time
+
+                PDFFileCache.clear()
+
+            self.stdout.write(
+                '{}: {} pages, {:.2f} pages per second one page at a time, '
+                '{:.2f} pages per second in batches.'.format(
+                    path, page_count, page_count / elapsed_single,
+                    page_count / elapsed_batch
+                )
+            )
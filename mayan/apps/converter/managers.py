@@ -1,137 +1,280 @@
+from collections import OrderedDict
 import logging
+import threading
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import PermissionDenied
 from django.db import models
 
 from mayan.apps.acls.models import AccessControlList
 from mayan.apps.common.serialization import yaml_load
 
 from .classes import Layer
+from .literals import (
+    LAYER_TRANSFORMATION_ARGUMENTS_CACHE_MAXIMUM_SIZE,
+    LAYER_TRANSFORMATION_PREFETCH_ATTRIBUTE
+)
 from .transformations import BaseTransformation
 
 logger = logging.getLogger(name=__name__)
 
 
 class LayerTransformationManager(models.Manager):
-    def get_for_object(
-        self, obj, as_classes=False, maximum_layer_order=None,
-        only_stored_layer=None, user=None
-    ):
+    """
+    The parsed arguments of the transformations are kept in a least
+    recently used cache keyed by the transformation ID and the arguments
+    text. Editing the arguments produces a new key.
+    """
+    _arguments_cache = OrderedDict()
+    _arguments_cache_maximum_size = LAYER_TRANSFORMATION_ARGUMENTS_CACHE_MAXIMUM_SIZE
+    _arguments_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_arguments(cls, transformation):
+        key = (transformation.pk, transformation.arguments)
+
+        with cls._arguments_cache_lock:
+            try:
+                cls._arguments_cache.move_to_end(key=key)
+            except KeyError:
+                # Not parsed yet.
+                pass
+            else:
+                return cls._arguments_cache[key]
+
+        # Some transformations don't require arguments, return an empty
+        # dictionary as ** doesn't allow None.
+        if transformation.arguments:
+            arguments = yaml_load(stream=transformation.arguments)
+        else:
+            arguments = {}
+
+        with cls._arguments_cache_lock:
+            cls._arguments_cache[key] = arguments
+
+            while len(cls._arguments_cache) > cls._arguments_cache_maximum_size:
+                cls._arguments_cache.popitem(last=False)
+
+        return arguments
+
+    @staticmethod
+    def _get_prefetch_key(maximum_layer_order, only_stored_layer, user):
+        return (
+            maximum_layer_order, getattr(only_stored_layer, 'pk', None),
+            getattr(user, 'pk', None)
+        )
+
+    def _get_stored_layer_ids(self, objects, maximum_layer_order, user):
         """
-        as_classes == True returns the transformation classes from .classes
-        ready to be feed to the converter class
+        Return a dictionary with the set of stored layer IDs whose
+        transformations are visible for each object. The access permissions
+        of the layers are checked once for all the objects.
         """
-        Layer.update()
-
         StoredLayer = apps.get_model(
             app_label='converter', model_name='StoredLayer'
         )
-        content_type = ContentType.objects.get_for_model(model=obj)
 
-        transformations = self.filter(
-            enabled=True, object_layer__content_type=content_type,
-            object_layer__object_id=obj.pk, object_layer__enabled=True
+        access_layers = {}
+        for stored_layer in StoredLayer.objects.all():
+            # Layers above the maximum order are always excluded.
+            if maximum_layer_order is None or stored_layer.order <= maximum_layer_order:
+                try:
+                    layer_class = stored_layer.get_layer()
+                except KeyError:
+                    # This was a class defined but later erased. Ignore it.
+                    access_layers[stored_layer.pk] = None
+                else:
+                    access_layers[stored_layer.pk] = layer_class.permissions.get(
+                        'access_permission', None
+                    )
+
+        permissions = set(
+            permission for permission in access_layers.values() if permission
         )
 
-        if maximum_layer_order is not None:
-            access_layers = StoredLayer.objects.filter(
-                order__lte=maximum_layer_order
-            )
-            exclude_layers = StoredLayer.objects.filter(
-                order__gt=maximum_layer_order
-            )
+        if permissions:
+            permitted_objects = {
+                permission: set(permission_objects) for permission, permission_objects in AccessControlList.objects.get_permitted_objects(
+                    objects=objects, permissions=permissions, user=user
+                ).items()
+            }
         else:
-            access_layers = StoredLayer.objects.all()
-            exclude_layers = StoredLayer.objects.none()
+            permitted_objects = {}
+
+        result = {}
+        for obj in objects:
+            result[obj] = set(
+                stored_layer_id for stored_layer_id, permission in access_layers.items()
+                if not permission or obj in permitted_objects[permission]
+            )
+
+        return result
 
-        for stored_layer in access_layers:
+    def _get_transformation_classes(self, obj, transformations):
+        result = []
+        for transformation in transformations:
             try:
-                layer_class = stored_layer.get_layer()
+                transformation_class = BaseTransformation.get(
+                    transformation.name
+                )
             except KeyError:
-                """
-                This was a class defined but later erased. Ignore it.
-                """
-            else:
-                access_permission = layer_class.permissions.get(
-                    'access_permission', None
+                # Non existant transformation, but we don't raise an error
+                logger.error(
+                    'Non existant transformation: %s for %s',
+                    transformation.name, obj
                 )
-                if access_permission:
-                    try:
-                        AccessControlList.objects.check_access(
-                            obj=obj, permissions=(access_permission,), user=user
+            else:
+                try:
+                    result.append(
+                        transformation_class(
+                            **self._get_arguments(
+                                transformation=transformation
+                            )
                         )
-                    except PermissionDenied:
-                        access_layers = access_layers.exclude(pk=stored_layer.pk)
+                    )
+                except Exception as exception:
+                    logger.error(
+                        'Error while parsing transformation "%s", '
+                        'arguments "%s", for object "%s"; %s',
+                        transformation, transformation.arguments, obj,
+                        exception, exc_info=True
+                    )
+
+        return result
 
-        for stored_layer in exclude_layers:
-            exclude_permission = stored_layer.get_layer().permissions.get(
-                'exclude_permission', None
+    def get_for_object(
+        self, obj, as_classes=False, maximum_layer_order=None,
+        only_stored_layer=None, user=None
+    ):
+        """
+        as_classes == True returns the transformation classes from .classes
+        ready to be feed to the converter class
+        """
+        if as_classes:
+            prefetched = obj.__dict__.get(
+                LAYER_TRANSFORMATION_PREFETCH_ATTRIBUTE, {}
+            ).get(
+                self._get_prefetch_key(
+                    maximum_layer_order=maximum_layer_order,
+                    only_stored_layer=only_stored_layer, user=user
+                )
             )
-            if exclude_permission:
-                try:
-                    AccessControlList.objects.check_access(
-                        obj=obj, permissions=(exclude_permission,), user=user
-                    )
-                except PermissionDenied:
-                    pass
-                else:
-                    exclude_layers = exclude_layers.exclude(pk=stored_layer.pk)
 
-        if only_stored_layer:
-            transformations = transformations.filter(
-                object_layer__stored_layer=only_stored_layer
+            if prefetched is not None:
+                return list(prefetched)
+
+            return self.get_for_objects(
+                as_classes=True, maximum_layer_order=maximum_layer_order,
+                objects=(obj,), only_stored_layer=only_stored_layer,
+                user=user
+            )[obj]
+        else:
+            Layer.update()
+
+            stored_layer_ids = self._get_stored_layer_ids(
+                maximum_layer_order=maximum_layer_order, objects=(obj,),
+                user=user
+            )[obj]
+
+            transformations = self.filter(
+                enabled=True,
+                object_layer__content_type=ContentType.objects.get_for_model(
+                    model=obj
+                ), object_layer__enabled=True,
+                object_layer__object_id=obj.pk,
+                object_layer__stored_layer__in=stored_layer_ids
             )
 
-        transformations = transformations.filter(
-            object_layer__stored_layer__in=access_layers
-        )
+            if only_stored_layer:
+                transformations = transformations.filter(
+                    object_layer__stored_layer=only_stored_layer
+                )
 
-        transformations = transformations.exclude(
-            object_layer__stored_layer__in=exclude_layers
+            return transformations
+
+    def get_for_objects(
+        self, objects, as_classes=False, maximum_layer_order=None,
+        only_stored_layer=None, user=None
+    ):
+        """
+        Bulk version of `get_for_object`. Return a dictionary with the list
+        of transformations of each object. The layer permissions are
+        evaluated once for all the objects and the transformations are
+        fetched with one query per model.
+        """
+        Layer.update()
+
+        objects = list(objects)
+        result = {obj: [] for obj in objects}
+
+        if not objects:
+            return result
+
+        stored_layer_ids = self._get_stored_layer_ids(
+            maximum_layer_order=maximum_layer_order, objects=objects,
+            user=user
         )
 
-        if as_classes:
-            result = []
+        objects_by_content_type = {}
+        for obj in objects:
+            objects_by_content_type.setdefault(
+                ContentType.objects.get_for_model(model=obj), {}
+            )[obj.pk] = obj
+
+        for content_type, content_type_objects in objects_by_content_type.items():
+            transformations = self.filter(
+                enabled=True, object_layer__content_type=content_type,
+                object_layer__enabled=True,
+                object_layer__object_id__in=content_type_objects.keys()
+            ).select_related('object_layer')
+
+            if only_stored_layer:
+                transformations = transformations.filter(
+                    object_layer__stored_layer=only_stored_layer
+                )
+
             for transformation in transformations:
-                try:
-                    transformation_class = BaseTransformation.get(
-                        transformation.name
-                    )
-                except KeyError:
-                    # Non existant transformation, but we don't raise an error
-                    logger.error(
-                        'Non existant transformation: %s for %s',
-                        transformation.name, obj
-                    )
-                else:
-                    try:
-                        # Some transformations don't require arguments
-                        # return an empty dictionary as ** doesn't allow None
-                        if transformation.arguments:
-                            kwargs = yaml_load(
-                                stream=transformation.arguments,
-                            )
-                        else:
-                            kwargs = {}
+                obj = content_type_objects[
+                    transformation.object_layer.object_id
+                ]
+                if transformation.object_layer.stored_layer_id in stored_layer_ids[obj]:
+                    result[obj].append(transformation)
 
-                        result.append(
-                            transformation_class(
-                                **kwargs
-                            )
-                        )
-                    except Exception as exception:
-                        logger.error(
-                            'Error while parsing transformation "%s", '
-                            'arguments "%s", for object "%s"; %s',
-                            transformation, transformation.arguments, obj,
-                            exception, exc_info=True
-                        )
+        if as_classes:
+            for obj, transformations in result.items():
+                result[obj] = self._get_transformation_classes(
+                    obj=obj, transformations=transformations
+                )
 
-            return result
-        else:
-            return transformations
+        return result
+
+    def prefetch_for_objects(
+        self, objects, maximum_layer_order=None, only_stored_layer=None,
+        user=None
+    ):
+        """
+        Resolve the transformation classes of several objects at once and
+        store them in each object. Later calls to `get_for_object` with
+        the same arguments for these objects don't cause more queries.
+        """
+        prefetch_key = self._get_prefetch_key(
+            maximum_layer_order=maximum_layer_order,
+            only_stored_layer=only_stored_layer, user=user
+        )
+
+        objects = list(objects)
+
+        result = self.get_for_objects(
+            as_classes=True, maximum_layer_order=maximum_layer_order,
+            objects=objects, only_stored_layer=only_stored_layer, user=user
+        )
+
+        # Equal objects can be different instances, store the result in
+        # every instance.
+        for obj in objects:
+            obj.__dict__.setdefault(
+                LAYER_TRANSFORMATION_PREFETCH_ATTRIBUTE, {}
+            )[prefetch_key] = result[obj]
 
 
 class ObjectLayerManager(models.Manager):
@@ -86,7 +86,9 @@ class Asset(ExtraDataModelMixin, models.Model):
     def generate_image(self):
         cache_filename = '{}'.format(self.get_hash())
 
-        if self.cache_partition.get_file(filename=cache_filename):
+        if self.cache_partition.get_file(
+            filename=cache_filename, use_index=False
+        ):
             logger.debug(
                 'asset cache file "%s" found', cache_filename
             )
@@ -0,0 +1,90 @@
+import io
+import os
+
+from django.test import TestCase
+
+from mayan.apps.documents.tests.literals import (
+    TEST_DOCUMENT_PATH, TEST_MULTI_PAGE_TIFF_PATH
+)
+
+from ..backends.python import PDFFileCache, Python
+
+TEST_PDF_FILE_CACHE_KEY = 'test_pdf_file_cache_key'
+
+
+class PDFFileCacheTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        PDFFileCache.clear()
+
+    def tearDown(self):
+        PDFFileCache.clear()
+        super().tearDown()
+
+    def test_content_copied_once(self):
+        file_object = io.BytesIO(b'test content')
+
+        with PDFFileCache.get_path(file_object=file_object, key=TEST_PDF_FILE_CACHE_KEY) as path_1:
+            with open(file=path_1, mode='rb') as file_object_cache:
+                self.assertEqual(file_object_cache.read(), b'test content')
+
+        with PDFFileCache.get_path(file_object=file_object, key=TEST_PDF_FILE_CACHE_KEY) as path_2:
+            self.assertEqual(path_1, path_2)
+
+    def test_content_size_change(self):
+        with PDFFileCache.get_path(file_object=io.BytesIO(b'test'), key=TEST_PDF_FILE_CACHE_KEY) as path_1:
+            # Populate the cache.
+            pass
+
+        with PDFFileCache.get_path(file_object=io.BytesIO(b'test content'), key=TEST_PDF_FILE_CACHE_KEY) as path_2:
+            with open(file=path_2, mode='rb') as file_object_cache:
+                self.assertEqual(file_object_cache.read(), b'test content')
+
+        self.assertFalse(os.path.exists(path_1))
+
+    def test_eviction(self):
+        paths = []
+        for index in range(PDFFileCache.maximum_size + 1):
+            with PDFFileCache.get_path(file_object=io.BytesIO(b'test'), key=index) as path:
+                paths.append(path)
+
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertTrue(os.path.exists(paths[-1]))
+
+    def test_eviction_in_use(self):
+        with PDFFileCache.get_path(file_object=io.BytesIO(b'test'), key=TEST_PDF_FILE_CACHE_KEY) as path:
+            PDFFileCache.clear()
+            self.assertTrue(os.path.exists(path))
+
+        self.assertFalse(os.path.exists(path))
+
+
+class PythonBackendTestCase(TestCase):
+    def tearDown(self):
+        PDFFileCache.clear()
+        super().tearDown()
+
+    def test_get_pages_pdf(self):
+        with open(file=TEST_DOCUMENT_PATH, mode='rb') as file_object:
+            converter = Python(
+                cache_key=TEST_PDF_FILE_CACHE_KEY, file_object=file_object
+            )
+            pages = list(
+                converter.get_pages(first_page_number=0, last_page_number=1)
+            )
+
+            converter = Python(file_object=file_object)
+            converter.seek_page(page_number=1)
+            page_image = converter.get_page()
+
+        self.assertEqual([page[0] for page in pages], [0, 1])
+        self.assertEqual(pages[1][1].getvalue(), page_image.getvalue())
+
+    def test_get_pages_tiff(self):
+        with open(file=TEST_MULTI_PAGE_TIFF_PATH, mode='rb') as file_object:
+            converter = Python(file_object=file_object)
+            pages = list(
+                converter.get_pages(first_page_number=0, last_page_number=1)
+            )
+
+        self.assertEqual([page[0] for page in pages], [0, 1])
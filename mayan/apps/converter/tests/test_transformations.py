@@ -1,11 +1,19 @@
+import io
+
+from PIL import Image, ImageDraw
+
 from django.test import TestCase
 
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 
+from ..models import LayerTransformation
+
 from ..transformations import (
-    BaseTransformation, TransformationCrop, TransformationLineArt,
-    TransformationResize, TransformationRotate, TransformationRotate90,
-    TransformationRotate180, TransformationRotate270, TransformationZoom
+    BaseTransformation, TransformationCrop, TransformationFlip,
+    TransformationGaussianBlur, TransformationLineArt, TransformationMirror,
+    TransformationPlanner, TransformationResize, TransformationRotate,
+    TransformationRotate90, TransformationRotate180,
+    TransformationRotate270, TransformationZoom
 )
 
 from .literals import (
@@ -14,6 +22,7 @@ from .literals import (
     TEST_TRANSFORMATION_RESIZE_CACHE_HASH_2,
     TEST_TRANSFORMATION_RESIZE_HEIGHT, TEST_TRANSFORMATION_RESIZE_HEIGHT_2,
     TEST_TRANSFORMATION_RESIZE_WIDTH, TEST_TRANSFORMATION_RESIZE_WIDTH_2,
+    TEST_TRANSFORMATION_ROTATE_ARGUMENT,
     TEST_TRANSFORMATION_ROTATE_CACHE_HASH,
     TEST_TRANSFORMATION_ROTATE_DEGRESS, TEST_TRANSFORMATION_ZOOM_CACHE_HASH,
     TEST_TRANSFORMATION_ZOOM_PERCENT
@@ -108,6 +117,140 @@ class TransformationBaseTestCase(TestCase):
         )
 
 
+class TransformationPlannerTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_image = Image.new(mode='RGB', size=(400, 300))
+        draw = ImageDraw.Draw(self.test_image)
+        draw.rectangle((10, 20, 150, 100), fill='red')
+        draw.rectangle((200, 150, 390, 290), fill='blue')
+
+    def _execute_test_transformations(self, transformations):
+        image_sequential = self.test_image.copy()
+        for transformation in transformations:
+            image_sequential = transformation.execute_on(
+                image=image_sequential
+            )
+
+        image_planned = TransformationPlanner(
+            transformations=transformations
+        ).execute_on(image=self.test_image.copy())
+
+        return image_sequential, image_planned
+
+    def test_lossless_transformations(self):
+        image_sequential, image_planned = self._execute_test_transformations(
+            transformations=(
+                TransformationCrop(left=5, top=10, right=20, bottom=3),
+                TransformationRotate90(), TransformationMirror(),
+                TransformationCrop(left=7, top=1, right=2, bottom=30),
+                TransformationRotate(degrees=180), TransformationFlip(),
+                TransformationRotate270()
+            )
+        )
+
+        self.assertEqual(image_sequential.size, image_planned.size)
+        self.assertEqual(image_sequential.tobytes(), image_planned.tobytes())
+
+    def test_resize_transformations(self):
+        image_sequential, image_planned = self._execute_test_transformations(
+            transformations=(
+                TransformationRotate90(),
+                TransformationResize(width=200, height=''),
+                TransformationZoom(percent=50),
+                TransformationCrop(left=5, top=10, right=20, bottom=3)
+            )
+        )
+
+        self.assertEqual(image_sequential.size, image_planned.size)
+
+    def test_non_geometric_transformations(self):
+        image_sequential, image_planned = self._execute_test_transformations(
+            transformations=(
+                TransformationRotate90(),
+                TransformationGaussianBlur(radius=2),
+                TransformationRotate(degrees=30),
+                TransformationResize(width=100, height='')
+            )
+        )
+
+        self.assertEqual(image_sequential.size, image_planned.size)
+
+    def test_draft_decoding(self):
+        file_object = io.BytesIO()
+        Image.new(mode='RGB', size=(4000, 3000)).save(
+            file_object, format='JPEG'
+        )
+        file_object.seek(0)
+
+        image = Image.open(fp=file_object)
+        image = TransformationPlanner(
+            transformations=(TransformationResize(width=400, height=''),)
+        ).execute_on(image=image)
+
+        self.assertEqual(image.size, (400, 300))
+
+
+class LayerTransformationManagerTestCase(
+    LayerTestMixin, GenericDocumentTestCase
+):
+    auto_create_test_transformation_class = False
+
+    def setUp(self):
+        super().setUp()
+        BaseTransformation.register(
+            layer=self.test_layer, transformation=TransformationRotate
+        )
+
+        self.test_document_file_page = self.test_document_file.pages.first()
+
+        self.test_transformation = self.test_layer.add_transformation_to(
+            arguments=TEST_TRANSFORMATION_ROTATE_ARGUMENT,
+            obj=self.test_document_file_page,
+            transformation_class=TransformationRotate
+        )
+
+    def test_get_for_objects(self):
+        result = LayerTransformation.objects.get_for_objects(
+            as_classes=True, objects=(
+                self.test_document_file_page,
+                self.test_document_version_page
+            )
+        )
+
+        self.assertEqual(len(result[self.test_document_file_page]), 1)
+        self.assertEqual(
+            result[self.test_document_file_page][0].degrees, 180
+        )
+        self.assertEqual(result[self.test_document_version_page], [])
+
+    def test_get_for_object_arguments_edit(self):
+        LayerTransformation.objects.get_for_object(
+            as_classes=True, obj=self.test_document_file_page
+        )
+
+        self.test_transformation.arguments = 'degrees: 90'
+        self.test_transformation.save()
+
+        transformations = LayerTransformation.objects.get_for_object(
+            as_classes=True, obj=self.test_document_file_page
+        )
+
+        self.assertEqual(transformations[0].degrees, 90)
+
+    def test_prefetch_for_objects(self):
+        LayerTransformation.objects.prefetch_for_objects(
+            objects=(self.test_document_file_page,)
+        )
+
+        with self.assertNumQueries(0):
+            transformations = LayerTransformation.objects.get_for_object(
+                as_classes=True, obj=self.test_document_file_page
+            )
+
+        self.assertEqual(len(transformations), 1)
+
+
 class TransformationTestCase(LayerTestMixin, GenericDocumentTestCase):
     auto_create_test_transformation_class = False
 
@@ -1,5 +1,6 @@
 import hashlib
 import logging
+import math
 
 from PIL import Image, ImageColor, ImageDraw, ImageFilter
 
@@ -9,6 +10,7 @@ from django.utils.text import format_lazy
 from django.utils.translation import ugettext_lazy as _
 
 from .layers import layer_decorations, layer_saved_transformations
+from .literals import TRANSFORMATION_RESIZE_REDUCING_GAP
 
 logger = logging.getLogger(name=__name__)
 
@@ -125,6 +127,166 @@ class BaseTransformation(metaclass=BaseTransformationType):
         self.image = image
         self.aspect = 1.0 * image.size[0] / image.size[1]
 
+    def fuse(self, geometry):
+        """
+        Add the effect of the transformation to a TransformationGeometry
+        instead of executing it. Returns False if the transformation can't
+        be expressed as a geometry change.
+        """
+        return False
+
+
+class TransformationGeometry:
+    """
+    Accumulate consecutive geometric transformations. The result is
+    executed as a single crop and resample of the source image followed by
+    a lossless transpose. Sizes and coordinates received and returned are
+    those of the transformed image.
+    """
+    # Transpose methods indexed by the (swap, flip_x, flip_y) orientation.
+    transpose_methods = {
+        (False, False, False): None,
+        (False, False, True): Image.FLIP_TOP_BOTTOM,
+        (False, True, False): Image.FLIP_LEFT_RIGHT,
+        (False, True, True): Image.ROTATE_180,
+        (True, False, False): Image.TRANSPOSE,
+        (True, False, True): Image.ROTATE_90,
+        (True, True, False): Image.ROTATE_270,
+        (True, True, True): Image.TRANSVERSE,
+    }
+
+    def __init__(self, size):
+        self.box = (0, 0, size[0], size[1])
+        self.flip_x = False
+        self.flip_y = False
+        self.size = tuple(size)
+        self.source_size = tuple(size)
+        self.swap = False
+
+    def crop(self, box):
+        width, height = self.get_size()
+        left, top, right, bottom = box
+
+        # Convert the box to the coordinates of the image before the
+        # transpose.
+        if self.flip_x:
+            left, right = width - right, width - left
+
+        if self.flip_y:
+            top, bottom = height - bottom, height - top
+
+        if self.swap:
+            left, top, right, bottom = top, left, bottom, right
+
+        scale_x = (self.box[2] - self.box[0]) / self.size[0]
+        scale_y = (self.box[3] - self.box[1]) / self.size[1]
+
+        self.box = (
+            self.box[0] + left * scale_x, self.box[1] + top * scale_y,
+            self.box[0] + right * scale_x, self.box[1] + bottom * scale_y
+        )
+        self.size = (max(right - left, 1), max(bottom - top, 1))
+
+    def execute_on(self, image, draft=False):
+        box_width = self.box[2] - self.box[0]
+        box_height = self.box[3] - self.box[1]
+
+        if self.size != (box_width, box_height):
+            if draft and self.size[0] < box_width and self.size[1] < box_height:
+                # Let the decoder reduce the image when the file format
+                # allows it. The draft size is never smaller than the
+                # requested size.
+                image.draft(
+                    image.mode, (
+                        math.ceil(self.source_size[0] * self.size[0] / box_width),
+                        math.ceil(self.source_size[1] * self.size[1] / box_height)
+                    )
+                )
+                ratio_x = image.size[0] / self.source_size[0]
+                ratio_y = image.size[1] / self.source_size[1]
+                self.box = (
+                    self.box[0] * ratio_x, self.box[1] * ratio_y,
+                    self.box[2] * ratio_x, self.box[3] * ratio_y
+                )
+
+            image = image.resize(
+                self.size, Image.ANTIALIAS, box=self.box,
+                reducing_gap=TRANSFORMATION_RESIZE_REDUCING_GAP
+            )
+        elif self.box != (0, 0) + self.source_size:
+            image = image.crop(
+                tuple(int(round(value)) for value in self.box)
+            )
+
+        transpose_method = self.transpose_methods[
+            (self.swap, self.flip_x, self.flip_y)
+        ]
+        if transpose_method is not None:
+            image = image.transpose(transpose_method)
+
+        return image
+
+    def get_aspect(self):
+        width, height = self.get_size()
+        return 1.0 * width / height
+
+    def get_size(self):
+        if self.swap:
+            return (self.size[1], self.size[0])
+        else:
+            return self.size
+
+    def rotate(self, quarter_turns):
+        """
+        Rotate clockwise by a number of quarter turns.
+        """
+        for index in range(quarter_turns % 4):
+            self.swap, self.flip_x, self.flip_y = (
+                not self.swap, not self.flip_y, self.flip_x
+            )
+
+    def set_size(self, size):
+        if self.swap:
+            self.size = (size[1], size[0])
+        else:
+            self.size = tuple(size)
+
+    def transpose(self, method):
+        if method == Image.FLIP_LEFT_RIGHT:
+            self.flip_x = not self.flip_x
+        elif method == Image.FLIP_TOP_BOTTOM:
+            self.flip_y = not self.flip_y
+
+
+class TransformationPlanner:
+    """
+    Execute a list of transformations collapsing each run of consecutive
+    geometric transformations into a single TransformationGeometry step.
+    The first step is allowed to decode a reduced size version of the
+    image when the image was not yet loaded.
+    """
+    def __init__(self, transformations):
+        self.transformations = transformations
+
+    def execute_on(self, image):
+        draft = True
+        geometry = None
+
+        for transformation in self.transformations:
+            if geometry is None:
+                geometry = TransformationGeometry(size=image.size)
+
+            if not transformation.fuse(geometry=geometry):
+                image = geometry.execute_on(draft=draft, image=image)
+                image = transformation.execute_on(image=image)
+                draft = False
+                geometry = None
+
+        if geometry is not None:
+            image = geometry.execute_on(draft=draft, image=image)
+
+        return image
+
 
 class AssertTransformationMixin:
     @classmethod
@@ -350,9 +512,7 @@ class TransformationCrop(BaseTransformation):
     label = _('Crop')
     name = 'crop'
 
-    def execute_on(self, *args, **kwargs):
-        super().execute_on(*args, **kwargs)
-
+    def _get_box(self, size):
         try:
             left = int(self.left or '0')
         except ValueError:
@@ -376,26 +536,26 @@ class TransformationCrop(BaseTransformation):
         if left < 0:
             left = 0
 
-        if left > self.image.size[0] - 1:
-            left = self.image.size[0] - 1
+        if left > size[0] - 1:
+            left = size[0] - 1
 
         if top < 0:
             top = 0
 
-        if top > self.image.size[1] - 1:
-            top = self.image.size[1] - 1
+        if top > size[1] - 1:
+            top = size[1] - 1
 
         if right < 0:
             right = 0
 
-        if right > self.image.size[0] - 1:
-            right = self.image.size[0] - 1
+        if right > size[0] - 1:
+            right = size[0] - 1
 
         if bottom < 0:
             bottom = 0
 
-        if bottom > self.image.size[1] - 1:
-            bottom = self.image.size[1] - 1
+        if bottom > size[1] - 1:
+            bottom = size[1] - 1
 
         # Invert right value
         # Pillow uses left, top, right, bottom to define a viewport
@@ -403,8 +563,8 @@ class TransformationCrop(BaseTransformation):
         # We invert the right and bottom to define a viewport
         # that can crop from the right and bottom borders without
         # having to know the real dimensions of an image
-        right = self.image.size[0] - right
-        bottom = self.image.size[1] - bottom
+        right = size[0] - right
+        bottom = size[1] - bottom
 
         if left > right:
             left = right - 1
@@ -417,7 +577,16 @@ class TransformationCrop(BaseTransformation):
             bottom
         )
 
-        return self.image.crop((left, top, right, bottom))
+        return (left, top, right, bottom)
+
+    def execute_on(self, *args, **kwargs):
+        super().execute_on(*args, **kwargs)
+
+        return self.image.crop(self._get_box(size=self.image.size))
+
+    def fuse(self, geometry):
+        geometry.crop(box=self._get_box(size=geometry.get_size()))
+        return True
 
 
 class TransformationDrawRectangle(BaseTransformation):
@@ -632,6 +801,10 @@ class TransformationFlip(BaseTransformation):
 
         return self.image.transpose(Image.FLIP_TOP_BOTTOM)
 
+    def fuse(self, geometry):
+        geometry.transpose(method=Image.FLIP_TOP_BOTTOM)
+        return True
+
 
 class TransformationGaussianBlur(BaseTransformation):
     arguments = ('radius',)
@@ -664,6 +837,10 @@ class TransformationMirror(BaseTransformation):
 
         return self.image.transpose(Image.FLIP_LEFT_RIGHT)
 
+    def fuse(self, geometry):
+        geometry.transpose(method=Image.FLIP_LEFT_RIGHT)
+        return True
+
 
 class TransformationResize(BaseTransformation):
     arguments = ('width', 'height')
@@ -691,6 +868,35 @@ class TransformationResize(BaseTransformation):
 
         return self.image
 
+    def fuse(self, geometry):
+        width = int(self.width)
+        height = int(self.height or 1.0 * width / geometry.get_aspect())
+
+        # Same size calculation as Image.thumbnail.
+        image_width, image_height = geometry.get_size()
+        if width >= image_width and height >= image_height:
+            return True
+
+        def round_aspect(number, key):
+            return max(
+                min(math.floor(number), math.ceil(number), key=key), 1
+            )
+
+        aspect = image_width / image_height
+        if width / height >= aspect:
+            width = round_aspect(
+                number=height * aspect,
+                key=lambda n: abs(aspect - n / height)
+            )
+        else:
+            height = round_aspect(
+                number=width / aspect,
+                key=lambda n: 0 if n == 0 else abs(aspect - width / n)
+            )
+
+        geometry.set_size(size=(width, height))
+        return True
+
 
 class TransformationRotate(BaseTransformation):
     arguments = ('degrees', 'fillcolor')
@@ -716,6 +922,15 @@ class TransformationRotate(BaseTransformation):
             fillcolor=fillcolor
         )
 
+    def fuse(self, geometry):
+        # Only right angle rotations are transposes.
+        degrees = self.degrees % 360
+        if degrees % 90:
+            return False
+
+        geometry.rotate(quarter_turns=degrees // 90)
+        return True
+
 
 class TransformationRotate90(TransformationRotate):
     arguments = ()
@@ -785,6 +1000,17 @@ class TransformationZoom(BaseTransformation):
             ), Image.ANTIALIAS
         )
 
+    def fuse(self, geometry):
+        if self.percent == 100:
+            return True
+
+        decimal_value = float(self.percent) / 100
+        width, height = geometry.get_size()
+        geometry.set_size(
+            size=(int(width * decimal_value), int(height * decimal_value))
+        )
+        return True
+
 
 BaseTransformation.register(
     layer=layer_decorations, transformation=TransformationAssetPaste
@@ -0,0 +1,296 @@
+import logging
+import time
+
+from django.apps import apps
+from django.db import transaction
+
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.templating.classes import Template
+
+from .literals import (
+    INDEX_REBUILD_BULK_CREATE_BATCH_SIZE, INDEX_REBUILD_DOCUMENT_CHUNK_SIZE
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class IndexTemplateEvaluator:
+    """
+    Evaluate the template nodes of an index for documents. The result is
+    a dictionary of nodes keyed by the (parent key, template node ID,
+    value) tuple, where the parent key is the key of the parent node or
+    None for the nodes under the root node.
+    """
+    def __init__(self, index_template):
+        self.index_template = index_template
+        self.template_children = {}
+
+        template_nodes = self.index_template.node_templates.order_by(
+            'tree_id', 'lft'
+        )
+        for template_node in template_nodes:
+            if template_node.is_root_node():
+                self.template_root = template_node
+
+            self.template_children.setdefault(
+                template_node.parent_id, []
+            ).append(template_node)
+
+    def _evaluate_document(self, document, nodes, template_node, parent_key):
+        for child in self.template_children.get(template_node.pk, ()):
+            if not child.enabled:
+                continue
+
+            try:
+                result = Template(template_string=child.expression).render(
+                    context={'document': document}
+                )
+            except Exception as exception:
+                logger.debug(
+                    'Error indexing document: %s; expression: %s; %s',
+                    document, child.expression, exception
+                )
+            else:
+                if result:
+                    key = (parent_key, child.pk, result)
+                    node = nodes.setdefault(
+                        key, {'documents': set(), 'template_node': child}
+                    )
+
+                    if child.link_documents:
+                        node['documents'].add(document.pk)
+
+                    self._evaluate_document(
+                        document=document, nodes=nodes, parent_key=key,
+                        template_node=child
+                    )
+
+    def evaluate_document(self, document, nodes=None):
+        if nodes is None:
+            nodes = {}
+
+        self._evaluate_document(
+            document=document, nodes=nodes, parent_key=None,
+            template_node=self.template_root
+        )
+
+        return nodes
+
+
+class IndexTemplateBulkRebuilder(IndexTemplateEvaluator):
+    """
+    Rebuild the instance nodes of an index template using set based
+    operations. The template expressions are evaluated for chunks of
+    documents and the resulting node tree is built in memory. The nodes
+    are then inserted one level at a time using bulk inserts and the tree
+    fields are calculated once at the end.
+    """
+    def __init__(
+        self, index_template, chunk_size=INDEX_REBUILD_DOCUMENT_CHUNK_SIZE,
+        progress_callback=None
+    ):
+        super().__init__(index_template=index_template)
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.statistics = {}
+
+    def _report_progress(self, document_count, document_total, start_time):
+        elapsed = time.time() - start_time
+        throughput = document_count / elapsed if elapsed else 0
+
+        logger.info(
+            'Index "%s" rebuild: %d of %d documents evaluated, %.1f '
+            'documents per second.', self.index_template, document_count,
+            document_total, throughput
+        )
+
+        if self.progress_callback:
+            self.progress_callback(
+                document_count=document_count,
+                document_total=document_total, elapsed=elapsed,
+                throughput=throughput
+            )
+
+    def evaluate(self):
+        """
+        Evaluate the template expressions of the index for all the valid
+        documents of the index's document types. Returns a dictionary of
+        nodes keyed by the (parent key, template node ID, value) tuple.
+        """
+        Document = apps.get_model(app_label='documents', model_name='Document')
+
+        queryset = Document.valid.filter(
+            document_type__in=self.index_template.document_types.all()
+        ).order_by('pk')
+
+        document_count = 0
+        document_total = queryset.count()
+        last_pk = 0
+        nodes = {}
+        start_time = time.time()
+
+        while True:
+            documents = list(queryset.filter(pk__gt=last_pk)[:self.chunk_size])
+            if not documents:
+                break
+
+            for document in documents:
+                self.evaluate_document(document=document, nodes=nodes)
+
+            document_count += len(documents)
+            last_pk = documents[-1].pk
+
+            self._report_progress(
+                document_count=document_count,
+                document_total=document_total, start_time=start_time
+            )
+
+        self.statistics.update(
+            {
+                'document_count': document_count,
+                'elapsed_evaluation': time.time() - start_time,
+                'node_count': len(nodes)
+            }
+        )
+
+        return nodes
+
+    def rebuild(self):
+        nodes = self.evaluate()
+        self.write(nodes=nodes)
+
+        logger.info(
+            'Index "%s" rebuilt: %d documents, %d nodes, evaluation '
+            '%.2f seconds, write %.2f seconds.', self.index_template,
+            self.statistics['document_count'], self.statistics['node_count'],
+            self.statistics['elapsed_evaluation'],
+            self.statistics['elapsed_write']
+        )
+
+        return self.statistics
+
+    def write(self, nodes):
+        """
+        Replace the instance nodes of the index with the evaluated nodes.
+        """
+        IndexInstanceNode = apps.get_model(
+            app_label='document_indexing', model_name='IndexInstanceNode'
+        )
+        DocumentThrough = IndexInstanceNode.documents.through
+
+        start_time = time.time()
+        template_root = self.template_root
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=template_root.get_lock_string()
+        )
+        try:
+            with transaction.atomic():
+                try:
+                    template_root.get_instance_root_node().delete()
+                except IndexInstanceNode.DoesNotExist:
+                    # Empty index, ignore this exception
+                    pass
+
+                instance_root = template_root.index_instance_nodes.create()
+
+                # Group the nodes per level. Nodes are inserted one level at
+                # a time to know the primary key of their parents.
+                levels = {}
+                for key in nodes:
+                    level = 1
+                    parent_key = key[0]
+                    while parent_key:
+                        level += 1
+                        parent_key = parent_key[0]
+
+                    levels.setdefault(level, []).append(key)
+
+                node_pks = {None: instance_root.pk}
+
+                for level in sorted(levels):
+                    entries = [
+                        IndexInstanceNode(
+                            index_template_node_id=key[1],
+                            level=level, lft=0,
+                            parent_id=node_pks[key[0]], rght=0,
+                            tree_id=instance_root.tree_id, value=key[2]
+                        ) for key in levels[level]
+                    ]
+                    IndexInstanceNode.objects.bulk_create(
+                        batch_size=INDEX_REBUILD_BULK_CREATE_BATCH_SIZE,
+                        objs=entries
+                    )
+
+                    # Retrieve the primary keys of the inserted nodes. Not
+                    # all database backends return them from a bulk insert.
+                    parent_keys = {
+                        node_pks[key[0]]: key[0] for key in levels[level]
+                    }
+                    queryset = IndexInstanceNode.objects.filter(
+                        level=level, tree_id=instance_root.tree_id
+                    ).values_list(
+                        'pk', 'parent_id', 'index_template_node_id', 'value'
+                    )
+                    for pk, parent_id, template_node_id, value in queryset.iterator():
+                        node_pks[
+                            (parent_keys[parent_id], template_node_id, value)
+                        ] = pk
+
+                entries = []
+                for key, node in nodes.items():
+                    for document_id in node['documents']:
+                        entries.append(
+                            DocumentThrough(
+                                document_id=document_id,
+                                indexinstancenode_id=node_pks[key]
+                            )
+                        )
+
+                        if len(entries) >= INDEX_REBUILD_BULK_CREATE_BATCH_SIZE:
+                            DocumentThrough.objects.bulk_create(objs=entries)
+                            entries = []
+
+                if entries:
+                    DocumentThrough.objects.bulk_create(objs=entries)
+
+                IndexInstanceNode.objects.partial_rebuild(
+                    tree_id=instance_root.tree_id
+                )
+        finally:
+            lock.release()
+
+        self.statistics['elapsed_write'] = time.time() - start_time
+
+        self.notify()
+
+    def notify(self):
+        """
+        Bulk inserts don't send model signals. Update the apps that depend
+        on them.
+        """
+        # Hide circular imports.
+        from django.contrib.contenttypes.models import ContentType
+
+        from mayan.apps.acls.models import (
+            AccessControlList, EffectiveAccessControlList
+        )
+        from mayan.apps.acls.settings import setting_effective_acls_enable
+        from mayan.apps.dynamic_search.tasks import task_index_search_model
+
+        from .search import index_instance_node_search
+
+        if setting_effective_acls_enable.value:
+            queryset = AccessControlList.objects.filter(
+                content_type=ContentType.objects.get_for_model(
+                    model=self.index_template
+                ), object_id=self.index_template.pk
+            )
+            for acl in queryset:
+                EffectiveAccessControlList.objects.update_for_acl(acl=acl)
+
+        task_index_search_model.apply_async(
+            kwargs={
+                'search_model_full_name': index_instance_node_search.get_full_name()
+            }
+        )
@@ -1 +1,5 @@
+DEFAULT_DOCUMENT_INDEXING_REBUILD_BULK = True
 DEFAULT_TASK_RETRY_DELAY = 5
+
+INDEX_REBUILD_BULK_CREATE_BATCH_SIZE = 1000
+INDEX_REBUILD_DOCUMENT_CHUNK_SIZE = 1000
@@ -16,8 +16,8 @@ from mayan.apps.events.classes import EventManagerSave
 from mayan.apps.events.decorators import method_event
 from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
-from mayan.apps.templating.classes import Template
 
+from .classes import IndexTemplateBulkRebuilder, IndexTemplateEvaluator
 from .events import event_index_template_created, event_index_template_edited
 from .managers import (
     DocumentIndexInstanceNodeManager, IndexTemplateManager,
@@ -99,32 +99,129 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
             ] or ['None']
         )
 
+    def _get_document_index_instance_nodes(self, document):
+        """
+        Return the instance nodes of this index that contain the document
+        keyed by the same (parent key, template node ID, value) tuple used
+        by the evaluator.
+        """
+        queryset = IndexInstanceNode.objects.filter(
+            index_template_node__index=self, documents=document
+        )
+
+        ancestors = {
+            node.pk: node for node in IndexInstanceNode.objects.get_queryset_ancestors(
+                queryset=queryset, include_self=True
+            )
+        }
+
+        def get_key(node):
+            if node.is_root_node():
+                return None
+            else:
+                return (
+                    get_key(node=ancestors[node.parent_id]),
+                    node.index_template_node_id, node.value
+                )
+
+        return {
+            get_key(node=ancestors[node.pk]): ancestors[node.pk]
+            for node in queryset
+        }
+
     def index_document(self, document):
         """
-        Method to start the indexing process for a document. The entire process
-        happens inside one transaction. The document is first removed from all
-        the index nodes to which it already belongs. The different index
-        templates that match this document's type are evaluated and for each
-        result a node is fetched or created and the document is added to that
-        node.
+        Method to start the indexing process for a document. The index
+        templates are evaluated for the document and the resulting node
+        paths are compared to the nodes that already contain the document.
+        Only the differences are updated. The document is added to the new
+        nodes, creating them if needed, and removed from the nodes to which
+        it no longer belongs. Nodes left empty are deleted. Nothing is
+        written when the index values of the document are unchanged.
         """
         logger.debug('Index; Indexing document: %s', document)
 
         if Document.valid.filter(pk=document.pk).exists():
             # Only index valid documents
+            nodes = IndexTemplateEvaluator(
+                index_template=self
+            ).evaluate_document(document=document)
+            keys_new = set(
+                key for key, node in nodes.items() if node['documents']
+            )
+
+            # Skip the lock when the index values of the document are
+            # unchanged. The check is repeated once the lock is held.
+            if keys_new == set(self._get_document_index_instance_nodes(document=document)):
+                logger.debug('Index; Document unchanged: %s', document)
+                return
+
             self.initialize_instance_root()
 
-            with transaction.atomic():
-                # Remove the document from all instance nodes from
-                # this index
-                for index_instance_node in IndexInstanceNode.objects.filter(index_template_node__index=self, documents=document):
-                    index_instance_node.remove_document(document=document)
+            template_root = self.template_root
+            lock = LockingBackend.get_backend().acquire_lock(
+                blocking=True, name=template_root.get_lock_string()
+            )
+            try:
+                with transaction.atomic():
+                    # Read the nodes of the document again, they might have
+                    # been changed by another process while waiting for the
+                    # lock.
+                    current_index_instance_nodes = self._get_document_index_instance_nodes(
+                        document=document
+                    )
+                    keys_current = set(current_index_instance_nodes)
+
+                    if keys_new == keys_current:
+                        logger.debug('Index; Document unchanged: %s', document)
+                        return
+
+                    index_instance_nodes = {
+                        None: template_root.get_instance_root_node()
+                    }
+
+                    def get_or_create_node(key):
+                        try:
+                            return index_instance_nodes[key]
+                        except KeyError:
+                            index_instance_node, created = IndexInstanceNode.objects.get_or_create(
+                                index_template_node_id=key[1],
+                                parent=get_or_create_node(key=key[0]),
+                                value=key[2]
+                            )
+                            index_instance_nodes[key] = index_instance_node
+                            return index_instance_node
+
+                    # Add first to reuse the ancestors shared with the
+                    # nodes the document is leaving.
+                    for key in keys_new - keys_current:
+                        get_or_create_node(key=key).documents.add(document)
+
+                    for key in keys_current - keys_new:
+                        index_instance_node = current_index_instance_nodes[key]
+                        index_instance_node.documents.remove(document)
+
+                        # Delete the nodes left empty. Starting from the
+                        # bottom up. Nodes are reloaded since the tree
+                        # fields change with every insert and delete.
+                        index_instance_node_pk = index_instance_node.pk
+                        while True:
+                            try:
+                                index_instance_node = IndexInstanceNode.objects.get(
+                                    pk=index_instance_node_pk
+                                )
+                            except IndexInstanceNode.DoesNotExist:
+                                # Already deleted, nothing left to clean
+                                # up.
+                                break
 
-                # Delete all empty nodes. Starting from the bottom up
-                for index_instance_node in self.instance_root.get_leafnodes():
-                    index_instance_node.delete_empty()
+                            if index_instance_node.is_root_node() or index_instance_node.get_documents().exists() or index_instance_node.get_children().exists():
+                                break
 
-            self.template_root.index_document(document=document)
+                            index_instance_node_pk = index_instance_node.parent_id
+                            index_instance_node.delete()
+            finally:
+                lock.release()
 
     def initialize_instance_root(self):
         return self.template_root.initialize_index_instance_root_node()
@@ -160,6 +257,16 @@ class IndexTemplate(ExtraDataModelMixin, models.Model):
             # associated with this index.
             self.index_document(document=document)
 
+    def rebuild_bulk(self, progress_callback=None):
+        """
+        Reconstruct the index using bulk database operations. Returns a
+        dictionary with the document and node counts and the time spent
+        evaluating and writing.
+        """
+        return IndexTemplateBulkRebuilder(
+            index_template=self, progress_callback=progress_callback
+        ).rebuild()
+
     def reset(self):
         try:
             self.instance_root.delete()
@@ -253,83 +360,6 @@ class IndexTemplateNode(MPTTModel):
     def get_instance_root_node(self):
         return self.index_instance_nodes.get(parent=None)
 
-    def index_document(self, document, acquire_lock=True, index_instance_node_parent=None):
-        # Start transaction after the lock in case the locking backend uses
-        # the database.
-        try:
-            if acquire_lock:
-                lock = LockingBackend.get_backend().acquire_lock(
-                    name=self.get_lock_string()
-                )
-        except LockError:
-            raise
-        else:
-            try:
-                logger.debug(
-                    'IndexTemplateNode; Indexing document: %s', document
-                )
-
-                if not index_instance_node_parent:
-                    # I'm the root
-                    with transaction.atomic():
-                        index_instance_root_node = self.get_instance_root_node()
-
-                        for child in self.get_children():
-                            child.index_document(
-                                document=document, acquire_lock=False,
-                                index_instance_node_parent=index_instance_root_node
-                            )
-                elif self.enabled:
-                    with transaction.atomic():
-                        logger.debug('IndexTemplateNode; non parent: evaluating')
-                        logger.debug('My parent template is: %s', self.parent)
-                        logger.debug(
-                            'My parent instance node is: %s',
-                            index_instance_node_parent
-                        )
-                        logger.debug(
-                            'IndexTemplateNode; Evaluating template: %s', self.expression
-                        )
-
-                        try:
-                            template = Template(
-                                template_string=self.expression
-                            )
-                            result = template.render(
-                                context={'document': document}
-                            )
-                        except Exception as exception:
-                            logger.debug('Evaluating error: %s', exception)
-                            error_message = _(
-                                'Error indexing document: %(document)s; expression: '
-                                '%(expression)s; %(exception)s'
-                            ) % {
-                                'document': document,
-                                'expression': self.expression,
-                                'exception': exception
-                            }
-                            logger.debug(error_message)
-                        else:
-                            logger.debug('Evaluation result: %s', result)
-
-                            if result:
-                                index_instance_node, created = self.index_instance_nodes.get_or_create(
-                                    parent=index_instance_node_parent,
-                                    value=result
-                                )
-
-                                if self.link_documents:
-                                    index_instance_node.documents.add(document)
-
-                                for child in self.get_children():
-                                    child.index_document(
-                                        document=document, acquire_lock=False,
-                                        index_instance_node_parent=index_instance_node
-                                    )
-            finally:
-                if acquire_lock:
-                    lock.release()
-
     def initialize_index_instance_root_node(self):
         self.index_instance_nodes.get_or_create(parent=None)
 
@@ -2,12 +2,22 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.smart_settings.classes import SettingNamespace
 
-from .literals import DEFAULT_TASK_RETRY_DELAY
+from .literals import (
+    DEFAULT_DOCUMENT_INDEXING_REBUILD_BULK, DEFAULT_TASK_RETRY_DELAY
+)
 
 namespace = SettingNamespace(
     label=_('Document indexing'), name='document_indexing',
 )
 
+setting_rebuild_bulk = namespace.add_setting(
+    default=DEFAULT_DOCUMENT_INDEXING_REBUILD_BULK,
+    global_name='DOCUMENT_INDEXING_REBUILD_BULK', help_text=_(
+        'Rebuild indexes by evaluating the templates for chunks of '
+        'documents and inserting the index nodes in bulk instead of '
+        'indexing one document at a time.'
+    )
+)
 setting_task_retry = namespace.add_setting(
     default=DEFAULT_TASK_RETRY_DELAY,
     global_name='DOCUMENT_INDEXING_TASK_RETRY_DELAY', help_text=_(
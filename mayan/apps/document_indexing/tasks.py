@@ -6,7 +6,7 @@ from django.db import OperationalError
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
-from .settings import setting_task_retry
+from .settings import setting_rebuild_bulk, setting_task_retry
 
 logger = logging.getLogger(name=__name__)
 
@@ -72,7 +72,10 @@ def task_rebuild_index(self, index_id):
 
     try:
         index = IndexTemplate.objects.get(pk=index_id)
-        index.rebuild()
+        if setting_rebuild_bulk.value:
+            index.rebuild_bulk()
+        else:
+            index.rebuild()
     except LockError as exception:
         # This index is being rebuilt by another task, retry later
         raise self.retry(exc=exception)
@@ -274,3 +274,165 @@ class IndexTestCase(IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_index_template.get_absolute_url())
+
+
+class IndexTemplateIncrementalIndexingTestCase(
+    IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._create_test_index_template(add_test_document_type=True)
+
+        self.test_index_template_node_level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.document_type.label }}',
+            link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template_node_level_1,
+            expression='{{ document.label }}', link_documents=True
+        )
+
+        self.test_index_template.index_document(document=self.test_document)
+
+    def test_index_document_unchanged(self):
+        test_index_instance_node_pks = list(
+            IndexInstanceNode.objects.values_list('pk', flat=True)
+        )
+
+        self.test_index_template.index_document(document=self.test_document)
+
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('pk', flat=True)),
+            test_index_instance_node_pks
+        )
+
+    def test_index_document_changed(self):
+        test_index_instance_node_level_1 = IndexInstanceNode.objects.get(
+            value=self.test_document_type.label
+        )
+
+        self.test_document.label = TEST_DOCUMENT_LABEL_EDITED
+        self.test_document.save()
+
+        self.test_index_template.index_document(document=self.test_document)
+
+        self.assertEqual(
+            set(IndexInstanceNode.objects.values_list('value', flat=True)),
+            set(('', self.test_document_type.label, TEST_DOCUMENT_LABEL_EDITED))
+        )
+        # The shared parent node is kept.
+        self.assertTrue(
+            IndexInstanceNode.objects.filter(
+                pk=test_index_instance_node_level_1.pk
+            ).exists()
+        )
+        self.assertTrue(
+            self.test_document in IndexInstanceNode.objects.get(
+                value=TEST_DOCUMENT_LABEL_EDITED
+            ).documents.all()
+        )
+
+    def test_index_document_no_result(self):
+        self.test_index_template_node_level_1.expression = ''
+        self.test_index_template_node_level_1.save()
+
+        self.test_index_template.index_document(document=self.test_document)
+
+        self.assertEqual(
+            list(IndexInstanceNode.objects.values_list('value', flat=True)),
+            ['']
+        )
+
+
+class IndexTemplateBulkRebuildTestCase(
+    IndexTemplateTestMixin, DocumentTestMixin, BaseTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._create_test_document_stub()
+        self._create_test_document_stub()
+        self._create_test_index_template(add_test_document_type=True)
+
+    def _get_test_index_instance_nodes(self):
+        return set(
+            (
+                node.level, node.value,
+                tuple(sorted(node.documents.values_list('pk', flat=True)))
+            ) for node in IndexInstanceNode.objects.all()
+        )
+
+    def test_rebuild_bulk_dual_level(self):
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.uuid }}', link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1, expression='{{ document.label }}',
+            link_documents=True
+        )
+
+        self.test_index_template.rebuild()
+        test_index_instance_nodes = self._get_test_index_instance_nodes()
+
+        statistics = self.test_index_template.rebuild_bulk()
+
+        self.assertEqual(statistics['document_count'], 2)
+        self.assertEqual(statistics['node_count'], 4)
+        self.assertEqual(
+            self._get_test_index_instance_nodes(), test_index_instance_nodes
+        )
+
+    def test_rebuild_bulk_shared_node(self):
+        self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.document_type.label }}',
+            link_documents=True
+        )
+
+        self.test_index_template.rebuild_bulk()
+
+        test_index_instance_node = IndexInstanceNode.objects.get(
+            value=self.test_document_type.label
+        )
+        self.assertEqual(test_index_instance_node.documents.count(), 2)
+
+    def test_rebuild_bulk_tree_fields(self):
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root,
+            expression='{{ document.uuid }}', link_documents=False
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1, expression='{{ document.label }}',
+            link_documents=True
+        )
+
+        self.test_index_template.rebuild_bulk()
+
+        instance_root = self.test_index_template.instance_root
+        self.assertEqual(instance_root.get_descendant_count(), 4)
+        self.assertEqual(instance_root.get_children().count(), 2)
+        self.assertEqual(instance_root.get_leafnodes().count(), 2)
+
+    def test_rebuild_bulk_no_result_parent(self):
+        level_1 = self.test_index_template.node_templates.create(
+            parent=self.test_index_template.template_root, expression='',
+            link_documents=True
+        )
+        self.test_index_template.node_templates.create(
+            parent=level_1, expression='{{ document.label }}',
+            link_documents=True
+        )
+
+        self.test_index_template.rebuild_bulk()
+
+        self.assertEqual(
+            list(
+                IndexInstanceNode.objects.values_list('value', flat=True)
+            ), ['']
+        )
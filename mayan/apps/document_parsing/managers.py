@@ -27,6 +27,27 @@ class DocumentFilePageContentManager(models.Manager):
                 target=document_file
             )
 
+    def update_or_create_bulk(self, results):
+        """
+        Store the content of several pages, `results` is a dictionary of
+        the content of each document file page ID.
+        """
+        results = results.copy()
+
+        entries_update = []
+        for entry in self.filter(document_file_page_id__in=list(results)):
+            entry.content = results.pop(entry.document_file_page_id)
+            entries_update.append(entry)
+
+        self.bulk_update(fields=('content',), objs=entries_update)
+        self.bulk_create(
+            objs=[
+                self.model(
+                    content=content, document_file_page_id=document_file_page_id
+                ) for document_file_page_id, content in results.items()
+            ]
+        )
+
     def process_document_file(self, document_file, user=None):
         logger.info(
             'Starting parsing for document file: %s', document_file
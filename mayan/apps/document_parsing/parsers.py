@@ -57,13 +57,58 @@ class Parser:
                     mimetype, []
                 ).append(parser_class)
 
+    def execute_document_file(self, file_object):
+        """
+        Return a list with the content of each page of the file. Parsers
+        that can't process the whole file at once return None.
+        """
+        return None
+
     def process_document_file(self, document_file):
+        """
+        Parse all the pages of the document file at once when the parser
+        supports it and store the content in bulk. The pages missing from
+        the result, or all the pages if parsing the whole file fails, are
+        parsed one at a time.
+        """
+        DocumentFilePageContent = apps.get_model(
+            app_label='document_parsing', model_name='DocumentFilePageContent'
+        )
+
         logger.info(
             'Starting parsing for document file: %s', document_file
         )
         logger.debug('document file: %d', document_file.pk)
 
+        file_object = document_file.get_intermediate_file()
+
+        try:
+            page_contents = self.execute_document_file(file_object=file_object)
+        except Exception as exception:
+            logger.error(
+                'Exception parsing document file: %s; %s', document_file,
+                exception, exc_info=True
+            )
+            page_contents = ()
+        finally:
+            file_object.close()
+
+        if page_contents is None:
+            page_contents = ()
+
+        document_file_pages_remaining = []
+        results = {}
         for document_file_page in document_file.pages.all():
+            try:
+                results[document_file_page.pk] = page_contents[
+                    document_file_page.page_number - 1
+                ]
+            except IndexError:
+                document_file_pages_remaining.append(document_file_page)
+
+        DocumentFilePageContent.objects.update_or_create_bulk(results=results)
+
+        for document_file_page in document_file_pages_remaining:
             self.process_document_file_page(document_file_page=document_file_page)
 
     def process_document_file_page(self, document_file_page):
@@ -123,35 +168,46 @@ class PopplerParser(Parser):
 
         logger.debug('self.pdftotext_path: %s', self.pdftotext_path)
 
-    def execute(self, file_object, page_number):
-        logger.debug('Parsing PDF page: %d', page_number)
-
+    def _execute(self, file_object, page_number=None):
+        """
+        Execute pdftotext for a page or for the whole file and return the
+        raw output. The text of each page is followed by a form feed.
+        """
         temporary_file_object = NamedTemporaryFile()
         copyfileobj(fsrc=file_object, fdst=temporary_file_object)
         temporary_file_object.seek(0)
 
         command = []
         command.append(self.pdftotext_path)
-        command.append('-f')
-        command.append(str(page_number))
-        command.append('-l')
-        command.append(str(page_number))
+        if page_number:
+            command.append('-f')
+            command.append(str(page_number))
+            command.append('-l')
+            command.append(str(page_number))
         command.append(temporary_file_object.name)
         command.append('-')
 
-        proc = subprocess.Popen(
-            command, close_fds=True, stderr=subprocess.PIPE,
-            stdout=subprocess.PIPE
-        )
-        return_code = proc.wait()
-        if return_code != 0:
-            logger.error(proc.stderr.readline())
+        try:
+            proc = subprocess.Popen(
+                command, close_fds=True, stderr=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+            output, error_output = proc.communicate()
+        finally:
             temporary_file_object.close()
 
+        if proc.returncode != 0:
+            logger.error(error_output)
             raise ParserError
 
-        output = proc.stdout.read()
-        temporary_file_object.close()
+        return output
+
+    def execute(self, file_object, page_number):
+        logger.debug('Parsing PDF page: %d', page_number)
+
+        output = self._execute(
+            file_object=file_object, page_number=page_number
+        )
 
         if output == b'\x0c':
             logger.debug('Parser didn\'t return any output')
@@ -162,6 +218,22 @@ class PopplerParser(Parser):
 
         return force_text(s=output)
 
+    def execute_document_file(self, file_object):
+        logger.debug('Parsing PDF file')
+
+        output = self._execute(file_object=file_object)
+
+        result = []
+        # The output ends with the form feed of the last page, discard the
+        # empty text after it.
+        for page_output in output.split(b'\x0c')[:-1]:
+            if page_output[-2:] == b'\x0a\x0a':
+                page_output = page_output[:-2]
+
+            result.append(force_text(s=page_output))
+
+        return result
+
 
 Parser.register(
     mimetypes=('application/pdf',),
@@ -1,6 +1,7 @@
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
 from mayan.apps.documents.tests.literals import TEST_HYBRID_DOCUMENT
 
+from ..exceptions import ParserError
 from ..parsers import PopplerParser
 
 from .literals import TEST_DOCUMENT_CONTENT
@@ -17,3 +18,29 @@ class ParserTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_DOCUMENT_CONTENT in self.test_document_file.pages.first().content.content
         )
+
+    def test_poppler_parser_execute_document_file(self):
+        parser = PopplerParser()
+
+        with self.test_document_file.open() as file_object:
+            page_contents = parser.execute_document_file(
+                file_object=file_object
+            )
+
+        self.assertEqual(
+            len(page_contents), self.test_document_file.pages.count()
+        )
+        self.assertTrue(TEST_DOCUMENT_CONTENT in page_contents[0])
+
+    def test_poppler_parser_page_fallback(self):
+        class TestParser(PopplerParser):
+            def execute_document_file(self, file_object):
+                raise ParserError
+
+        parser = TestParser()
+
+        parser.process_document_file(self.test_document_file)
+
+        self.assertTrue(
+            TEST_DOCUMENT_CONTENT in self.test_document_file.pages.first().content.content
+        )
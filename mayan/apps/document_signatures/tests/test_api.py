@@ -5,7 +5,7 @@ from mayan.apps.django_gpg.tests.literals import TEST_KEY_PUBLIC_ID
 from mayan.apps.django_gpg.tests.mixins import KeyTestMixin
 from mayan.apps.documents.events import (
     event_document_file_created, event_document_file_edited,
-    event_document_version_created, event_document_version_page_created
+    event_document_version_created, event_document_version_edited
 )
 from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
@@ -482,12 +482,10 @@ class EmbeddedSignatureDocumentAPIViewTestCase(
         self.assertEqual(events[2].target, test_document_version)
         self.assertEqual(events[2].verb, event_document_version_created.id)
 
-        self.assertEqual(events[3].action_object, test_document_version)
+        self.assertEqual(events[3].action_object, self.test_document)
         self.assertEqual(events[3].actor, self._test_case_user)
-        self.assertEqual(events[3].target, test_document_version.pages.first())
-        self.assertEqual(
-            events[3].verb, event_document_version_page_created.id
-        )
+        self.assertEqual(events[3].target, test_document_version)
+        self.assertEqual(events[3].verb, event_document_version_edited.id)
 
         self.assertEqual(
             events[4].action_object,
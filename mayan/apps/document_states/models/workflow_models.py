@@ -110,7 +110,9 @@ class Workflow(ExtraDataModelMixin, models.Model):
         cache_filename = '{}'.format(self.get_hash())
 
         try:
-            self.cache_partition.get_file(filename=cache_filename)
+            self.cache_partition.get_file(
+                filename=cache_filename, use_index=False
+            )
         except CachePartitionFile.DoesNotExist:
             logger.debug(
                 'workflow cache file "%s" not found', cache_filename
@@ -1,9 +1,5 @@
 import logging
 
-from django.conf import settings
-from django.http import HttpResponse
-from django.views.decorators.cache import cache_control, patch_cache_control
-
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -11,7 +7,6 @@ from mayan.apps.rest_api import generics
 from mayan.apps.storage.models import SharedUploadedFile
 from mayan.apps.views.generics import DownloadViewMixin
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from ..permissions import (
     permission_document_file_delete, permission_document_file_download,
     permission_document_file_edit, permission_document_file_new,
@@ -26,7 +21,8 @@ from ..tasks import (
 )
 
 from .mixins import (
-    ParentObjectDocumentAPIViewMixin, ParentObjectDocumentFileAPIViewMixin
+    PageImageAPIViewMixin, ParentObjectDocumentAPIViewMixin,
+    ParentObjectDocumentFileAPIViewMixin
 )
 
 logger = logging.getLogger(name=__name__)
@@ -149,7 +145,8 @@ class APIDocumentFilePageDetailView(
 
 
 class APIDocumentFilePageImageView(
-    ParentObjectDocumentFileAPIViewMixin, generics.RetrieveAPIView
+    PageImageAPIViewMixin, ParentObjectDocumentFileAPIViewMixin,
+    generics.RetrieveAPIView
 ):
     """
     get: Returns an image representation of the selected document.
@@ -158,6 +155,9 @@ class APIDocumentFilePageImageView(
     mayan_object_permissions = {
         'GET': (permission_document_file_view,),
     }
+    page_image_cache_time_setting = setting_document_file_page_image_cache_time
+    page_image_task = task_document_file_page_image_generate
+    page_image_task_id_argument = 'document_file_page_id'
 
     def get_queryset(self):
         return self.get_document_file().pages.all()
@@ -168,56 +168,6 @@ class APIDocumentFilePageImageView(
     def get_serializer_class(self):
         return None
 
-    @cache_control(private=True)
-    def retrieve(self, request, *args, **kwargs):
-        width = request.GET.get('width')
-        height = request.GET.get('height')
-        zoom = request.GET.get('zoom')
-
-        if zoom:
-            zoom = int(zoom)
-
-        rotation = request.GET.get('rotation')
-
-        if rotation:
-            rotation = int(rotation)
-
-        maximum_layer_order = request.GET.get('maximum_layer_order')
-        if maximum_layer_order:
-            maximum_layer_order = int(maximum_layer_order)
-
-        obj = self.get_object()
-
-        task = task_document_file_page_image_generate.apply_async(
-            kwargs={
-                'document_file_page_id': obj.pk,
-                'height': height,
-                'maximum_layer_order': maximum_layer_order,
-                'rotation': rotation,
-                'user_id': request.user.pk,
-                'width': width,
-                'zoom': zoom
-            }
-        )
-
-        kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
-        if settings.DEBUG:
-            # In debug more, task are run synchronously, causing this method
-            # to be called inside another task. Disable the check of nested
-            # tasks when using debug mode.
-            kwargs['disable_sync_subtasks'] = False
-
-        cache_filename = task.get(**kwargs)
-        cache_file = obj.cache_partition.get_file(filename=cache_filename)
-        with cache_file.open() as file_object:
-            response = HttpResponse(content=file_object.read(), content_type='image')
-            if '_hash' in request.GET:
-                patch_cache_control(
-                    response=response,
-                    max_age=setting_document_file_page_image_cache_time.value
-                )
-            return response
-
 
 class APIDocumentFilePageListView(
     ParentObjectDocumentFileAPIViewMixin, generics.ListAPIView
@@ -1,14 +1,14 @@
 import logging
 
-from django.conf import settings
-from django.http import HttpResponse
-from django.views.decorators.cache import cache_control, patch_cache_control
+from furl import furl
+
+from django.urls import reverse
 
 from rest_framework import status
+from rest_framework.response import Response
 
 from mayan.apps.rest_api import generics
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from ..permissions import (
     permission_document_version_create, permission_document_version_delete,
     permission_document_version_edit, permission_document_version_export,
@@ -19,10 +19,12 @@ from ..serializers.document_version_serializers import (
 )
 from ..settings import setting_document_version_page_image_cache_time
 from ..tasks import (
-    task_document_version_export, task_document_version_page_image_generate
+    task_document_version_export, task_document_version_page_image_generate,
+    task_document_version_pages_sprite_generate
 )
 
 from .mixins import (
+    PageImageAPIViewMixin, PageSpriteAPIViewMixin,
     ParentObjectDocumentAPIViewMixin, ParentObjectDocumentVersionAPIViewMixin
 )
 
@@ -137,7 +139,8 @@ class APIDocumentVersionPageDetailView(
 
 
 class APIDocumentVersionPageImageView(
-    ParentObjectDocumentVersionAPIViewMixin, generics.RetrieveAPIView
+    PageImageAPIViewMixin, ParentObjectDocumentVersionAPIViewMixin,
+    generics.RetrieveAPIView
 ):
     """
     get: Returns an image representation of the selected document version page.
@@ -146,6 +149,9 @@ class APIDocumentVersionPageImageView(
     mayan_object_permissions = {
         'GET': (permission_document_version_view,),
     }
+    page_image_cache_time_setting = setting_document_version_page_image_cache_time
+    page_image_task = task_document_version_page_image_generate
+    page_image_task_id_argument = 'document_version_page_id'
 
     def get_queryset(self):
         return self.get_document_version().pages.all()
@@ -156,56 +162,6 @@ class APIDocumentVersionPageImageView(
     def get_serializer_class(self):
         return None
 
-    @cache_control(private=True)
-    def retrieve(self, request, *args, **kwargs):
-        width = request.GET.get('width')
-        height = request.GET.get('height')
-        zoom = request.GET.get('zoom')
-
-        if zoom:
-            zoom = int(zoom)
-
-        rotation = request.GET.get('rotation')
-
-        if rotation:
-            rotation = int(rotation)
-
-        maximum_layer_order = request.GET.get('maximum_layer_order')
-        if maximum_layer_order:
-            maximum_layer_order = int(maximum_layer_order)
-
-        obj = self.get_object()
-
-        task = task_document_version_page_image_generate.apply_async(
-            kwargs={
-                'document_version_page_id': obj.pk,
-                'height': height,
-                'maximum_layer_order': maximum_layer_order,
-                'rotation': rotation,
-                'user_id': request.user.pk,
-                'width': width,
-                'zoom': zoom
-            }
-        )
-
-        kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
-        if settings.DEBUG:
-            # In debug more, task are run synchronously, causing this method
-            # to be called inside another task. Disable the check of nested
-            # tasks when using debug mode.
-            kwargs['disable_sync_subtasks'] = False
-
-        cache_filename = task.get(**kwargs)
-        cache_file = obj.cache_partition.get_file(filename=cache_filename)
-        with cache_file.open() as file_object:
-            response = HttpResponse(content=file_object.read(), content_type='image')
-            if '_hash' in request.GET:
-                patch_cache_control(
-                    response=response,
-                    max_age=setting_document_version_page_image_cache_time.value
-                )
-            return response
-
 
 class APIDocumentVersionPageListView(
     ParentObjectDocumentVersionAPIViewMixin, generics.ListCreateAPIView
@@ -233,3 +189,56 @@ class APIDocumentVersionPageListView(
         return self.get_document_version(
             permission=permission_document_version_view
         ).pages.all()
+
+
+class APIDocumentVersionPageSpriteImageView(
+    PageSpriteAPIViewMixin, ParentObjectDocumentAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns the images of a range of pages of the selected document version combined in a single image, one page below the other.
+    """
+    lookup_url_kwarg = 'document_version_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_version_view,),
+    }
+    page_image_cache_time_setting = setting_document_version_page_image_cache_time
+    page_image_task = task_document_version_pages_sprite_generate
+
+    def get_queryset(self):
+        return self.get_document().versions.all()
+
+    def get_serializer(self, *args, **kwargs):
+        return None
+
+    def get_serializer_class(self):
+        return None
+
+
+class APIDocumentVersionPageSpriteView(APIDocumentVersionPageSpriteImageView):
+    """
+    get: Returns the position of each page in the combined image of a range of pages of the selected document version and the URL of the image.
+    """
+    def get_page_image_response(self, cache_file, obj):
+        # A missing manifest raises `DoesNotExist` and the sprite is
+        # generated again by the view.
+        manifest = obj.get_pages_sprite_manifest(
+            cache_filename=cache_file.filename
+        )
+
+        image_url = furl(
+            url=self.request.build_absolute_uri(
+                location=reverse(
+                    viewname='rest_api:documentversionpage-sprite-image',
+                    kwargs={
+                        'document_id': obj.document_id,
+                        'document_version_id': obj.pk
+                    }
+                )
+            )
+        )
+        image_url.args.update(self.request.GET.dict())
+        image_url.args['_hash'] = cache_file.filename
+        manifest['image_url'] = image_url.tostr()
+
+        return Response(data=manifest)
@@ -1,9 +1,26 @@
+import logging
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_control, patch_cache_control
+
+from rest_framework.exceptions import NotFound
 from rest_framework.generics import get_object_or_404
 
 from mayan.apps.acls.models import AccessControlList
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.views.compat import FileResponse
 
+from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from ..models.document_models import Document
 from ..models.document_type_models import DocumentType
+from ..settings import (
+    setting_page_image_sendfile_header, setting_page_image_sendfile_prefix
+)
+
+logger = logging.getLogger(name=__name__)
 
 
 class ParentObjectDocumentAPIViewMixin:
@@ -64,3 +81,192 @@ class ParentObjectDocumentVersionAPIViewMixin(ParentObjectDocumentAPIViewMixin):
         return get_object_or_404(
             queryset=queryset, pk=self.kwargs['document_version_id']
         )
+
+
+class PageImageAPIViewMixin:
+    """
+    Return the image of a page. The name of the cached image is calculated
+    by the view and cached images are sent without waiting for a task.
+    The image generation task is only used when the image is not cached.
+    The cached image name includes the digest of the transformations and
+    is used as the entity tag of the response.
+    """
+    page_image_cache_time_setting = None
+    page_image_task = None
+    page_image_task_id_argument = None
+
+    def get_page_image_cache_filename(self, obj, page_image_kwargs):
+        transformation_list = obj.get_combined_transformation_list(
+            user=self.get_page_image_user(), **page_image_kwargs
+        )
+        return obj.get_combined_cache_filename(
+            _transformation_list=transformation_list
+        )
+
+    def get_page_image_kwargs(self):
+        width = self.request.GET.get('width')
+        height = self.request.GET.get('height')
+        zoom = self.request.GET.get('zoom')
+
+        if zoom:
+            zoom = int(zoom)
+
+        rotation = self.request.GET.get('rotation')
+
+        if rotation:
+            rotation = int(rotation)
+
+        maximum_layer_order = self.request.GET.get('maximum_layer_order')
+        if maximum_layer_order:
+            maximum_layer_order = int(maximum_layer_order)
+
+        return {
+            'height': height,
+            'maximum_layer_order': maximum_layer_order,
+            'rotation': rotation,
+            'width': width,
+            'zoom': zoom
+        }
+
+    def get_page_image_response(self, cache_file, obj):
+        """
+        Raises `CachePartitionFile.DoesNotExist` if the cached image was
+        deleted after it was found.
+        """
+        sendfile_header = setting_page_image_sendfile_header.value
+
+        if sendfile_header:
+            try:
+                path = cache_file.partition.cache.storage.path(
+                    name=cache_file.full_filename
+                )
+            except NotImplementedError:
+                # The storage is not in the local filesystem, send the
+                # image from the application.
+                pass
+            else:
+                if not cache_file.exists():
+                    raise CachePartitionFile.DoesNotExist
+
+                cache_file.hit()
+
+                response = HttpResponse(content_type='image')
+                response[sendfile_header] = '{}{}'.format(
+                    setting_page_image_sendfile_prefix.value or '', path
+                )
+                return response
+
+        return FileResponse(
+            content_type='image',
+            streaming_content=cache_file.open_for_reading()
+        )
+
+    def get_page_image_user(self):
+        if self.request.user.is_authenticated:
+            return self.request.user
+        else:
+            return None
+
+    def page_image_generate(self, obj, page_image_kwargs):
+        task_kwargs = page_image_kwargs.copy()
+        task_kwargs.update(
+            {
+                self.page_image_task_id_argument: obj.pk,
+                'user_id': self.request.user.pk
+            }
+        )
+
+        task = self.page_image_task.apply_async(kwargs=task_kwargs)
+
+        kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
+        if settings.DEBUG:
+            # In debug more, task are run synchronously, causing this method
+            # to be called inside another task. Disable the check of nested
+            # tasks when using debug mode.
+            kwargs['disable_sync_subtasks'] = False
+
+        return task.get(**kwargs)
+
+    @cache_control(private=True)
+    def retrieve(self, request, *args, **kwargs):
+        page_image_kwargs = self.get_page_image_kwargs()
+
+        obj = self.get_object()
+
+        cache_filename = self.get_page_image_cache_filename(
+            obj=obj, page_image_kwargs=page_image_kwargs
+        )
+        etag = quote_etag(cache_filename)
+
+        response = get_conditional_response(request=request, etag=etag)
+
+        if response is None:
+            try:
+                cache_file = obj.cache_partition.get_file(
+                    filename=cache_filename
+                )
+                response = self.get_page_image_response(
+                    cache_file=cache_file, obj=obj
+                )
+            except CachePartitionFile.DoesNotExist:
+                logger.debug(
+                    'Image "%s" not cached, generating it.', cache_filename
+                )
+                self.page_image_generate(
+                    obj=obj, page_image_kwargs=page_image_kwargs
+                )
+                cache_file = obj.cache_partition.get_file(
+                    filename=cache_filename, use_index=False
+                )
+                response = self.get_page_image_response(
+                    cache_file=cache_file, obj=obj
+                )
+
+        response['ETag'] = etag
+
+        if '_hash' in request.GET:
+            patch_cache_control(
+                response=response,
+                max_age=self.page_image_cache_time_setting.value
+            )
+
+        return response
+
+
+class PageSpriteAPIViewMixin(PageImageAPIViewMixin):
+    """
+    Return the images of a range of pages of a document version combined
+    in a single image. The access to the version is checked once and the
+    layer transformations of all the pages are resolved together.
+    """
+    page_image_task_id_argument = 'document_version_id'
+
+    def get_page_image_cache_filename(self, obj, page_image_kwargs):
+        page_image_kwargs = page_image_kwargs.copy()
+        user = self.get_page_image_user()
+
+        pages = obj.get_pages_sprite_pages(
+            maximum_layer_order=page_image_kwargs['maximum_layer_order'],
+            page_number_first=page_image_kwargs.pop('page_number_first'),
+            page_number_last=page_image_kwargs.pop('page_number_last'),
+            user=user
+        )
+
+        if not pages:
+            raise NotFound
+
+        return obj.get_pages_sprite_cache_filename(
+            pages=pages, user=user, **page_image_kwargs
+        )
+
+    def get_page_image_kwargs(self):
+        result = super().get_page_image_kwargs()
+
+        for name in ('page_number_first', 'page_number_last'):
+            value = self.request.GET.get(name)
+            if value:
+                value = int(value)
+
+            result[name] = value
+
+        return result
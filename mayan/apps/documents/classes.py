@@ -1,15 +1,26 @@
 from __future__ import absolute_import, unicode_literals
 
+from contextlib import ExitStack
+import logging
+from tempfile import NamedTemporaryFile
 import uuid
 
+import PyPDF2
+
+from django.apps import apps
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 from django.utils.text import format_lazy
 
+from mayan.apps.storage.settings import setting_temporary_directory
+
+from .literals import DOCUMENT_VERSION_EXPORT_PDF_HEADER_SEARCH_SIZE
+
 __all__ = (
-    'BaseDocumentFilenameGenerator', 'OriginalDocumentFilenameGenerator',
-    'UUIDDocumentFilenameGenerator'
+    'BaseDocumentFilenameGenerator', 'DocumentVersionExporter',
+    'OriginalDocumentFilenameGenerator', 'UUIDDocumentFilenameGenerator'
 )
+logger = logging.getLogger(name=__name__)
 
 
 class BaseDocumentFilenameGenerator:
@@ -52,6 +63,167 @@ class BaseDocumentFilenameGenerator:
         raise NotImplementedError
 
 
+class DocumentVersionExporter:
+    """
+    Export the pages of a document version as a single PDF file. Pages
+    without transformations whose document file has a PDF intermediate
+    file are copied from it as PDF objects, without rasterizing them.
+    The other pages are rasterized one at a time and appended to a
+    temporary PDF file, so only one page image is held in memory.
+    """
+    def __init__(self, document_version, resolution=None):
+        self.document_version = document_version
+        self.resolution = resolution
+
+    def _get_reader(self, document_file, exit_stack):
+        """
+        Return a PDF reader for the intermediate file of the document
+        file or None if the intermediate file is not a PDF file that can
+        be read.
+        """
+        try:
+            file_object = exit_stack.enter_context(
+                document_file.get_intermediate_file()
+            )
+
+            # The PDF header must be within the first 1024 bytes of the
+            # file. Avoids parsing files of other formats.
+            header = file_object.read(
+                DOCUMENT_VERSION_EXPORT_PDF_HEADER_SEARCH_SIZE
+            )
+            file_object.seek(0)
+
+            if b'%PDF-' not in header:
+                return None
+
+            reader = PyPDF2.PdfFileReader(stream=file_object, strict=False)
+
+            if reader.isEncrypted and not reader.decrypt(password=b''):
+                return None
+
+            # Parse the page tree now to detect errors before copying.
+            reader.getNumPages()
+        except Exception as exception:
+            logger.debug(
+                'Unable to read the intermediate file of document file '
+                '"%s" as PDF, its pages will be rasterized; %s',
+                document_file, exception
+            )
+            return None
+        else:
+            return reader
+
+    def _get_source_page(self, page, exit_stack, readers):
+        """
+        Return the PDF page object to copy for a document version page or
+        None if the page must be rasterized.
+        """
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+        LayerTransformation = apps.get_model(
+            app_label='converter', model_name='LayerTransformation'
+        )
+
+        content_object = page.content_object
+
+        if not isinstance(content_object, DocumentFilePage):
+            return None
+
+        for obj in (page, content_object):
+            if LayerTransformation.objects.get_for_object(as_classes=True, obj=obj):
+                return None
+
+        if content_object.document_file_id not in readers:
+            readers[content_object.document_file_id] = self._get_reader(
+                document_file=content_object.document_file,
+                exit_stack=exit_stack
+            )
+
+        reader = readers[content_object.document_file_id]
+
+        if reader is None or content_object.page_number > reader.getNumPages():
+            return None
+
+        return reader.getPage(content_object.page_number - 1)
+
+    def _rasterize(self, file_object, pages):
+        for index, page in enumerate(pages):
+            page.export(
+                append=index > 0, file_object=file_object,
+                resolution=self.resolution
+            )
+
+    def export(self, file_object):
+        DocumentVersionPage = apps.get_model(
+            app_label='documents', model_name='DocumentVersionPage'
+        )
+
+        pages = list(self.document_version.pages)
+
+        # Only export the version if there is at least one page.
+        if not pages:
+            return
+
+        DocumentVersionPage.prefetch_transformations(pages=pages)
+
+        with ExitStack() as exit_stack:
+            readers = {}
+            source_pages = [
+                self._get_source_page(
+                    exit_stack=exit_stack, page=page, readers=readers
+                ) for page in pages
+            ]
+
+            raster_pages = [
+                page for page, source_page in zip(pages, source_pages)
+                if source_page is None
+            ]
+
+            if len(raster_pages) == len(pages):
+                # Nothing to copy, rasterize directly to the output.
+                self._rasterize(file_object=file_object, pages=pages)
+                return
+
+            if raster_pages:
+                raster_file_object = exit_stack.enter_context(
+                    NamedTemporaryFile(dir=setting_temporary_directory.value)
+                )
+                self._rasterize(
+                    file_object=raster_file_object, pages=raster_pages
+                )
+                raster_file_object.seek(0)
+                raster_reader = PyPDF2.PdfFileReader(
+                    stream=raster_file_object, strict=False
+                )
+
+            writer = PyPDF2.PdfFileWriter()
+            raster_page_index = 0
+
+            for source_page in source_pages:
+                if source_page is None:
+                    writer.addPage(
+                        raster_reader.getPage(raster_page_index)
+                    )
+                    raster_page_index += 1
+                else:
+                    writer.addPage(source_page)
+
+            start_position = file_object.tell()
+
+            try:
+                writer.write(file_object)
+            except Exception as exception:
+                logger.error(
+                    'Error copying the PDF pages of document version "%s", '
+                    'rasterizing all the pages instead; %s',
+                    self.document_version, exception, exc_info=True
+                )
+                file_object.seek(start_position)
+                file_object.truncate()
+                self._rasterize(file_object=file_object, pages=pages)
+
+
 class OriginalDocumentFilenameGenerator(BaseDocumentFilenameGenerator):
     name = 'original'
     label = _('Original')
@@ -23,6 +23,8 @@ DEFAULT_DOCUMENTS_DISPLAY_WIDTH = '3600'
 DEFAULT_DOCUMENTS_FAVORITE_COUNT = 400
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE = 500 * 2 ** 20  # 500 Megabytes
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_TIME = '31556926'
+DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREWARM = False
+DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREWARM_WORKER_COUNT = 2
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS = {
     'location': os.path.join(settings.MEDIA_ROOT, 'document_file_storage')
@@ -36,6 +38,8 @@ DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS = {
 DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE = 65535
 DEFAULT_DOCUMENTS_LIST_THUMBNAIL_WIDTH = '50'
 DEFAULT_DOCUMENTS_PAGE_IMAGE_CACHE_TIME = '31556926'
+DEFAULT_DOCUMENTS_PAGE_IMAGE_SENDFILE_HEADER = None
+DEFAULT_DOCUMENTS_PAGE_IMAGE_SENDFILE_PREFIX = None
 DEFAULT_DOCUMENTS_PREVIEW_HEIGHT = ''
 DEFAULT_DOCUMENTS_PREVIEW_WIDTH = '800'
 DEFAULT_DOCUMENTS_PRINT_HEIGHT = ''
@@ -76,6 +80,7 @@ DEFAULT_LANGUAGE_CODES = (
 DEFAULT_STUB_EXPIRATION_INTERVAL = 60 * 60 * 24  # 24 hours
 DEFAULT_TASK_GENERATE_DOCUMENT_FILE_PAGE_IMAGE_RETRY_DELAY = 5
 DEFAULT_TASK_GENERATE_DOCUMENT_VERSION_PAGE_IMAGE_RETRY_DELAY = 5
+DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME = 'base_image'
 DOCUMENT_FILE_ACTION_PAGES_NEW = 1
 DOCUMENT_FILE_ACTION_PAGES_APPEND = 2
 DOCUMENT_FILE_ACTION_PAGES_KEEP = 3
@@ -85,7 +90,13 @@ DOCUMENT_FILE_ACTION_PAGE_CHOICES = (
     (DOCUMENT_FILE_ACTION_PAGES_KEEP, _('Keep. Do not create a new version and keep the current version pages.')),
 )
 DOCUMENT_IMAGE_TASK_TIMEOUT = 120
+DOCUMENT_PAGES_BULK_CREATE_BATCH_SIZE = 500
 DOCUMENT_VERSION_EXPORT_MIMETYPE = 'application/pdf'
+DOCUMENT_VERSION_EXPORT_PDF_HEADER_SEARCH_SIZE = 1024
+DOCUMENT_VERSION_PAGE_SPRITE_CACHE_FILENAME_TEMPLATE = 'sprite-{}'
+DOCUMENT_VERSION_PAGE_SPRITE_MANIFEST_CACHE_FILENAME_TEMPLATE = '{}-manifest'
+DOCUMENT_VERSION_PAGE_SPRITE_MAXIMUM_HEIGHT = 65500
+DOCUMENT_VERSION_PAGE_SPRITE_MAXIMUM_PAGE_COUNT = 50
 
 IMAGE_ERROR_NO_ACTIVE_VERSION = 'document_no_active_version'
 IMAGE_ERROR_NO_VERSION_PAGES = 'document_no_version_pages'
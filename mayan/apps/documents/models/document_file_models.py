@@ -1,9 +1,12 @@
 import hashlib
 import logging
+import queue
 import shutil
+import threading
 
 from django.apps import apps
-from django.db import models, transaction
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, models, transaction
 from django.urls import reverse
 from django.utils.encoding import force_text
 from django.utils.functional import cached_property
@@ -16,21 +19,28 @@ from mayan.apps.converter.classes import ConverterBase
 from mayan.apps.converter.exceptions import (
     InvalidOfficeFormat, PageCountError
 )
+from mayan.apps.converter.literals import CONVERTER_PDF_PAGE_BATCH_SIZE
 from mayan.apps.events.classes import EventManagerMethodAfter
 from mayan.apps.events.decorators import method_event
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.mimetype.api import get_mimetype
-from mayan.apps.storage.classes import DefinedStorageLazy
+from mayan.apps.storage.classes import DefinedStorageLazy, TeeFile
 
 from ..events import (
     event_document_file_created, event_document_file_deleted,
     event_document_file_downloaded, event_document_file_edited
 )
 from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+    DOCUMENT_PAGES_BULK_CREATE_BATCH_SIZE,
     STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE, STORAGE_NAME_DOCUMENT_FILES
 )
 from ..managers import DocumentFileManager, ValidDocumentFileManager
-from ..settings import setting_hash_block_size
+from ..settings import (
+    setting_display_height, setting_display_width,
+    setting_document_file_page_image_prewarm_worker_count,
+    setting_hash_block_size, setting_preview_height, setting_preview_width
+)
 from ..signals import (
     signal_post_document_created, signal_post_document_file_upload
 )
@@ -161,6 +171,26 @@ class DocumentFile(
             hook_list=cls._pre_save_hooks, func=func, order=order
         )
 
+    def _page_images_prewarm_worker(self, jobs, _close_connection=True):
+        try:
+            while True:
+                try:
+                    page, width, height = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    page.generate_image(height=height, width=width)
+                except Exception as exception:
+                    logger.error(
+                        'Error prewarming the image of page "%s"; %s', page,
+                        exception, exc_info=True
+                    )
+        finally:
+            if _close_connection:
+                # Threads have their own database connection.
+                connection.close()
+
     def __str__(self):
         return self.get_label()
 
@@ -192,14 +222,21 @@ class DocumentFile(
             block_size = -1
 
         if self.exists():
-            hash_object = DocumentFile.hash_function()
             with self.open() as file_object:
-                while (True):
-                    data = file_object.read(block_size)
-                    if not data:
-                        break
+                tee_file = getattr(file_object, 'tee_file', None)
+                if tee_file:
+                    # The file is the copy made while saving it and was not
+                    # changed by the pre open hooks. Use the hash calculated
+                    # during the copy.
+                    hash_object = tee_file.hash_object
+                else:
+                    hash_object = DocumentFile.hash_function()
+                    while (True):
+                        data = file_object.read(block_size)
+                        if not data:
+                            break
 
-                    hash_object.update(data)
+                        hash_object.update(data)
 
             self.checksum = force_text(s=hash_object.hexdigest())
             if save:
@@ -245,6 +282,10 @@ class DocumentFile(
         be in the document storage. This is a diagnostic flag to help users
         detect if the storage has desynchronized (ie: Amazon's S3).
         """
+        if self.__dict__.get('_ingest_file'):
+            # The file was just saved and is being processed.
+            return True
+
         return self.file.storage.exists(self.file.name)
 
     def get_absolute_url(self):
@@ -280,7 +321,9 @@ class DocumentFile(
         cache_filename = 'intermediate_file'
 
         try:
-            cache_file = self.cache_partition.get_file(filename=cache_filename)
+            cache_file = self.cache_partition.get_file(
+                filename=cache_filename, use_index=False
+            )
         except CachePartitionFile.DoesNotExist:
             logger.debug('Intermediate file not found.')
 
@@ -295,7 +338,9 @@ class DocumentFile(
                                 fsrc=pdf_file_object, fdst=file_object
                             )
 
-                        return self.cache_partition.get_file(filename=cache_filename).open()
+                        return self.cache_partition.get_file(
+                            filename=cache_filename, use_index=False
+                        ).open()
             except InvalidOfficeFormat:
                 return self.open()
             except Exception as exception:
@@ -305,7 +350,7 @@ class DocumentFile(
                 )
                 try:
                     cache_file = self.cache_partition.get_file(
-                        filename=cache_filename
+                        filename=cache_filename, use_index=False
                     )
                 except CachePartitionFile.DoesNotExist:
                     """Non fatal, ignore."""
@@ -316,6 +361,9 @@ class DocumentFile(
             logger.debug('Intermediate file found.')
             return cache_file.open()
 
+    def get_intermediate_file_cache_key(self):
+        return 'document_file-{}-intermediate_file'.format(self.uuid)
+
     def get_label(self):
         return self.filename
     get_label.short_description = _('Label')
@@ -349,12 +397,21 @@ class DocumentFile(
     def open(self, raw=False):
         """
         Return a file descriptor to a document file's file irrespective of
-        the storage backend.
+        the storage backend. While a new file is being processed the local
+        copy made while saving it is returned instead.
         """
+        ingest_file = self.__dict__.get('_ingest_file')
+
         if raw:
-            return self.file.storage.open(name=self.file.name)
+            if ingest_file:
+                return ingest_file.copy_open()
+            else:
+                return self.file.storage.open(name=self.file.name)
         else:
-            file_object = self.file.storage.open(name=self.file.name)
+            if ingest_file:
+                file_object = ingest_file.copy_open()
+            else:
+                file_object = self.file.storage.open(name=self.file.name)
 
             result = DocumentFile._execute_hooks(
                 hook_list=DocumentFile._pre_open_hooks,
@@ -380,18 +437,165 @@ class DocumentFile(
                 app_label='documents', model_name='DocumentFilePage'
             )
 
+            # Hide circular imports.
+            from mayan.apps.acls.models import EffectiveAccessControlList
+            from mayan.apps.acls.settings import setting_effective_acls_enable
+            from mayan.apps.dynamic_search.tasks import task_index_instances
+
             self.pages.all().delete()
 
-            for page_number in range(detected_pages):
-                DocumentFilePage.objects.create(
-                    document_file=self, page_number=page_number + 1
+            # Bulk inserts don't send the model signals. The effective ACLs
+            # of the pages are created in bulk and the pages are indexed for
+            # search with a single task.
+            DocumentFilePage.objects.bulk_create(
+                batch_size=DOCUMENT_PAGES_BULK_CREATE_BATCH_SIZE, objs=[
+                    DocumentFilePage(
+                        document_file=self, page_number=page_number + 1
+                    ) for page_number in range(detected_pages)
+                ]
+            )
+
+            if setting_effective_acls_enable.value:
+                EffectiveAccessControlList.objects.update_for_queryset(
+                    queryset=self.file_pages.all()
                 )
 
+            task_index_instances.apply_async(
+                kwargs={
+                    'app_label': DocumentFilePage._meta.app_label,
+                    'id_list': list(
+                        self.file_pages.values_list('pk', flat=True)
+                    ),
+                    'model_name': DocumentFilePage._meta.model_name
+                }
+            )
+
             if save:
                 self.save()
 
             return detected_pages
 
+    def page_images_generate(
+        self, batch_size=CONVERTER_PDF_PAGE_BATCH_SIZE, page_numbers=None
+    ):
+        """
+        Create the base image cache files of the pages that don't have one.
+        Consecutive pages are rendered in batches with a single call to the
+        converter. Returns the number of page images created.
+        """
+        pages = self.file_pages.all()
+        if page_numbers is not None:
+            pages = pages.filter(page_number__in=page_numbers)
+
+        pages = {page.page_number: page for page in pages}
+
+        partition_names_cached = set(
+            CachePartitionFile.objects.filter(
+                filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+                partition__cache=self.cache,
+                partition__name__in=[page.uuid for page in pages.values()]
+            ).values_list('partition__name', flat=True)
+        )
+
+        # Group the pages without an image in runs of consecutive page
+        # numbers.
+        page_ranges = []
+        for page_number in sorted(pages):
+            if pages[page_number].uuid in partition_names_cached:
+                continue
+
+            if page_ranges:
+                first_page_number, last_page_number = page_ranges[-1]
+                if last_page_number == page_number - 1 and page_number - first_page_number < batch_size:
+                    page_ranges[-1][1] = page_number
+                    continue
+
+            page_ranges.append([page_number, page_number])
+
+        page_count = 0
+
+        if page_ranges:
+            with self.get_intermediate_file() as file_object:
+                converter = ConverterBase.get_converter_class()(
+                    cache_key=self.get_intermediate_file_cache_key(),
+                    file_object=file_object
+                )
+
+                for first_page_number, last_page_number in page_ranges:
+                    for page_number, image_buffer in converter.get_pages(
+                        first_page_number=first_page_number - 1,
+                        last_page_number=last_page_number - 1
+                    ):
+                        page = pages[page_number + 1]
+                        cache_partition = page.cache_partition
+
+                        # Skip images created by a concurrent request since
+                        # the page list was evaluated.
+                        if cache_partition.files.filter(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME).exists():
+                            continue
+
+                        with cache_partition.create_file(filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME) as cache_file_object:
+                            cache_file_object.write(image_buffer.getvalue())
+
+                        page_count += 1
+
+        return page_count
+
+    def page_images_prewarm(self, worker_count=None):
+        """
+        Create the cache files of the images of the file pages and of the
+        document version pages that show them, at the display and preview
+        sizes. The base images are rendered first in batches, the sized
+        images are then created from the base images by up to
+        `worker_count` threads.
+        """
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+        DocumentVersionPage = apps.get_model(
+            app_label='documents', model_name='DocumentVersionPage'
+        )
+
+        if worker_count is None:
+            worker_count = setting_document_file_page_image_prewarm_worker_count.value
+
+        self.page_images_generate()
+
+        file_pages = list(self.file_pages.all())
+        version_pages = DocumentVersionPage.objects.filter(
+            content_type=ContentType.objects.get_for_model(
+                model=DocumentFilePage
+            ), object_id__in=[page.pk for page in file_pages]
+        )
+
+        sizes = (
+            (setting_display_width.value, setting_display_height.value),
+            (setting_preview_width.value, setting_preview_height.value)
+        )
+
+        jobs = queue.Queue()
+        for page in file_pages + list(version_pages):
+            for width, height in sizes:
+                jobs.put((page, width, height))
+
+        if worker_count > 1:
+            threads = [
+                threading.Thread(
+                    kwargs={'jobs': jobs},
+                    target=self._page_images_prewarm_worker
+                ) for index in range(min(worker_count, jobs.qsize()))
+            ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+        else:
+            self._page_images_prewarm_worker(
+                jobs=jobs, _close_connection=False
+            )
+
     @property
     def pages(self):
         DocumentFilePage = apps.get_model(
@@ -407,6 +611,7 @@ class DocumentFile(
         """
         user = kwargs.pop('_user', self.__dict__.pop('_event_actor', None))
         new_document_file = not self.pk
+        tee_file = None
 
         if new_document_file:
             logger.info('Creating new file for document: %s', self.document)
@@ -418,6 +623,17 @@ class DocumentFile(
                 }
             )
 
+            if self.file and not self.file._committed:
+                # Copy the file to a local file while it is saved to the
+                # storage. The checksum, MIME type, and page count are
+                # obtained from the copy instead of reading the file back
+                # from the storage.
+                tee_file = TeeFile(
+                    file_object=self.file.file,
+                    hash_function=DocumentFile.hash_function
+                )
+                self.file.file = tee_file
+
         try:
             with transaction.atomic():
                 self.execute_pre_save_hooks()
@@ -428,6 +644,18 @@ class DocumentFile(
 
                 super().save(*args, **kwargs)
 
+                if tee_file:
+                    tee_file.copy_finish(
+                        block_size=setting_hash_block_size.value or -1
+                    )
+                    if tee_file.is_complete:
+                        self._ingest_file = tee_file
+                    else:
+                        logger.debug(
+                            'Incomplete copy of the new file of document: '
+                            '%s; using the storage.', self.document
+                        )
+
                 DocumentFile._execute_hooks(
                     hook_list=DocumentFile._post_save_hooks,
                     instance=self
@@ -475,6 +703,10 @@ class DocumentFile(
                     signal_post_document_created.send(
                         instance=self.document, sender=Document
                     )
+        finally:
+            if tee_file:
+                self.__dict__.pop('_ingest_file', None)
+                tee_file.copy_close()
 
     def save_to_file(self, file_object):
         """
@@ -17,7 +17,9 @@ from mayan.apps.converter.transformations import (
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
+from ..literals import (
+    DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME, DOCUMENT_IMAGE_TASK_TIMEOUT
+)
 from ..managers import DocumentFilePageManager, ValidDocumentFilePageManager
 from ..settings import (
     setting_display_width, setting_display_height, setting_zoom_max_level,
@@ -56,6 +58,14 @@ class DocumentFilePage(PagedModelMixin, models.Model):
     objects = DocumentFilePageManager()
     valid = ValidDocumentFilePageManager()
 
+    @staticmethod
+    def prefetch_transformations(pages):
+        """
+        Resolve the stored transformations of several pages at once. Used
+        by the views that display the images of many pages.
+        """
+        LayerTransformation.objects.prefetch_for_objects(objects=pages)
+
     def __str__(self):
         return self.get_label()
 
@@ -88,7 +98,8 @@ class DocumentFilePage(PagedModelMixin, models.Model):
                     _combined_cache_filename=combined_cache_filename
                 )
                 lock = LockingBackend.get_backend().acquire_lock(
-                    name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+                    blocking=True, name=lock_name,
+                    timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
                 )
         except Exception:
             raise
@@ -98,7 +109,7 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             try:
                 try:
                     self.cache_partition.get_file(
-                        filename=combined_cache_filename
+                        filename=combined_cache_filename, use_index=False
                     )
                 except CachePartitionFile.DoesNotExist:
                     logger.debug(
@@ -214,17 +225,20 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         return transformation_list
 
     def get_image(self, transformations=None):
-        cache_filename = 'base_image'
+        cache_filename = DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
-            cache_file = self.cache_partition.get_file(filename=cache_filename)
+            cache_file = self.cache_partition.get_file(
+                filename=cache_filename, use_index=False
+            )
         except CachePartitionFile.DoesNotExist:
             logger.debug('Page cache file "%s" not found', cache_filename)
 
             try:
                 with self.document_file.get_intermediate_file() as file_object:
                     converter = ConverterBase.get_converter_class()(
+                        cache_key=self.document_file.get_intermediate_file_cache_key(),
                         file_object=file_object
                     )
                     converter.seek_page(page_number=self.page_number - 1)
@@ -236,8 +250,9 @@ class DocumentFilePage(PagedModelMixin, models.Model):
                         file_object.write(page_image.getvalue())
 
                     # Apply runtime transformations
-                    for transformation in transformations or ():
-                        converter.transform(transformation=transformation)
+                    converter.transform_many(
+                        transformations=transformations or ()
+                    )
 
                     return converter.get_page()
             except Exception as exception:
@@ -256,13 +271,12 @@ class DocumentFilePage(PagedModelMixin, models.Model):
                     file_object=file_object
                 )
 
-                converter.seek_page(page_number=0)
-
                 # This code is also repeated below to allow using a context
                 # manager with cache_file.open and close it automatically.
                 # Apply runtime transformations
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
+                converter.transform_many(
+                    transformations=transformations or ()
+                )
 
                 return converter.get_page()
 
@@ -29,7 +29,9 @@ from ..managers import (
     DocumentManager, RecentlyCreatedDocumentManager, TrashCanManager,
     ValidDocumentManager
 )
+from ..settings import setting_document_file_page_image_prewarm
 from ..signals import signal_post_document_type_change
+from ..tasks import task_document_file_page_images_prewarm
 
 from .document_type_models import DocumentType
 from .mixins import HooksModelMixin
@@ -266,7 +268,15 @@ class Document(
                     _user=_user
                 )
             elif action == DOCUMENT_FILE_ACTION_PAGES_KEEP:
-                return document_file
+                # Keep the pages of the current version.
+                pass
+
+            if setting_document_file_page_image_prewarm.value:
+                # Queue after the version pages are created to prewarm
+                # their images too.
+                task_document_file_page_images_prewarm.apply_async(
+                    kwargs={'document_file_id': document_file.pk}
+                )
 
             return document_file
 
@@ -1,12 +1,17 @@
+import hashlib
+from io import BytesIO
+import json
 import logging
 import os
 
 from furl import furl
+from PIL import Image
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.db import models, transaction
 from django.urls import reverse
+from django.utils.encoding import force_bytes
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
@@ -15,15 +20,23 @@ from mayan.apps.converter.exceptions import AppImageError
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.events.classes import EventManagerMethodAfter, EventManagerSave
 from mayan.apps.events.decorators import method_event
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.messaging.models import Message
 from mayan.apps.storage.models import DownloadFile
 from mayan.apps.templating.classes import Template
 
+from ..classes import DocumentVersionExporter
 from ..events import (
     event_document_version_created, event_document_version_deleted,
     event_document_version_edited, event_document_version_exported
 )
 from ..literals import (
+    DOCUMENT_IMAGE_TASK_TIMEOUT, DOCUMENT_PAGES_BULK_CREATE_BATCH_SIZE,
+    DOCUMENT_VERSION_PAGE_SPRITE_CACHE_FILENAME_TEMPLATE,
+    DOCUMENT_VERSION_PAGE_SPRITE_MANIFEST_CACHE_FILENAME_TEMPLATE,
+    DOCUMENT_VERSION_PAGE_SPRITE_MAXIMUM_HEIGHT,
+    DOCUMENT_VERSION_PAGE_SPRITE_MAXIMUM_PAGE_COUNT,
     IMAGE_ERROR_NO_VERSION_PAGES,
     STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE
 )
@@ -121,14 +134,9 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
         return super().delete(*args, **kwargs)
 
     def export(self, file_object):
-        first_page = self.pages.first()
-
-        # Only export the version if there is at least one page.
-        if first_page:
-            first_page.export(file_object=file_object)
-
-            for page in self.pages[1:]:
-                page.export(append=True, file_object=file_object)
+        DocumentVersionExporter(document_version=self).export(
+            file_object=file_object
+        )
 
     def export_to_download_file(self, organization_installation_url='', user=None):
         download_file = DownloadFile(
@@ -177,6 +185,124 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
                 }
             )
 
+    def generate_pages_sprite(
+        self, page_number_first=None, page_number_last=None, user=None,
+        **kwargs
+    ):
+        """
+        Combine the images of a range of pages into a single image, one
+        page below the other. The image is stored in the cache partition of
+        the version along with a manifest of the position of each page.
+        Pages that don't fit in the maximum height are left out.
+        """
+        pages = self.get_pages_sprite_pages(
+            maximum_layer_order=kwargs.get('maximum_layer_order'),
+            page_number_first=page_number_first,
+            page_number_last=page_number_last, user=user
+        )
+
+        if not pages:
+            raise AppImageError(error_name=IMAGE_ERROR_NO_VERSION_PAGES)
+
+        cache_filename = self.get_pages_sprite_cache_filename(
+            pages=pages, user=user, **kwargs
+        )
+        manifest_cache_filename = DOCUMENT_VERSION_PAGE_SPRITE_MANIFEST_CACHE_FILENAME_TEMPLATE.format(
+            cache_filename
+        )
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            blocking=True, name='document_version_pages_sprite_{}_{}'.format(
+                self.pk, cache_filename
+            ), timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+        )
+        try:
+            # The sprite image and its manifest are cached as separate files
+            # that can be pruned independently. Both are regenerated if
+            # either is missing and the survivor is deleted first to avoid
+            # creating a duplicate cache file entry.
+            cache_files = []
+            for filename in (cache_filename, manifest_cache_filename):
+                try:
+                    cache_files.append(
+                        self.cache_partition.get_file(
+                            filename=filename, use_index=False
+                        )
+                    )
+                except CachePartitionFile.DoesNotExist:
+                    """Missing file, regenerate the pair."""
+
+            if len(cache_files) < 2:
+                logger.debug(
+                    'Pages sprite cache file "%s" not found, generating it.',
+                    cache_filename
+                )
+                for cache_file in cache_files:
+                    cache_file.delete()
+
+                entries = []
+                sprite_format = None
+                sprite_height = 0
+                sprite_width = 0
+
+                # Only the headers of the page images are read to calculate
+                # the size of the sprite.
+                for page in pages:
+                    page_cache_file = page.cache_partition.get_file(
+                        filename=page.generate_image(user=user, **kwargs),
+                        use_index=False
+                    )
+                    with page_cache_file.open() as file_object:
+                        image = Image.open(fp=file_object)
+                        width, height = image.size
+                        sprite_format = sprite_format or image.format
+
+                    if entries and sprite_height + height > DOCUMENT_VERSION_PAGE_SPRITE_MAXIMUM_HEIGHT:
+                        break
+
+                    entries.append(
+                        {
+                            'cache_file': page_cache_file,
+                            'height': height,
+                            'id': page.pk,
+                            'page_number': page.page_number,
+                            'width': width,
+                            'x': 0,
+                            'y': sprite_height
+                        }
+                    )
+                    sprite_height += height
+                    sprite_width = max(sprite_width, width)
+
+                sprite = Image.new(
+                    color='white', mode='RGB',
+                    size=(sprite_width, sprite_height)
+                )
+                for entry in entries:
+                    with entry.pop('cache_file').open() as file_object:
+                        sprite.paste(
+                            box=(entry['x'], entry['y']),
+                            im=Image.open(fp=file_object)
+                        )
+
+                image_buffer = BytesIO()
+                sprite.save(image_buffer, format=sprite_format)
+
+                with self.cache_partition.create_file(filename=cache_filename) as file_object:
+                    file_object.write(image_buffer.getvalue())
+
+                manifest = {
+                    'height': sprite_height, 'pages': entries,
+                    'width': sprite_width
+                }
+
+                with self.cache_partition.create_file(filename=manifest_cache_filename) as file_object:
+                    file_object.write(force_bytes(s=json.dumps(obj=manifest)))
+        finally:
+            lock.release()
+
+        return cache_filename
+
     def get_absolute_url(self):
         return reverse(
             viewname='documents:document_version_preview', kwargs={
@@ -218,6 +344,74 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
             )
     get_label.short_description = _('Label')
 
+    def get_pages_sprite_cache_filename(self, pages, user=None, **kwargs):
+        """
+        The name of the sprite is a digest of the IDs of the pages and of
+        the names of their cached images, which include the digests of the
+        transformations of each page.
+        """
+        hash_object = hashlib.sha256()
+
+        for page in pages:
+            transformation_list = page.get_combined_transformation_list(
+                user=user, **kwargs
+            )
+            hash_object.update(
+                force_bytes(
+                    s='{}-{}\n'.format(
+                        page.pk, page.get_combined_cache_filename(
+                            _transformation_list=transformation_list
+                        )
+                    )
+                )
+            )
+
+        return DOCUMENT_VERSION_PAGE_SPRITE_CACHE_FILENAME_TEMPLATE.format(
+            hash_object.hexdigest()
+        )
+
+    def get_pages_sprite_manifest(self, cache_filename):
+        cache_file = self.cache_partition.get_file(
+            filename=DOCUMENT_VERSION_PAGE_SPRITE_MANIFEST_CACHE_FILENAME_TEMPLATE.format(
+                cache_filename
+            )
+        )
+        with cache_file.open() as file_object:
+            return json.loads(s=file_object.read())
+
+    def get_pages_sprite_pages(
+        self, maximum_layer_order=None, page_number_first=None,
+        page_number_last=None, user=None
+    ):
+        """
+        Return the pages of a sprite with their transformations resolved.
+        The number of pages is limited.
+        """
+        DocumentVersionPage = apps.get_model(
+            app_label='documents', model_name='DocumentVersionPage'
+        )
+
+        page_number_first = page_number_first or 1
+        page_number_maximum = page_number_first + DOCUMENT_VERSION_PAGE_SPRITE_MAXIMUM_PAGE_COUNT - 1
+
+        if page_number_last:
+            page_number_last = min(page_number_last, page_number_maximum)
+        else:
+            page_number_last = page_number_maximum
+
+        pages = list(
+            self.pages.filter(
+                page_number__gte=page_number_first,
+                page_number__lte=page_number_last
+            )
+        )
+
+        DocumentVersionPage.prefetch_transformations(
+            maximum_layer_order=maximum_layer_order, pages=pages, user=user
+        )
+
+        return pages
+
     def get_source_content_object_dictionary_list(self):
         content_object_dictionary_list = []
 
@@ -257,24 +451,58 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
         return queryset.filter(pk__in=self.version_pages.all())
 
     def pages_remap(self, annotated_content_object_list=None, _user=None):
+        """
+        Replace the pages of the version. The new pages are inserted in
+        bulk, a single edited event is committed for the version, their
+        effective ACLs are created in bulk and a single task indexes the
+        new pages for search. The remap signal is sent after all the pages
+        exist.
+        """
+        # Hide circular imports.
+        from mayan.apps.acls.models import EffectiveAccessControlList
+        from mayan.apps.acls.settings import setting_effective_acls_enable
+        from mayan.apps.dynamic_search.tasks import task_index_instances
+
         DocumentVersionPage = apps.get_model(
             app_label='documents', model_name='DocumentVersionPage'
         )
 
-        for page in self.pages.all():
-            page.delete()
+        with transaction.atomic():
+            for page in self.pages.all():
+                page.delete()
+
+            if not annotated_content_object_list:
+                annotated_content_object_list = ()
+
+            version_pages = DocumentVersionPage.objects.bulk_create(
+                batch_size=DOCUMENT_PAGES_BULK_CREATE_BATCH_SIZE, objs=[
+                    DocumentVersionPage(
+                        document_version=self,
+                        content_object=content_object_entry['content_object'],
+                        page_number=content_object_entry['page_number']
+                    ) for content_object_entry in annotated_content_object_list
+                ]
+            )
 
-        if not annotated_content_object_list:
-            annotated_content_object_list = ()
+            if version_pages:
+                event_document_version_edited.commit(
+                    action_object=self.document, actor=_user, target=self
+                )
 
-        for content_object_entry in annotated_content_object_list:
-            version_page = DocumentVersionPage(
-                document_version=self,
-                content_object=content_object_entry['content_object'],
-                page_number=content_object_entry['page_number']
-            )
-            version_page._event_actor = _user
-            version_page.save()
+                if setting_effective_acls_enable.value:
+                    EffectiveAccessControlList.objects.update_for_queryset(
+                        queryset=self.version_pages.all()
+                    )
+
+                task_index_instances.apply_async(
+                    kwargs={
+                        'app_label': DocumentVersionPage._meta.app_label,
+                        'id_list': list(
+                            self.version_pages.values_list('pk', flat=True)
+                        ),
+                        'model_name': DocumentVersionPage._meta.model_name
+                    }
+                )
 
         signal_post_document_version_remap.send(
             sender=DocumentVersion, instance=self
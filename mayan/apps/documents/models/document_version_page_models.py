@@ -1,4 +1,5 @@
 import logging
+import shutil
 
 from furl import furl
 from PIL import Image
@@ -77,6 +78,35 @@ class DocumentVersionPage(
     objects = models.Manager()
     valid = ValidDocumentVersionPageManager()
 
+    @staticmethod
+    def prefetch_transformations(pages, maximum_layer_order=None, user=None):
+        """
+        Resolve the stored transformations of several pages and of their
+        content objects at once. Used by the views that display the images
+        of many pages.
+        """
+        pages = list(pages)
+        models.prefetch_related_objects(pages, 'content_object')
+
+        content_objects = [
+            page.content_object for page in pages if page.content_object
+        ]
+
+        if maximum_layer_order is None and user is None:
+            LayerTransformation.objects.prefetch_for_objects(
+                objects=pages + content_objects
+            )
+        else:
+            # The images of the content objects are generated without
+            # user or layer restrictions.
+            LayerTransformation.objects.prefetch_for_objects(
+                objects=content_objects
+            )
+            LayerTransformation.objects.prefetch_for_objects(
+                maximum_layer_order=maximum_layer_order, objects=pages,
+                user=user
+            )
+
     def __str__(self):
         return self.get_label()
 
@@ -101,7 +131,7 @@ class DocumentVersionPage(
             resolution = 300.0
 
         cache_filename = self.generate_image()
-        with self.cache_partition.get_file(filename=cache_filename).open() as image_file_object:
+        with self.cache_partition.get_file(filename=cache_filename, use_index=False).open() as image_file_object:
             Image.open(fp=image_file_object).save(
                 append=append, format='PDF', fp=file_object,
                 resolution=resolution
@@ -122,7 +152,7 @@ class DocumentVersionPage(
         content_object_lock_name = self.content_object.get_lock_name(user=user)
         try:
             content_object_lock = LockingBackend.get_backend().acquire_lock(
-                name=content_object_lock_name,
+                blocking=True, name=content_object_lock_name,
                 timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
             )
         except Exception:
@@ -134,7 +164,8 @@ class DocumentVersionPage(
             try:
                 if _acquire_lock:
                     lock = LockingBackend.get_backend().acquire_lock(
-                        name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+                        blocking=True, name=lock_name,
+                        timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
                     )
             except Exception:
                 raise
@@ -144,7 +175,7 @@ class DocumentVersionPage(
                 try:
                     try:
                         self.cache_partition.get_file(
-                            filename=combined_cache_filename
+                            filename=combined_cache_filename, use_index=False
                         )
                     except CachePartitionFile.DoesNotExist:
                         logger.debug(
@@ -284,7 +315,9 @@ class DocumentVersionPage(
         logger.debug('Page cache filename: %s', cache_filename)
 
         try:
-            cache_file = self.cache_partition.get_file(filename=cache_filename)
+            cache_file = self.cache_partition.get_file(
+                filename=cache_filename, use_index=False
+            )
         except CachePartitionFile.DoesNotExist:
             logger.debug('Page cache version "%s" not found', cache_filename)
 
@@ -293,25 +326,27 @@ class DocumentVersionPage(
                     _acquire_lock=False
                 )
                 content_object_cache_file = self.content_object.cache_partition.get_file(
-                    filename=content_object_cache_filename
+                    filename=content_object_cache_filename, use_index=False
                 )
 
                 with content_object_cache_file.open() as file_object:
+                    # The content object image is already encoded in the
+                    # output format, copy it as is.
+                    with self.cache_partition.create_file(filename=cache_filename) as cache_file_object:
+                        shutil.copyfileobj(
+                            fsrc=file_object, fdst=cache_file_object
+                        )
+
+                    file_object.seek(0)
+
                     converter = ConverterBase.get_converter_class()(
                         file_object=file_object
                     )
-                    converter.seek_page(page_number=0)
-
-                    page_image = converter.get_page()
-
-                    # Since open "wb+" doesn't create versions, create it
-                    # explicitly.
-                    with self.cache_partition.create_file(filename=cache_filename) as file_object:
-                        file_object.write(page_image.getvalue())
 
                     # Apply runtime transformations.
-                    for transformation in transformations or ():
-                        converter.transform(transformation=transformation)
+                    converter.transform_many(
+                        transformations=transformations or ()
+                    )
 
                     return converter.get_page()
             except Exception as exception:
@@ -330,13 +365,12 @@ class DocumentVersionPage(
                     file_object=file_object
                 )
 
-                converter.seek_page(page_number=0)
-
                 # This code is also repeated below to allow using a context
                 # manager with cache_version.open and close it automatically.
                 # Apply runtime transformations.
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
+                converter.transform_many(
+                    transformations=transformations or ()
+                )
 
                 return converter.get_page()
 
@@ -26,10 +26,18 @@ queue_converter.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_page_image_generate',
     label=_('Generate document file page image')
 )
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_page_images_prewarm',
+    label=_('Prewarm the page images of a document file')
+)
 queue_converter.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_version_page_image_generate',
     label=_('Generate document version page image')
 )
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_version_pages_sprite_generate',
+    label=_('Generate the pages sprite of a document version')
+)
 
 queue_documents.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_trash_can_empty',
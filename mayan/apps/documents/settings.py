@@ -9,9 +9,13 @@ from .literals import (
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_TIME,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREWARM,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREWARM_WORKER_COUNT,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_HASH_BLOCK_SIZE, DEFAULT_DOCUMENTS_LIST_THUMBNAIL_WIDTH,
+    DEFAULT_DOCUMENTS_PAGE_IMAGE_SENDFILE_HEADER,
+    DEFAULT_DOCUMENTS_PAGE_IMAGE_SENDFILE_PREFIX,
     DEFAULT_DOCUMENTS_PREVIEW_HEIGHT, DEFAULT_DOCUMENTS_PREVIEW_WIDTH,
     DEFAULT_DOCUMENTS_PRINT_HEIGHT, DEFAULT_DOCUMENTS_PRINT_WIDTH,
     DEFAULT_DOCUMENTS_RECENTLY_ACCESSED_COUNT,
@@ -64,6 +68,22 @@ setting_document_file_page_image_cache_time = namespace.add_setting(
         '1 year.'
     )
 )
+setting_document_file_page_image_prewarm = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREWARM,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_PREWARM', help_text=_(
+        'Render the images of all the pages of new document files at the '
+        'display and preview sizes in a single background task after '
+        'upload.'
+    )
+)
+setting_document_file_page_image_prewarm_worker_count = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_PREWARM_WORKER_COUNT,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_PREWARM_WORKER_COUNT',
+    help_text=_(
+        'Maximum number of page images rendered in parallel by the page '
+        'image prewarm task of a document file.'
+    )
+)
 setting_document_file_storage_backend = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND,
     global_name='DOCUMENTS_FILE_STORAGE_BACKEND', help_text=_(
@@ -113,6 +133,23 @@ setting_language_codes = namespace.add_setting(
     default=DEFAULT_LANGUAGE_CODES, global_name='DOCUMENTS_LANGUAGE_CODES',
     help_text=_('List of supported document languages. In ISO639-3 format.')
 )
+setting_page_image_sendfile_header = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_PAGE_IMAGE_SENDFILE_HEADER,
+    global_name='DOCUMENTS_PAGE_IMAGE_SENDFILE_HEADER', help_text=_(
+        'Name of the header used to let the web server send the cached '
+        'page images, for example "X-Sendfile" or "X-Accel-Redirect". '
+        'Only works when the page image caches are stored in the local '
+        'filesystem. When empty, the images are sent by the application.'
+    )
+)
+setting_page_image_sendfile_prefix = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_PAGE_IMAGE_SENDFILE_PREFIX,
+    global_name='DOCUMENTS_PAGE_IMAGE_SENDFILE_PREFIX', help_text=_(
+        'Text added before the absolute path of the cached page image in '
+        'the send file header. Used with "X-Accel-Redirect" to point to an '
+        'internal location of the web server, for example "/protected".'
+    )
+)
 setting_document_version_page_image_cache_maximum_size = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
     global_name='DOCUMENTS_VERSION_PAGE_IMAGE_CACHE_MAXIMUM_SIZE',
@@ -86,6 +86,16 @@ def task_document_file_page_image_generate(
         raise self.retry(exc=exception)
 
 
+@app.task(ignore_result=True)
+def task_document_file_page_images_prewarm(document_file_id):
+    DocumentFile = apps.get_model(
+        app_label='documents', model_name='DocumentFile'
+    )
+
+    document_file = DocumentFile.objects.get(pk=document_file_id)
+    document_file.page_images_prewarm()
+
+
 @app.task(
     bind=True, default_retry_delay=UPLOAD_NEW_VERSION_RETRY_DELAY,
     ignore_result=True
@@ -220,6 +230,35 @@ def task_document_version_export(
     )
 
 
+@app.task(
+    bind=True,
+    default_retry_delay=setting_task_document_version_page_image_generate_retry_delay.value
+)
+def task_document_version_pages_sprite_generate(
+    self, document_version_id, user_id=None, **kwargs
+):
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    document_version = DocumentVersion.objects.get(pk=document_version_id)
+    try:
+        return document_version.generate_pages_sprite(user=user, **kwargs)
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate the pages sprite for '
+            'document id: %d, document version id: %d. Retrying.',
+            document_version.document_id, document_version.pk
+        )
+        raise self.retry(exc=exception)
+
+
 # Document version page
 
 @app.task(
@@ -169,13 +169,13 @@ class DocumentVersionPageAPIViewTestMixin:
             }
         )
 
-    def _request_test_document_version_page_image_api_view(self):
+    def _request_test_document_version_page_image_api_view(self, headers=None):
         return self.get(
             viewname='rest_api:documentversionpage-image', kwargs={
                 'document_id': self.test_document.pk,
                 'document_version_id': self.test_document_version.pk,
                 'document_version_page_id': self.test_document_version_page.pk
-            }
+            }, headers=headers
         )
 
     def _request_test_document_version_page_list_api_view(self):
@@ -186,6 +186,22 @@ class DocumentVersionPageAPIViewTestMixin:
             }
         )
 
+    def _request_test_document_version_page_sprite_api_view(self):
+        return self.get(
+            viewname='rest_api:documentversionpage-sprite', kwargs={
+                'document_id': self.test_document.pk,
+                'document_version_id': self.test_document_version.pk
+            }, query={'width': 100}
+        )
+
+    def _request_test_document_version_page_sprite_image_api_view(self):
+        return self.get(
+            viewname='rest_api:documentversionpage-sprite-image', kwargs={
+                'document_id': self.test_document.pk,
+                'document_version_id': self.test_document_version.pk
+            }, query={'width': 100}
+        )
+
 
 class DocumentVersionTestMixin:
     def _create_test_document_version(self):
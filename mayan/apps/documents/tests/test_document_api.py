@@ -6,7 +6,7 @@ from ..events import (
     event_document_created, event_document_edited,
     event_document_file_created, event_document_file_edited,
     event_document_type_changed, event_document_version_created,
-    event_document_version_page_created
+    event_document_version_edited
 )
 from ..models.document_models import Document
 from ..models.document_type_models import DocumentType
@@ -350,17 +350,11 @@ class DocumentAPIViewTestCase(
         self.assertEqual(events[3].target, self.test_document.version_active)
         self.assertEqual(events[3].verb, event_document_version_created.id)
 
-        # Document version page created
+        # Document version pages created
 
         self.assertEqual(
             events[4].actor, self._test_case_user
         )
-        self.assertEqual(
-            events[4].action_object, self.test_document.version_active
-        )
-        self.assertEqual(
-            events[4].target, self.test_document.version_active.pages.first()
-        )
-        self.assertEqual(
-            events[4].verb, event_document_version_page_created.id
-        )
+        self.assertEqual(events[4].action_object, self.test_document)
+        self.assertEqual(events[4].target, self.test_document.version_active)
+        self.assertEqual(events[4].verb, event_document_version_edited.id)
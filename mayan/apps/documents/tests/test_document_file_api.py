@@ -5,7 +5,7 @@ from mayan.apps.rest_api.tests.base import BaseAPITestCase
 from ..events import (
     event_document_file_created, event_document_file_deleted,
     event_document_file_edited, event_document_file_downloaded,
-    event_document_version_created, event_document_version_page_created
+    event_document_version_created, event_document_version_edited
 )
 from ..permissions import (
     permission_document_file_delete, permission_document_file_download,
@@ -240,7 +240,7 @@ class DocumentFileAPIViewTestCase(
         self.assertEqual(events[2].target, test_document_version)
         self.assertEqual(events[2].verb, event_document_version_created.id)
 
-        self.assertEqual(events[3].action_object, test_document_version)
+        self.assertEqual(events[3].action_object, self.test_document)
         self.assertEqual(events[3].actor, self._test_case_user)
-        self.assertEqual(events[3].target, test_document_version.pages.first())
-        self.assertEqual(events[3].verb, event_document_version_page_created.id)
+        self.assertEqual(events[3].target, test_document_version)
+        self.assertEqual(events[3].verb, event_document_version_edited.id)
@@ -1,7 +1,12 @@
 from pathlib import Path
 
+from mayan.apps.file_caching.models import CachePartitionFile
+
+from ..literals import DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME
+from ..settings import setting_display_height, setting_display_width
+
 from .base import GenericDocumentTestCase
-from .literals import TEST_SMALL_DOCUMENT_CHECKSUM
+from .literals import TEST_PDF_DOCUMENT_FILENAME, TEST_SMALL_DOCUMENT_CHECKSUM
 
 
 class DocumentFileTestCase(GenericDocumentTestCase):
@@ -48,3 +53,59 @@ class DocumentFileTestCase(GenericDocumentTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_document.file_latest.get_absolute_url())
+
+
+class DocumentFilePageImageGenerateTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_PDF_DOCUMENT_FILENAME
+
+    def _get_test_page_image_count(self):
+        return CachePartitionFile.objects.filter(
+            filename=DOCUMENT_FILE_PAGE_BASE_IMAGE_CACHE_FILENAME,
+            partition__name__in=[
+                page.uuid for page in self.test_document_file.file_pages.all()
+            ]
+        ).count()
+
+    def test_page_images_generate(self):
+        page_count = self.test_document_file.file_pages.count()
+
+        self.assertEqual(
+            self.test_document_file.page_images_generate(batch_size=2),
+            page_count
+        )
+        self.assertEqual(self._get_test_page_image_count(), page_count)
+
+    def test_page_images_generate_cached_pages(self):
+        page_count = self.test_document_file.file_pages.count()
+
+        self.test_document_file.file_pages.first().get_image()
+
+        self.assertEqual(
+            self.test_document_file.page_images_generate(), page_count - 1
+        )
+        self.assertEqual(self._get_test_page_image_count(), page_count)
+        self.assertEqual(self.test_document_file.page_images_generate(), 0)
+
+    def test_page_images_generate_page_numbers(self):
+        self.assertEqual(
+            self.test_document_file.page_images_generate(page_numbers=(1,)),
+            1
+        )
+        self.assertEqual(self._get_test_page_image_count(), 1)
+
+    def test_page_images_prewarm(self):
+        self.test_document_file.page_images_prewarm(worker_count=1)
+
+        pages = list(self.test_document_file.file_pages.all())
+        pages.extend(self.test_document.version_active.pages.all())
+
+        for page in pages:
+            cache_filename = page.get_combined_cache_filename(
+                height=setting_display_height.value,
+                width=setting_display_width.value
+            )
+            self.assertTrue(
+                page.cache_partition.files.filter(
+                    filename=cache_filename
+                ).exists()
+            )
@@ -1,5 +1,6 @@
 from rest_framework import status
 
+from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
 
 from ..permissions import permission_document_file_view
@@ -34,6 +35,56 @@ class DocumentFilePageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_file_page_image_api_view_cached_with_access(self):
+        cache_filename = self.test_document_file_page.generate_image()
+        cache_file = self.test_document_file_page.cache_partition.get_file(
+            filename=cache_filename
+        )
+        with cache_file.open() as file_object:
+            image_data = file_object.read()
+
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_file_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), image_data)
+        self.assertEqual(response['ETag'], '"{}"'.format(cache_filename))
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_page_image_api_view_cache_stale_with_access(self):
+        cache_filename = self.test_document_file_page.generate_image()
+        cache_file = self.test_document_file_page.cache_partition.get_file(
+            filename=cache_filename
+        )
+
+        # Delete the cached image as another process would, leaving the
+        # file index entry of this process behind.
+        cache_file.partition.cache.storage.delete(
+            name=cache_file.full_filename
+        )
+        CachePartitionFile.objects.filter(pk=cache_file.pk).delete()
+
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_file_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.getvalue())
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_file_page_image_api_view_no_permission(self):
         self._clear_events()
 
@@ -56,6 +107,25 @@ class DocumentFilePageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_file_page_image_api_view_not_modified_with_access(self):
+        self.grant_access(
+            obj=self.test_document,
+            permission=permission_document_file_view
+        )
+
+        response = self._request_test_document_file_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_api_view(
+            headers={'HTTP_IF_NONE_MATCH': response['ETag']}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_file_page_list_api_view_no_permission(self):
         self._clear_events()
 
@@ -1,9 +1,26 @@
+from tempfile import TemporaryFile
+
+from PIL import Image
+import PyPDF2
+
+from mayan.apps.acls.models import AccessControlList
+from mayan.apps.acls.tests.mixins import EffectiveACLTestMixin
+from mayan.apps.converter.layers import layer_saved_transformations
+from mayan.apps.converter.transformations import TransformationRotate270
+
+from ..events import event_document_version_edited
 from ..literals import (
     DOCUMENT_FILE_ACTION_PAGES_NEW, DOCUMENT_FILE_ACTION_PAGES_APPEND,
     DOCUMENT_FILE_ACTION_PAGES_KEEP
 )
+from ..models.document_file_page_models import DocumentFilePage
+from ..models.document_version_page_models import DocumentVersionPage
+from ..permissions import (
+    permission_document_file_view, permission_document_version_view
+)
 
 from .base import GenericDocumentTestCase
+from .literals import TEST_MULTI_PAGE_TIFF, TEST_PDF_DOCUMENT_FILENAME
 
 
 class DocumentVersionTestCase(GenericDocumentTestCase):
@@ -74,3 +91,190 @@ class DocumentVersionTestCase(GenericDocumentTestCase):
 
     def test_method_get_absolute_url(self):
         self.assertTrue(self.test_document.version_active.get_absolute_url())
+
+
+class DocumentVersionExportTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_PDF_DOCUMENT_FILENAME
+
+    def _get_test_document_version_export_page_count(self):
+        with TemporaryFile() as file_object:
+            self.test_document_version.export(file_object=file_object)
+            file_object.seek(0)
+
+            return PyPDF2.PdfFileReader(
+                stream=file_object, strict=False
+            ).getNumPages()
+
+    def test_export_image_document(self):
+        self.test_document_filename = TEST_MULTI_PAGE_TIFF
+        self._upload_test_document()
+
+        self.assertEqual(
+            self._get_test_document_version_export_page_count(),
+            self.test_document_version.pages.count()
+        )
+
+    def test_export_with_transformations(self):
+        layer_saved_transformations.add_transformation_to(
+            obj=self.test_document_version_page,
+            transformation_class=TransformationRotate270
+        )
+
+        self.assertEqual(
+            self._get_test_document_version_export_page_count(),
+            self.test_document_version.pages.count()
+        )
+
+        # The transformed page was rasterized.
+        self.assertNotEqual(
+            self.test_document_version_page.cache_partition.files.count(), 0
+        )
+
+    def test_export_without_transformations(self):
+        self.assertEqual(
+            self._get_test_document_version_export_page_count(),
+            self.test_document_version.pages.count()
+        )
+
+        # The pages were copied, no page image was generated.
+        for page in self.test_document_version.pages.all():
+            self.assertEqual(page.cache_partition.files.count(), 0)
+
+
+class DocumentVersionPageRemapTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def test_pages_reset(self):
+        file_page_count = self.test_document_file.pages.count()
+
+        self._clear_events()
+
+        self.test_document_version.pages_reset()
+
+        self.assertEqual(
+            self.test_document_version.pages.count(), file_page_count
+        )
+        self.assertEqual(
+            self.test_document_version.page_content_objects,
+            list(self.test_document_file.pages.all())
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), file_page_count + 1)
+
+        # The page deleted events are followed by a single event for the
+        # new pages.
+        self.assertEqual(events.last().action_object, self.test_document)
+        self.assertEqual(events.last().target, self.test_document_version)
+        self.assertEqual(
+            events.last().verb, event_document_version_edited.id
+        )
+
+
+class DocumentVersionPageRemapEffectiveACLTestCase(
+    EffectiveACLTestMixin, GenericDocumentTestCase
+):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def test_page_count_update_effective_acls(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_file_view
+        )
+
+        self.test_document_file.page_count_update()
+
+        self.assertEqual(
+            AccessControlList.objects.restrict_queryset(
+                permission=permission_document_file_view,
+                queryset=DocumentFilePage.objects.all(),
+                user=self._test_case_user
+            ).count(), self.test_document_file.pages.count()
+        )
+
+    def test_pages_reset_effective_acls(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_version_view
+        )
+
+        self.test_document_version.pages_reset()
+
+        self.assertEqual(
+            AccessControlList.objects.restrict_queryset(
+                permission=permission_document_version_view,
+                queryset=DocumentVersionPage.objects.all(),
+                user=self._test_case_user
+            ).count(), self.test_document_version.pages.count()
+        )
+
+
+class DocumentVersionPagesSpriteTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def test_pages_sprite_generate(self):
+        cache_filename = self.test_document_version.generate_pages_sprite(
+            width=100
+        )
+
+        manifest = self.test_document_version.get_pages_sprite_manifest(
+            cache_filename=cache_filename
+        )
+        self.assertEqual(
+            [entry['id'] for entry in manifest['pages']],
+            list(self.test_document_version.pages.values_list('pk', flat=True))
+        )
+        self.assertEqual(manifest['pages'][0]['y'], 0)
+        self.assertEqual(
+            manifest['pages'][1]['y'], manifest['pages'][0]['height']
+        )
+        self.assertEqual(
+            manifest['height'],
+            sum(entry['height'] for entry in manifest['pages'])
+        )
+
+        cache_file = self.test_document_version.cache_partition.get_file(
+            filename=cache_filename
+        )
+        with cache_file.open() as file_object:
+            image = Image.open(fp=file_object)
+            self.assertEqual(
+                image.size, (manifest['width'], manifest['height'])
+            )
+
+    def test_pages_sprite_generate_page_range(self):
+        cache_filename = self.test_document_version.generate_pages_sprite(
+            page_number_first=2, page_number_last=2, width=100
+        )
+
+        manifest = self.test_document_version.get_pages_sprite_manifest(
+            cache_filename=cache_filename
+        )
+        self.assertEqual(len(manifest['pages']), 1)
+        self.assertEqual(manifest['pages'][0]['page_number'], 2)
+
+    def test_pages_sprite_generate_twice(self):
+        cache_filename = self.test_document_version.generate_pages_sprite(
+            width=100
+        )
+        cache_file_count = self.test_document_version.cache_partition.files.count()
+
+        self.assertEqual(
+            self.test_document_version.generate_pages_sprite(width=100),
+            cache_filename
+        )
+        self.assertEqual(
+            self.test_document_version.cache_partition.files.count(),
+            cache_file_count
+        )
+
+    def test_pages_sprite_cache_filename_transformation_change(self):
+        pages = self.test_document_version.get_pages_sprite_pages()
+
+        cache_filename = self.test_document_version.get_pages_sprite_cache_filename(
+            pages=pages
+        )
+
+        self.assertNotEqual(
+            self.test_document_version.get_pages_sprite_cache_filename(
+                pages=pages, rotation=90
+            ), cache_filename
+        )
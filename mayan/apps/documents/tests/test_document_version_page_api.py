@@ -210,6 +210,29 @@ class DocumentVersionPageAPIViewTestCase(
         self.assertEqual(events[0].target, self.test_document_version_page)
         self.assertEqual(events[0].verb, event_document_version_page_edited.id)
 
+    def test_document_version_page_image_api_view_cached_with_access(self):
+        cache_filename = self.test_document_version_page.generate_image()
+        cache_file = self.test_document_version_page.cache_partition.get_file(
+            filename=cache_filename
+        )
+        with cache_file.open() as file_object:
+            image_data = file_object.read()
+
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), image_data)
+        self.assertEqual(response['ETag'], '"{}"'.format(cache_filename))
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_version_page_image_api_view_no_permission(self):
         self._clear_events()
 
@@ -233,6 +256,25 @@ class DocumentVersionPageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_version_page_image_api_view_not_modified_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        response = self._request_test_document_version_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_api_view(
+            headers={'HTTP_IF_NONE_MATCH': response['ETag']}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_version_page_list_api_view_no_permission(self):
         self._clear_events()
 
@@ -260,3 +302,84 @@ class DocumentVersionPageAPIViewTestCase(
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_sprite_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_sprite_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_sprite_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_sprite_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['pages'][0]['id'], self.test_document_version_page.pk
+        )
+        self.assertTrue('_hash' in response.data['image_url'])
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_sprite_api_view_manifest_deleted_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        response = self._request_test_document_version_page_sprite_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        cache_file_count = self.test_document_version.cache_partition.files.count()
+
+        self.test_document_version.cache_partition.files.get(
+            filename__endswith='-manifest'
+        ).delete()
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_sprite_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['pages'][0]['id'], self.test_document_version_page.pk
+        )
+        self.assertEqual(
+            self.test_document_version.cache_partition.files.count(),
+            cache_file_count
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_sprite_image_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_sprite_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_sprite_image_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_sprite_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'])
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
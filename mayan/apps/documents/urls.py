@@ -16,7 +16,8 @@ from .api_views.document_type_api_views import (
 from .api_views.document_version_api_views import (
     APIDocumentVersionDetailView, APIDocumentVersionExportView,
     APIDocumentVersionListView, APIDocumentVersionPageDetailView,
-    APIDocumentVersionPageImageView, APIDocumentVersionPageListView
+    APIDocumentVersionPageImageView, APIDocumentVersionPageListView,
+    APIDocumentVersionPageSpriteImageView, APIDocumentVersionPageSpriteView
 )
 from .api_views.favorite_document_api_views import (
     APIFavoriteDocumentDetailView, APIFavoriteDocumentListView
@@ -640,6 +641,16 @@ api_urls_document_versions = [
         regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/$',
         name='documentversionpage-image',
         view=APIDocumentVersionPageImageView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/sprite/$',
+        name='documentversionpage-sprite',
+        view=APIDocumentVersionPageSpriteView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/sprite/image/$',
+        name='documentversionpage-sprite-image',
+        view=APIDocumentVersionPageSpriteImageView.as_view()
     )
 ]
 
@@ -108,6 +108,13 @@ class DocumentFilePageListView(ExternalObjectViewMixin, SingleObjectListView):
             'title': _('Pages of document file: %s') % self.external_object,
         }
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        DocumentFilePage.prefetch_transformations(pages=context['object_list'])
+
+        return context
+
     def get_source_queryset(self):
         queryset = ModelQueryFields.get(model=DocumentFilePage).get_queryset()
         return queryset.filter(pk__in=self.external_object.pages.all())
@@ -109,6 +109,13 @@ class DocumentVersionPageListView(ExternalObjectViewMixin, SingleObjectListView)
             'title': _('Pages of document version: %s') % self.external_object,
         }
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        DocumentVersionPage.prefetch_transformations(pages=context['object_list'])
+
+        return context
+
     def get_source_queryset(self):
         queryset = ModelQueryFields.get(model=DocumentVersionPage).get_queryset()
         return queryset.filter(pk__in=self.external_object.pages.all())
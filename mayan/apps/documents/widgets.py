@@ -31,6 +31,18 @@ class CarouselWidget(forms.widgets.Widget):
             return None
         return value
 
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name=name, value=value, attrs=attrs)
+
+        if context['widget']['value']:
+            queryset = context['widget']['value'].pages.all()
+            pages = list(queryset)
+            queryset.model.prefetch_transformations(pages=pages)
+
+            context['widget']['pages'] = pages
+
+        return context
+
 
 class DocumentFilePagesCarouselWidget(CarouselWidget):
     target_view = 'documents:document_file_page_view'
@@ -35,6 +35,12 @@ class DjangoSearchBackend(SearchBackend):
         database directly.
         """
 
+    def index_search_model(self, search_model):
+        """
+        This backend doesn't index instances. Searches query the
+        database directly.
+        """
+
     def get_search_query(
         self, search_model, query_string, global_and_search=False
     ):
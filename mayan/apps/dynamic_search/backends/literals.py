@@ -27,4 +27,9 @@ DJANGO_TO_WHOOSH_FIELD_MAP = {
     models.UUIDField: {'field': whoosh.fields.TEXT, 'transformation': str},
     RGBColorField: {'field': whoosh.fields.TEXT},
 }
+DEFAULT_WHOOSH_BATCH_SIZE = 1000
+DEFAULT_WHOOSH_WRITER_LIMIT_MB = 128
+
 WHOOSH_INDEX_DIRECTORY_NAME = 'whoosh'
+WHOOSH_INDEX_QUEUE_DIRECTORY_NAME = 'queue'
+WHOOSH_INDEX_QUEUE_ENTRY_SEPARATOR = '.'
@@ -1,11 +1,15 @@
+import itertools
 import logging
+import os
 from pathlib import Path
 
 import whoosh
 from whoosh import qparser
 from whoosh.filedb.filestore import FileStorage
 from whoosh.index import EmptyIndexError
+from whoosh.writing import MERGE_SMALL
 
+from django.apps import apps
 from django.conf import settings
 
 from mayan.apps.lock_manager.backends.base import LockingBackend
@@ -14,7 +18,11 @@ from mayan.apps.lock_manager.exceptions import LockError
 from ..classes import SearchBackend, SearchField, SearchModel
 from ..settings import setting_results_limit
 
-from .literals import DJANGO_TO_WHOOSH_FIELD_MAP, WHOOSH_INDEX_DIRECTORY_NAME
+from .literals import (
+    DEFAULT_WHOOSH_BATCH_SIZE, DEFAULT_WHOOSH_WRITER_LIMIT_MB,
+    DJANGO_TO_WHOOSH_FIELD_MAP, WHOOSH_INDEX_DIRECTORY_NAME,
+    WHOOSH_INDEX_QUEUE_DIRECTORY_NAME, WHOOSH_INDEX_QUEUE_ENTRY_SEPARATOR
+)
 logger = logging.getLogger(name=__name__)
 
 
@@ -29,6 +37,16 @@ class WhooshSearchBackend(SearchBackend):
             )
         )
         self.index_path.mkdir(exist_ok=True)
+        self.queue_path = Path(
+            self.index_path, WHOOSH_INDEX_QUEUE_DIRECTORY_NAME
+        )
+        self.queue_path.mkdir(exist_ok=True)
+        self.batch_size = self.kwargs.get(
+            'batch_size', DEFAULT_WHOOSH_BATCH_SIZE
+        )
+        self.writer_limit_mb = self.kwargs.get(
+            'writer_limit_mb', DEFAULT_WHOOSH_WRITER_LIMIT_MB
+        )
 
     def _search(
         self, query_string, search_model, user, global_and_search=False,
@@ -159,27 +177,147 @@ class WhooshSearchBackend(SearchBackend):
     def get_storage(self):
         return FileStorage(path=self.index_path)
 
-    def index_instance(self, instance, exclude_set=None):
+    def _acquire_index_lock(self):
+        return LockingBackend.get_backend().acquire_lock(
+            name='dynamic_search_whoosh_index_instance'
+        )
+
+    def _get_queue_entries(self):
+        with os.scandir(path=self.queue_path) as entries:
+            return [
+                entry.name for entry in itertools.islice(
+                    entries, self.batch_size
+                )
+            ]
+
+    def _get_writer(self, search_model, writers):
         try:
-            lock = LockingBackend.get_backend().acquire_lock(
-                name='dynamic_search_whoosh_index_instance'
+            return writers[search_model]
+        except KeyError:
+            index = self.get_index(search_model=search_model)
+            writer = index.writer(limitmb=self.writer_limit_mb)
+            writers[search_model] = writer
+            return writer
+
+    def _index_instances(self, instances):
+        """
+        Index a list of instances using a single writer per search model
+        and a single commit per writer. Segment merging is deferred
+        to the periodic optimization.
+        """
+        exclude_set = set()
+        writers = {}
+
+        try:
+            for instance in instances:
+                self._index_instance(
+                    instance=instance, exclude_set=exclude_set,
+                    writers=writers
+                )
+        except Exception:
+            for writer in writers.values():
+                writer.cancel()
+            raise
+        else:
+            for writer in writers.values():
+                writer.commit(merge=False)
+
+    def _load_queue_entries(self, entries):
+        """
+        Convert a list of queue entry names into model instances. Entries
+        are grouped per model to load each group with a single query.
+        """
+        object_ids = {}
+        for entry in entries:
+            app_label, model_name, object_id = entry.split(
+                WHOOSH_INDEX_QUEUE_ENTRY_SEPARATOR, 2
             )
+            object_ids.setdefault((app_label, model_name), []).append(
+                object_id
+            )
+
+        result = []
+        for (app_label, model_name), id_list in object_ids.items():
+            try:
+                Model = apps.get_model(
+                    app_label=app_label, model_name=model_name
+                )
+            except LookupError:
+                """
+                The app or model does not exists anymore. Non fatal,
+                skip the entries.
+                """
+            else:
+                result.extend(
+                    Model._meta.default_manager.filter(pk__in=id_list)
+                )
+
+        return result
+
+    def enqueue_instance(self, instance):
+        """
+        Add an instance to the indexing queue. The queue is a directory of
+        empty marker files, one per instance, which causes repeated
+        requests for the same instance to coalesce into a single entry.
+        """
+        Path(
+            self.queue_path, WHOOSH_INDEX_QUEUE_ENTRY_SEPARATOR.join(
+                (
+                    instance._meta.app_label, instance._meta.model_name,
+                    str(instance.pk)
+                )
+            )
+        ).touch()
+
+    def flush_queue(self):
+        """
+        Drain the indexing queue in batches of `batch_size` entries. Only
+        the holder of the index lock drains the queue. Callers that fail
+        to obtain the lock must retry later to ensure entries added after
+        the current drain started are processed.
+        """
+        try:
+            lock = self._acquire_index_lock()
         except LockError:
             raise
         else:
             try:
-                # Use a private method to allow using a single lock for
-                # all recursions.
-                self._index_instance(
-                    instance=instance, exclude_set=exclude_set
-                )
+                while True:
+                    entries = self._get_queue_entries()
+                    if not entries:
+                        break
+
+                    # Remove the entries before loading the instances.
+                    # Changes made after this point will queue new
+                    # entries instead of being lost.
+                    for entry in entries:
+                        Path(self.queue_path, entry).unlink()
+
+                    try:
+                        self._index_instances(
+                            instances=self._load_queue_entries(
+                                entries=entries
+                            )
+                        )
+                    except Exception:
+                        # Restore the queue entries to retry them later.
+                        for entry in entries:
+                            Path(self.queue_path, entry).touch()
+                        raise
             finally:
                 lock.release()
 
-    def _index_instance(self, instance, exclude_set=None):
-        if not exclude_set:
-            exclude_set = set()
+    def index_instance(self, instance):
+        self.enqueue_instance(instance=instance)
+        self.flush_queue()
+
+    def index_instances(self, instances):
+        for instance in instances:
+            self.enqueue_instance(instance=instance)
+
+        self.flush_queue()
 
+    def _index_instance(self, instance, exclude_set, writers):
         # Avoid infinite recursion.
         if instance in exclude_set:
             return
@@ -196,16 +334,15 @@ class WhooshSearchBackend(SearchBackend):
             to be updated.
             """
         else:
-            index = self.get_index(search_model=search_model)
-
-            writer = index.writer()
+            writer = self._get_writer(
+                search_model=search_model, writers=writers
+            )
             kwargs = search_model.sieve(
                 field_map=self.get_resolved_field_map(search_model=search_model), instance=instance
             )
             writer.delete_by_term('id', str(instance.pk))
             try:
                 writer.add_document(**kwargs)
-                writer.commit()
             except Exception as exception:
                 logger.error(
                     'Unexpected exception while indexing object id: %s, '
@@ -238,16 +375,63 @@ class WhooshSearchBackend(SearchBackend):
 
                     for instance in results:
                         self._index_instance(
-                            instance=instance, exclude_set=exclude_set
+                            instance=instance, exclude_set=exclude_set,
+                            writers=writers
                         )
 
     def index_search_model(self, search_model):
-        index = self.get_index(search_model=search_model)
+        """
+        Recreate the index of a search model streaming the instances in
+        chunks into a single writer. Related search models are not
+        reindexed.
+        """
+        try:
+            lock = self._acquire_index_lock()
+        except LockError:
+            raise
+        else:
+            try:
+                index = self.get_storage().create_index(
+                    schema=self.get_search_model_schema(
+                        search_model=search_model
+                    ), indexname=search_model.get_full_name()
+                )
+                field_map = self.get_resolved_field_map(
+                    search_model=search_model
+                )
+                queryset = search_model.model._meta.default_manager.all()
+
+                writer = index.writer(limitmb=self.writer_limit_mb)
+                try:
+                    for instance in queryset.iterator(chunk_size=self.batch_size):
+                        writer.add_document(
+                            **search_model.sieve(
+                                field_map=field_map, instance=instance
+                            )
+                        )
+                except Exception:
+                    writer.cancel()
+                    raise
+                else:
+                    writer.commit()
+            finally:
+                lock.release()
 
-        # Clear the model index
-        self.get_storage().create_index(
-            index.schema, indexname=search_model.get_full_name()
-        )
+    def optimize(self):
+        """
+        Process any queue entries left behind and merge the small
+        segments created by the batch commits.
+        """
+        self.flush_queue()
 
-        for instance in search_model.model._meta.default_manager.all():
-            self.index_instance(instance=instance)
+        try:
+            lock = self._acquire_index_lock()
+        except LockError:
+            raise
+        else:
+            try:
+                for search_model in SearchModel.all():
+                    index = self.get_index(search_model=search_model)
+                    index.writer().commit(mergetype=MERGE_SMALL)
+            finally:
+                lock.release()
@@ -51,6 +51,29 @@ class SearchBackend:
     def index_instance(self, instance):
         raise NotImplementedError
 
+    def index_instances(self, instances):
+        """
+        Index several instances at once. Backends that support batching
+        should overload this method to commit all instances together.
+        """
+        for instance in instances:
+            self.index_instance(instance=instance)
+
+    def index_search_model(self, search_model):
+        """
+        Index all the instances of a search model. Backends that support
+        batching should overload this method to stream the instances in
+        chunks.
+        """
+        for instance in search_model.model._meta.default_manager.iterator():
+            self.index_instance(instance=instance)
+
+    def optimize(self):
+        """
+        Optional method for subclasses to overload. Called periodically
+        to perform maintenance of the backend's internal index.
+        """
+
     def search(
         self, search_model, query, user, global_and_search=False
     ):
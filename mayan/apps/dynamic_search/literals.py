@@ -12,6 +12,7 @@ DEFAULT_SCOPE_ID = '0'
 DELIMITER = '_'
 
 SEARCH_MODEL_NAME_KWARG = 'search_model_name'
+TASK_INDEX_OPTIMIZE_INTERVAL = 60 * 60  # 1 hour
 TASK_RETRY_DELAY = 5
 
 SCOPE_MARKER = '__'
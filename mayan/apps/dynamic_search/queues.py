@@ -1,9 +1,13 @@
+from datetime import timedelta
+
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.queues import queue_tools
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_b
 
+from .literals import TASK_INDEX_OPTIMIZE_INTERVAL
+
 queue_search = CeleryQueue(
     label=_('Search'), name='search', worker=worker_b
 )
@@ -13,11 +17,23 @@ queue_search.add_task_type(
     label=_('Remove a model instance from the search engine.'),
     name='task_deindex_instance',
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_optimize',
+    label=_('Perform maintenance of the search engine index.'),
+    name='task_index_optimize', schedule=timedelta(
+        seconds=TASK_INDEX_OPTIMIZE_INTERVAL
+    )
+)
 queue_search.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_instance',
     label=_('Index a model instance to the search engine.'),
     name='task_index_instance',
 )
+queue_search.add_task_type(
+    dotted_path='mayan.apps.dynamic_search.tasks.task_index_instances',
+    label=_('Index several instances of a model to the search engine.'),
+    name='task_index_instances',
+)
 
 queue_tools.add_task_type(
     dotted_path='mayan.apps.dynamic_search.tasks.task_index_search_model',
@@ -29,21 +29,48 @@ def task_deindex_instance(self, app_label, model_name, object_id):
     logger.info('Finished')
 
 
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
+    ignore_result=True
+)
+def task_index_instances(self, app_label, model_name, id_list):
+    logger.info('Executing')
+
+    try:
+        Model = apps.get_model(app_label=app_label, model_name=model_name)
+    except LookupError:
+        """
+        The app or model does not exists anymore. Non fatal, just exit
+        the task.
+        """
+    else:
+        queryset = Model._meta.default_manager.filter(pk__in=id_list)
+
+        try:
+            SearchBackend.get_instance().index_instances(instances=queryset)
+        except LockError as exception:
+            raise self.retry(exc=exception)
+
+    logger.info('Finished')
+
+
 @app.task(
     bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
     ignore_result=True
 )
 def task_index_search_model(self, search_model_full_name):
+    logger.info('Executing')
+
     search_model = SearchModel.get(name=search_model_full_name)
 
-    for instance in search_model.model._meta.default_manager.all():
-        task_index_instance.apply_async(
-            kwargs={
-                'app_label': instance._meta.app_label,
-                'model_name': instance._meta.model_name,
-                'object_id': instance.pk
-            }
+    try:
+        SearchBackend.get_instance().index_search_model(
+            search_model=search_model
         )
+    except LockError as exception:
+        raise self.retry(exc=exception)
+
+    logger.info('Finished')
 
 
 @app.task(
@@ -75,3 +102,18 @@ def task_index_instance(self, app_label, model_name, object_id):
                 raise self.retry(exc=exception)
 
     logger.info('Finished')
+
+
+@app.task(
+    bind=True, default_retry_delay=TASK_RETRY_DELAY, max_retries=None,
+    ignore_result=True
+)
+def task_index_optimize(self):
+    logger.info('Executing')
+
+    try:
+        SearchBackend.get_instance().optimize()
+    except LockError as exception:
+        raise self.retry(exc=exception)
+
+    logger.info('Finished')
@@ -348,3 +348,59 @@ class WhooshSearchBackendDocumentSearchTestCase(
             user=self._test_case_user
         )
         self.assertEqual(queryset.count(), 1)
+
+    def test_index_queue_coalescing(self):
+        self._upload_test_document(label='first_doc')
+
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        self.test_document.label = 'second_doc'
+        self.test_document.save()
+
+        self.search_backend.enqueue_instance(instance=self.test_document)
+        self.search_backend.enqueue_instance(instance=self.test_document)
+
+        self.assertEqual(
+            len(list(self.search_backend.queue_path.iterdir())), 1
+        )
+
+        self.search_backend.flush_queue()
+
+        self.assertEqual(
+            len(list(self.search_backend.queue_path.iterdir())), 0
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query={'q': 'second*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 1)
+        self.assertTrue(self.test_document in queryset)
+
+    def test_index_search_model(self):
+        self._upload_test_document(label='first_doc')
+
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_view
+        )
+
+        self.search_backend.clear_search_model_index(
+            search_model=document_search
+        )
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 0)
+
+        self.search_backend.index_search_model(search_model=document_search)
+
+        queryset = self.search_backend.search(
+            search_model=document_search,
+            query={'q': 'first*'}, user=self._test_case_user
+        )
+        self.assertEqual(queryset.count(), 1)
+        self.assertTrue(self.test_document in queryset)
@@ -1,2 +1,12 @@
+CACHE_PARTITION_FILE_HITS_FLUSH_INTERVAL = 10  # 10 seconds
+CACHE_PARTITION_FILE_HITS_FLUSH_SIZE = 100
+CACHE_PARTITION_FILE_INDEX_MAXIMUM_SIZE = 10000
+CACHE_PARTITION_FILE_INDEX_TIMEOUT = 30  # 30 seconds
+CACHE_PRUNE_DELETE_CHUNK_SIZE = 100
+CACHE_PRUNE_VICTIM_BATCH_SIZE = 1000
+
+DEFAULT_BACKGROUND_PRUNE_LOW_WATER_MARK = 90
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+
+TASK_CACHE_PRUNE_BACKGROUND_INTERVAL = 60 * 5  # 5 minutes
@@ -1,5 +1,8 @@
+from collections import OrderedDict
 from contextlib import contextmanager
 import logging
+import threading
+import time
 
 from django.core import validators
 from django.core.files.base import ContentFile
@@ -27,7 +30,15 @@ from .events import (
     event_cache_purged
 )
 from .exceptions import FileCachingException
+from .literals import (
+    CACHE_PARTITION_FILE_HITS_FLUSH_INTERVAL,
+    CACHE_PARTITION_FILE_HITS_FLUSH_SIZE,
+    CACHE_PARTITION_FILE_INDEX_MAXIMUM_SIZE,
+    CACHE_PARTITION_FILE_INDEX_TIMEOUT, CACHE_PRUNE_DELETE_CHUNK_SIZE,
+    CACHE_PRUNE_VICTIM_BATCH_SIZE
+)
 from .settings import (
+    setting_background_prune_low_water_mark,
     setting_maximum_failed_prune_attempts,
     setting_maximum_normal_prune_attempts
 )
@@ -46,6 +57,11 @@ class Cache(ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_('Maximum size')
     )
+    total_size = models.BigIntegerField(
+        default=0, editable=False, help_text=_(
+            'Running total of the size of the files of the cache in bytes.'
+        ), verbose_name=_('Total size')
+    )
 
     class Meta:
         verbose_name = _('Cache')
@@ -84,9 +100,9 @@ class Cache(ValueChangeModelMixin, models.Model):
         """
         Return the actual usage of the cache.
         """
-        return self.get_files().aggregate(
-            file_size__sum=Sum('file_size')
-        )['file_size__sum'] or 0
+        return Cache.objects.filter(pk=self.pk).values_list(
+            'total_size', flat=True
+        ).first() or 0
 
     def get_total_size_display(self):
         return format_lazy(
@@ -101,54 +117,147 @@ class Cache(ValueChangeModelMixin, models.Model):
     def label(self):
         return self.get_defined_storage().label
 
-    def prune(self):
+    def _prune_delete_chunk(self, cache_partition_file_id_list):
         """
-        Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        Delete a chunk of files selected for pruning. Files that are locked
+        by someone else are skipped. Returns the list of IDs of the files
+        that were deleted and the list of IDs of the files skipped.
         """
-        failed_attempts = 0
-        normal_attempts = 0
-        file_index = 0
+        deleted_id_list = []
+        locks = []
+        skipped_id_list = []
 
-        while self.get_total_size() >= self.maximum_size:
-            cache_partition_file_queryset = self.get_files().order_by(
-                'hits', 'datetime'
-            )
+        queryset = CachePartitionFile.objects.filter(
+            pk__in=cache_partition_file_id_list
+        ).select_related('partition')
 
-            try:
-                cache_partition_file = cache_partition_file_queryset[file_index]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-            else:
+        try:
+            for cache_partition_file in queryset:
+                lock_name = cache_partition_file._lock_manager_get_lock_name()
                 try:
-                    cache_partition_file.delete()
-                except CachePartitionFile.DoesNotExist:
-                    # The file selected from deletion was deleted by another
-                    # process before the lock was acquired.
-                    file_index += 1
+                    locks.append(
+                        LockingBackend.get_backend().acquire_lock(
+                            name=lock_name
+                        )
+                    )
                 except LockError:
                     logger.debug(
                         'Lock error trying to delete file "%s" for prune. '
                         'Skipping and attempting next file.',
                         cache_partition_file
                     )
-                    failed_attempts += 1
-                    file_index += 1
+                    skipped_id_list.append(cache_partition_file.pk)
+                else:
+                    deleted_id_list.append(cache_partition_file.pk)
+                    self.storage.delete(
+                        name=cache_partition_file.full_filename
+                    )
+                    CachePartition._file_index_remove(
+                        filename=cache_partition_file.filename,
+                        partition_id=cache_partition_file.partition_id
+                    )
 
-                    if failed_attempts > setting_maximum_failed_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prune attempts failed.'
-                        )
+            if deleted_id_list:
+                # Read the sizes again while holding the locks. A file
+                # could have been deleted by another process after the
+                # chunk was selected.
+                queryset = CachePartitionFile.objects.filter(
+                    pk__in=deleted_id_list
+                )
+                deleted_size = queryset.aggregate(
+                    file_size__sum=Sum('file_size')
+                )['file_size__sum'] or 0
+                queryset.delete()
+                self.update_total_size(delta=-deleted_size)
+        finally:
+            for lock in locks:
+                lock.release()
+
+        return deleted_id_list, skipped_id_list
+
+    def prune(self, target_size=None):
+        """
+        Deletes files until the total size of the cache is below the
+        target size, by default the allowed maximum size of the cache.
+        The least used files are selected in batches with one query and
+        deleted in chunks.
+        """
+        if target_size is None:
+            target_size = self.maximum_size
+
+        # Make the buffered hits of this process count for the selection.
+        CachePartitionFile.hits_flush()
+
+        failed_attempts = 0
+        normal_attempts = 0
+        skipped_id_list = []
+
+        while True:
+            total_size = self.get_total_size()
+            if total_size < target_size:
+                break
+
+            required_size = total_size - target_size + 1
+
+            queryset = self.get_files().exclude(
+                pk__in=skipped_id_list
+            ).order_by('hits', 'datetime').values_list(
+                'pk', 'file_size'
+            )[:CACHE_PRUNE_VICTIM_BATCH_SIZE]
+
+            victim_id_list = []
+            victim_size = 0
+            for cache_partition_file_id, file_size in queryset:
+                victim_id_list.append(cache_partition_file_id)
+                victim_size += file_size
+                if victim_size >= required_size:
+                    break
+
+            if not victim_id_list:
+                if skipped_id_list:
+                    # All the remaining files were skipped. Start again
+                    # from the least used file.
+                    skipped_id_list = []
+                    continue
                 else:
-                    file_index = 0
-                    normal_attempts += 1
+                    # No more files to delete. Correct the running total
+                    # in case it drifted from the actual usage.
+                    self.update_total_size()
+                    break
+
+            for index in range(0, len(victim_id_list), CACHE_PRUNE_DELETE_CHUNK_SIZE):
+                deleted_id_list, chunk_skipped_id_list = self._prune_delete_chunk(
+                    cache_partition_file_id_list=victim_id_list[
+                        index:index + CACHE_PRUNE_DELETE_CHUNK_SIZE
+                    ]
+                )
 
-                    if normal_attempts > setting_maximum_normal_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prunes trying to create a '
-                            'single new file.'
-                        )
+                skipped_id_list.extend(chunk_skipped_id_list)
+                failed_attempts += len(chunk_skipped_id_list)
+
+                if failed_attempts > setting_maximum_failed_prune_attempts.value:
+                    raise FileCachingException(
+                        'Too many cache prune attempts failed.'
+                    )
+
+            normal_attempts += 1
+
+            if normal_attempts > setting_maximum_normal_prune_attempts.value:
+                raise FileCachingException(
+                    'Too many cache prunes trying to create a '
+                    'single new file.'
+                )
+
+    def prune_background(self):
+        """
+        Prune the cache to the low water mark to leave room for new files.
+        """
+        low_water_mark = setting_background_prune_low_water_mark.value
+
+        if low_water_mark:
+            self.prune(
+                target_size=int(self.maximum_size * low_water_mark / 100)
+            )
 
     @method_event(
         event=event_cache_purged,
@@ -199,8 +308,33 @@ class Cache(ValueChangeModelMixin, models.Model):
     def storage(self):
         return self.get_defined_storage().get_storage_instance()
 
+    def update_total_size(self, delta=None):
+        """
+        Update the running total of the cache size. Add `delta` to the
+        total or recalculate the total from the files if not provided.
+        """
+        if delta is None:
+            Cache.objects.filter(pk=self.pk).update(
+                total_size=self.get_files().aggregate(
+                    file_size__sum=Sum('file_size')
+                )['file_size__sum'] or 0
+            )
+        elif delta:
+            Cache.objects.filter(pk=self.pk).update(
+                total_size=F('total_size') + delta
+            )
+
 
 class CachePartition(models.Model):
+    """
+    The partitions keep a process local index of the files known to exist,
+    keyed by the partition ID and the filename, to avoid a query for each
+    file lookup. Entries expire after a short time to pick up the files
+    deleted by other processes.
+    """
+    _file_index = OrderedDict()
+    _file_index_lock = threading.Lock()
+
     cache = models.ForeignKey(
         on_delete=models.CASCADE, related_name='partitions',
         to=Cache, verbose_name=_('Cache')
@@ -214,15 +348,74 @@ class CachePartition(models.Model):
         verbose_name = _('Cache partition')
         verbose_name_plural = _('Cache partitions')
 
+    @classmethod
+    def _file_index_add(cls, cache_partition_file):
+        field_names = [
+            field.attname for field in CachePartitionFile._meta.concrete_fields
+        ]
+        values = [
+            getattr(cache_partition_file, field_name) for field_name in field_names
+        ]
+
+        key = (
+            cache_partition_file.partition_id, cache_partition_file.filename
+        )
+
+        with cls._file_index_lock:
+            cls._file_index[key] = (
+                time.time() + CACHE_PARTITION_FILE_INDEX_TIMEOUT,
+                field_names, values
+            )
+            cls._file_index.move_to_end(key=key)
+
+            while len(cls._file_index) > CACHE_PARTITION_FILE_INDEX_MAXIMUM_SIZE:
+                cls._file_index.popitem(last=False)
+
+    @classmethod
+    def _file_index_remove(cls, filename, partition_id):
+        with cls._file_index_lock:
+            cls._file_index.pop((partition_id, filename), None)
+
+    @classmethod
+    def file_index_clear(cls):
+        with cls._file_index_lock:
+            cls._file_index.clear()
+
     @staticmethod
     def get_combined_filename(parent, filename):
         return '{}-{}'.format(parent, filename)
 
+    def _file_index_get(self, filename):
+        key = (self.pk, filename)
+
+        with CachePartition._file_index_lock:
+            try:
+                expiration, field_names, values = CachePartition._file_index[key]
+            except KeyError:
+                return None
+
+            if expiration < time.time():
+                del CachePartition._file_index[key]
+                return None
+
+            CachePartition._file_index.move_to_end(key=key)
+
+        cache_partition_file = CachePartitionFile.from_db(
+            db=self._state.db, field_names=field_names, values=values
+        )
+        cache_partition_file.partition = self
+        return cache_partition_file
+
     def _lock_manager_get_lock_name(self, filename):
         return self.get_file_lock_name(filename=filename)
 
     @contextmanager
     def create_file(self, filename):
+        """
+        The database entry of the file is created after the file is
+        written. Readers don't use locks and must not find files that are
+        not complete.
+        """
         lock_name = self.get_file_lock_name(filename=filename)
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
@@ -241,29 +434,34 @@ class CachePartition(models.Model):
                     content=ContentFile(content='')
                 )
 
-                partition_file = None
+                partition_file = CachePartitionFile(
+                    filename=filename, partition=self
+                )
 
                 try:
-                    partition_file = self.files.create(filename=filename)
                     yield partition_file._open_for_writing(_acquire_lock=False)
+                    partition_file.close(_acquire_lock=False)
+                    partition_file._update_size(_acquire_lock=False)
                 except Exception as exception:
                     logger.error(
                         'Unexpected exception while trying to save new '
                         'cache file; %s', exception, exc_info=True
                     )
-                    if partition_file:
+                    partition_file.close(_acquire_lock=False)
+                    if partition_file.pk:
                         partition_file.delete(_acquire_lock=False)
                     else:
                         # If the CachePartitionFile entry was not created
-                        # do manual clean up of the empty storage file
-                        # created with the previous`self.cache.storage.save`.
+                        # do manual clean up of the storage file created
+                        # with the previous `self.cache.storage.save`.
                         self.cache.storage.delete(
                             name=self.get_full_filename(filename=filename)
                         )
                     raise
                 else:
-                    partition_file.close(_acquire_lock=False)
-                    partition_file._update_size(_acquire_lock=False)
+                    CachePartition._file_index_add(
+                        cache_partition_file=partition_file
+                    )
             finally:
                 lock.release()
         except LockError:
@@ -274,8 +472,24 @@ class CachePartition(models.Model):
         self.purge()
         return super().delete(*args, **kwargs)
 
-    def get_file(self, filename):
-        return self.files.get(filename=filename)
+    def get_file(self, filename, use_index=True):
+        """
+        Return a file of the partition. The process file index can have
+        entries of files deleted by other processes, code that creates the
+        file when it is missing must disable the index.
+        """
+        if use_index:
+            cache_partition_file = self._file_index_get(filename=filename)
+        else:
+            cache_partition_file = None
+
+        if cache_partition_file is None:
+            cache_partition_file = self.files.get(filename=filename)
+            CachePartition._file_index_add(
+                cache_partition_file=cache_partition_file
+            )
+
+        return cache_partition_file
 
     def get_file_lock_name(self, filename):
         return 'cache_partition-file-{}-{}-{}'.format(
@@ -298,6 +512,15 @@ class CachePartition(models.Model):
 
 
 class CachePartitionFile(models.Model):
+    """
+    Reads don't use locks, only writers and evictors do. The hits of the
+    files are counted in memory and written periodically to the database
+    with a single query. Hits not yet written when the process exits are
+    lost.
+    """
+    _hits_buffer = {}
+    _hits_buffer_lock = threading.Lock()
+    _hits_flush_time = 0
     _storage_object = None
 
     partition = models.ForeignKey(
@@ -323,6 +546,23 @@ class CachePartitionFile(models.Model):
         verbose_name = _('Cache partition file')
         verbose_name_plural = _('Cache partition files')
 
+    @classmethod
+    def hits_flush(cls):
+        """
+        Write the hits counted by this process to the database.
+        """
+        with cls._hits_buffer_lock:
+            hits_buffer = cls._hits_buffer
+            cls._hits_buffer = {}
+            cls._hits_flush_time = time.time()
+
+        if hits_buffer:
+            cls.objects.bulk_update(
+                fields=('hits',), objs=[
+                    cls(hits=F('hits') + hits, pk=pk) for pk, hits in hits_buffer.items()
+                ]
+            )
+
     def _lock_manager_get_lock_name(self, *args, **kwargs):
         return self.partition.get_file_lock_name(filename=self.filename)
 
@@ -349,10 +589,14 @@ class CachePartitionFile(models.Model):
         """
         Called after creation and initial write only.
         """
+        old_file_size = self.file_size
         self.file_size = self.partition.cache.storage.size(
             name=self.full_filename
         )
-        self.save(update_fields=('file_size',))
+        self.save()
+        self.partition.cache.update_total_size(
+            delta=self.file_size - old_file_size
+        )
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -368,7 +612,33 @@ class CachePartitionFile(models.Model):
     @locked_class_method
     def delete(self, *args, **kwargs):
         self.partition.cache.storage.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+        CachePartition._file_index_remove(
+            filename=self.filename, partition_id=self.partition_id
+        )
+        result = super().delete(*args, **kwargs)
+
+        # Only update the total if the row was deleted by this call and
+        # not by another process.
+        if result[0]:
+            self.partition.cache.update_total_size(delta=-self.file_size)
+
+        return result
+
+    def exists(self):
+        """
+        Return whether the file is still in the storage. The file index
+        entry of a file deleted by another process is removed.
+        """
+        if self.partition.cache.storage.exists(name=self.full_filename):
+            return True
+        else:
+            logger.debug(
+                'Cache file "%s" no longer exists.', self.full_filename
+            )
+            CachePartition._file_index_remove(
+                filename=self.filename, partition_id=self.partition_id
+            )
+            return False
 
     @cached_property
     def full_filename(self):
@@ -376,34 +646,61 @@ class CachePartitionFile(models.Model):
             parent=self.partition.name, filename=self.filename
         )
 
+    def hit(self):
+        """
+        Count a read of the file. The hits are buffered and written to the
+        database in batches.
+        """
+        with CachePartitionFile._hits_buffer_lock:
+            hits_buffer = CachePartitionFile._hits_buffer
+            hits_buffer[self.pk] = hits_buffer.get(self.pk, 0) + 1
+
+            flush = (
+                len(hits_buffer) >= CACHE_PARTITION_FILE_HITS_FLUSH_SIZE or
+                time.time() - CachePartitionFile._hits_flush_time >= CACHE_PARTITION_FILE_HITS_FLUSH_INTERVAL
+            )
+
+        if flush:
+            CachePartitionFile.hits_flush()
+
     @contextmanager
     def open(self):
         """
         Open the file for reading only.
         """
-        lock_name = self._lock_manager_get_lock_name()
+        self._storage_object = self.open_for_reading()
         try:
-            logger.debug('trying to acquire lock: %s', lock_name)
-            self._lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
-            CachePartitionFile.objects.filter(pk=self.pk).update(hits=F('hits') + 1)
-            logger.debug('acquired lock: %s', lock_name)
-            self._storage_object = None
-            try:
-                self._storage_object = self.partition.cache.storage.open(
-                    mode='rb', name=self.full_filename
-                )
-            except Exception as exception:
-                logger.error(
-                    'Unexpected exception opening the cache file; %s', exception,
-                    exc_info=True
+            yield self._storage_object
+        finally:
+            self.close(_acquire_lock=False)
+
+    def open_for_reading(self):
+        """
+        Open the file for reading only and return the storage file object.
+        The caller is responsible for closing it. Used to stream the file
+        after the caller returns. Raises `DoesNotExist` if the file was
+        deleted by another process.
+        """
+        try:
+            file_object = self.partition.cache.storage.open(
+                mode='rb', name=self.full_filename
+            )
+        except Exception as exception:
+            if not self.exists():
+                raise CachePartitionFile.DoesNotExist(
+                    'Cache file "{}" no longer exists.'.format(
+                        self.full_filename
+                    )
                 )
-                raise
-            else:
-                yield self._storage_object
-                self.close(_acquire_lock=False)
-            finally:
-                self.close(_acquire_lock=False)
-                self._lock.release()
-        except LockError:
-            logger.debug('unable to obtain lock: %s' % lock_name)
+
+            logger.error(
+                'Unexpected exception opening the cache file; %s', exception,
+                exc_info=True
+            )
+            CachePartition._file_index_remove(
+                filename=self.filename, partition_id=self.partition_id
+            )
             raise
+        else:
+            self.hit()
+            return file_object
@@ -3,12 +3,23 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
+    DEFAULT_BACKGROUND_PRUNE_LOW_WATER_MARK,
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
     DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
 )
 
 namespace = SettingNamespace(label=_('File caching'), name='file_caching')
 
+setting_background_prune_low_water_mark = namespace.add_setting(
+    default=DEFAULT_BACKGROUND_PRUNE_LOW_WATER_MARK,
+    global_name='FILE_CACHING_BACKGROUND_PRUNE_LOW_WATER_MARK', help_text=_(
+        'Percentage of the maximum size of a cache. The periodic background '
+        'prune deletes files until the usage of each cache is below this '
+        'value, so that new files rarely have to wait for space to be '
+        'freed. Set to 0 to disable the background prune.'
+    )
+)
+
 setting_maximum_failed_prune_attempts = namespace.add_setting(
     default=DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
     global_name='FILE_CACHING_MAXIMUM_FAILED_PRUNE_ATTEMPTS', help_text=_(
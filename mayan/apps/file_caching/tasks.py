@@ -6,6 +6,8 @@ from django.contrib.auth import get_user_model
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .exceptions import FileCachingException
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -47,6 +49,23 @@ def task_cache_partition_purge(
         logger.info('Finished cache partition id %s purge', cache_partition)
 
 
+@app.task(ignore_result=True)
+def task_cache_prune_background():
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    for cache in Cache.objects.all():
+        logger.debug('Starting cache id %s background prune', cache.pk)
+        try:
+            cache.prune_background()
+        except FileCachingException as exception:
+            logger.warning(
+                'Error during background prune of cache "%s"; %s', cache,
+                exception
+            )
+
+
 @app.task(bind=True, ignore_result=True)
 def task_cache_purge(self, cache_id, user_id=None):
     Cache = apps.get_model(
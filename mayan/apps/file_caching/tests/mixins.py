@@ -3,7 +3,7 @@ from django.utils.encoding import force_bytes
 from mayan.apps.storage.classes import DefinedStorage
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
-from ..models import Cache
+from ..models import Cache, CachePartition, CachePartitionFile
 from ..tasks import task_cache_partition_purge, task_cache_purge
 
 from .literals import (
@@ -13,6 +13,15 @@ from .literals import (
 )
 
 
+class CachePartitionFileTestCaseMixin:
+    def setUp(self):
+        super().setUp()
+        # Don't leak the process local state of the cache files between
+        # tests.
+        CachePartition.file_index_clear()
+        CachePartitionFile._hits_buffer = {}
+
+
 class CachePartitionViewTestMixin:
     def _request_test_object_file_cache_partition_purge_view(self):
         return self.post(
@@ -1,9 +1,12 @@
 import mock
 
+from django.test import override_settings
+
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..exceptions import FileCachingException
-from ..models import CachePartitionFile
+from ..models import CachePartition, CachePartitionFile
 
 from .literals import TEST_CACHE_PARTITION_FILE_FILENAME
 from .mixins import CacheTestMixin
@@ -101,6 +104,7 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         with self.test_cache_partition_file.open():
             """Do nothing"""
 
+        CachePartitionFile.hits_flush()
         self.test_cache_partition_file.refresh_from_db()
 
         self.assertEqual(
@@ -175,8 +179,16 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             """Increase hits of file #1"""
 
         with self.test_cache_partition_files[0].open():
-            """Lock and increase hits of file #0"""
+            """Increase hits of file #0"""
+
+        # Reads don't lock the files, lock file #0 as a writer would.
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_cache_partition_files[0]._lock_manager_get_lock_name()
+        )
+        try:
             self._create_test_cache_partition_file(file_size=1)
+        finally:
+            lock.release()
 
         self.assertTrue(
             self.test_cache_partition_files[0] in CachePartitionFile.objects.all()
@@ -187,3 +199,186 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.assertTrue(
             self.test_cache_partition_files[2] in CachePartitionFile.objects.all()
         )
+
+    def test_cache_total_size_running_total(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=2)
+
+        self.assertEqual(self.test_cache.get_total_size(), 3)
+
+        self.test_cache_partition_files[0].delete()
+
+        self.assertEqual(self.test_cache.get_total_size(), 2)
+
+    def test_cache_prune_multiple_files(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 4
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self.test_cache.prune(target_size=2)
+
+        self.assertEqual(self.test_cache.get_total_size(), 1)
+        self.assertEqual(self.test_cache.get_files().count(), 1)
+        self.assertTrue(
+            self.test_cache_partition_files[2] in CachePartitionFile.objects.all()
+        )
+
+    def test_cache_prune_total_size_correction(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 2
+            }
+        )
+
+        self.test_cache.update_total_size(delta=3)
+
+        self.test_cache.prune()
+
+        self.assertEqual(self.test_cache.get_total_size(), 0)
+
+    @override_settings(FILE_CACHING_BACKGROUND_PRUNE_LOW_WATER_MARK=50)
+    def test_cache_prune_background(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 4
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self.test_cache.prune_background()
+
+        self.assertEqual(self.test_cache.get_total_size(), 1)
+
+    @override_settings(FILE_CACHING_BACKGROUND_PRUNE_LOW_WATER_MARK=0)
+    def test_cache_prune_background_disabled(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 4
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self.test_cache.prune_background()
+
+        self.assertEqual(self.test_cache.get_total_size(), 3)
+
+    def test_cache_partition_file_hits_buffer(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFile.hits_flush()
+
+        with self.test_cache_partition_file.open():
+            """Do nothing"""
+
+        with self.test_cache_partition_file.open():
+            """Do nothing"""
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self.test_cache_partition_file.hits, 0)
+
+        CachePartitionFile.hits_flush()
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(self.test_cache_partition_file.hits, 2)
+
+    def test_cache_partition_file_index(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        with self.assertNumQueries(num=0):
+            cache_partition_file = self.test_cache_partition.get_file(
+                filename=self.test_cache_partition_file.filename
+            )
+
+        self.assertEqual(cache_partition_file, self.test_cache_partition_file)
+
+        self.test_cache_partition_file.delete()
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self.test_cache_partition.get_file(
+                filename=self.test_cache_partition_file.filename
+            )
+
+    def test_cache_partition_file_index_clear(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartition.file_index_clear()
+
+        with self.assertNumQueries(num=1):
+            self.test_cache_partition.get_file(
+                filename=self.test_cache_partition_file.filename
+            )
+
+    def test_cache_partition_file_index_disabled(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        with self.assertNumQueries(num=1):
+            self.test_cache_partition.get_file(
+                filename=self.test_cache_partition_file.filename,
+                use_index=False
+            )
+
+    def test_cache_partition_file_index_stale_entry(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        # Delete the file as another process would, without updating the
+        # file index of this process.
+        self.test_cache.storage.delete(
+            name=self.test_cache_partition_file.full_filename
+        )
+        CachePartitionFile.objects.filter(
+            pk=self.test_cache_partition_file.pk
+        ).delete()
+
+        cache_partition_file = self.test_cache_partition.get_file(
+            filename=self.test_cache_partition_file.filename
+        )
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            with cache_partition_file.open():
+                """Stale entry, must fail."""
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self.test_cache_partition.get_file(
+                filename=self.test_cache_partition_file.filename
+            )
+
+    def test_cache_partition_file_open_while_locked(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_cache_partition_file._lock_manager_get_lock_name()
+        )
+        try:
+            with self.test_cache_partition_file.open() as file_object:
+                self.assertTrue(file_object.read())
+        finally:
+            lock.release()
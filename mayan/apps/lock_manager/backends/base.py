@@ -1,8 +1,18 @@
+from collections import OrderedDict, deque
 import logging
+import threading
+import time
 
 from django.utils.module_loading import import_string
 
-from ..settings import setting_backend, setting_default_lock_timeout
+from ..exceptions import LockError
+from ..literals import (
+    LOCK_STATISTICS_MAXIMUM_NAMES, LOCK_WAIT_BACKOFF_INITIAL,
+    LOCK_WAIT_BACKOFF_MAXIMUM
+)
+from ..settings import (
+    setting_backend, setting_default_lock_timeout, setting_wait_timeout
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -13,6 +23,10 @@ class LockingBackend:
     subclass must define.
     """
     _is_initialized = False
+    _statistics = OrderedDict()
+    _statistics_lock = threading.Lock()
+    _wait_queues = {}
+    _wait_queues_lock = threading.Lock()
 
     @classmethod
     def _initialize(cls):
@@ -21,15 +35,160 @@ class LockingBackend:
         """
         return
 
+    @classmethod
+    def _acquire_lock_wait(cls, name, timeout, wait_timeout):
+        """
+        Retry acquiring a lock until it is released or the wait timeout
+        expires. Waiters of the same process are served in the order they
+        arrived. Only the waiter at the head of the queue of a lock name
+        retries, the rest wait to be woken up by the previous head.
+        """
+        deadline = time.time() + wait_timeout
+        event = threading.Event()
+
+        with cls._wait_queues_lock:
+            queue = cls._wait_queues.setdefault(name, deque())
+            queue.append(event)
+            if len(queue) == 1:
+                event.set()
+
+        try:
+            delay = LOCK_WAIT_BACKOFF_INITIAL
+
+            while True:
+                remaining = deadline - time.time()
+
+                if event.is_set():
+                    try:
+                        return cls._acquire_lock(name=name, timeout=timeout)
+                    except LockError:
+                        if remaining <= 0:
+                            raise
+
+                        cls._wait_for_release(
+                            name=name, timeout=min(delay, remaining)
+                        )
+                        delay = min(delay * 2, LOCK_WAIT_BACKOFF_MAXIMUM)
+                elif remaining <= 0 or not event.wait(timeout=remaining):
+                    raise LockError
+        finally:
+            with cls._wait_queues_lock:
+                is_head = queue[0] is event
+                queue.remove(event)
+
+                if not queue:
+                    cls._wait_queues.pop(name, None)
+                elif is_head:
+                    queue[0].set()
+
+    @classmethod
+    def _update_statistics(cls, name, acquired, contended, wait_time):
+        with cls._statistics_lock:
+            try:
+                entry = cls._statistics.pop(name)
+            except KeyError:
+                entry = {
+                    'acquired': 0, 'contended': 0, 'failed': 0,
+                    'wait_time': 0, 'wait_time_maximum': 0
+                }
+
+            # Re-insert to keep the most recently used names at the end.
+            cls._statistics[name] = entry
+
+            if acquired:
+                entry['acquired'] += 1
+            else:
+                entry['failed'] += 1
+
+            if contended:
+                entry['contended'] += 1
+                entry['wait_time'] += wait_time
+                entry['wait_time_maximum'] = max(
+                    entry['wait_time_maximum'], wait_time
+                )
+
+            while len(cls._statistics) > LOCK_STATISTICS_MAXIMUM_NAMES:
+                cls._statistics.popitem(last=False)
+
+    @classmethod
+    def _wait_for_release(cls, name, timeout):
+        """
+        Optional class method for subclasses to overload. Wait for a lock
+        to be released or for the timeout to expire. Backends that can be
+        notified of releases should return as soon as possible.
+        """
+        time.sleep(timeout)
+
     @staticmethod
     def get_backend():
         return import_string(dotted_path=setting_backend.value)
 
     @classmethod
-    def acquire_lock(cls, name, timeout=None):
+    def acquire_lock(
+        cls, name, timeout=None, blocking=False, wait_timeout=None
+    ):
+        """
+        Acquire a lock. By default a LockError is raised if the lock is
+        held by someone else. If `blocking` is True, wait for the lock to
+        be released for up to `wait_timeout` seconds before raising
+        LockError.
+        """
         timeout = timeout or setting_default_lock_timeout.value
         logger.debug('acquiring lock: %s, timeout: %s', name, timeout)
-        return cls._acquire_lock(name=name, timeout=timeout)
+
+        contended = False
+        start_time = time.time()
+
+        try:
+            try:
+                if blocking and name in cls._wait_queues:
+                    # Don't overtake the waiters of this process.
+                    raise LockError
+
+                result = cls._acquire_lock(name=name, timeout=timeout)
+            except LockError:
+                contended = True
+
+                if not blocking:
+                    raise
+
+                if wait_timeout is None:
+                    wait_timeout = setting_wait_timeout.value
+
+                logger.debug(
+                    'waiting for lock: %s, wait timeout: %s', name,
+                    wait_timeout
+                )
+                result = cls._acquire_lock_wait(
+                    name=name, timeout=timeout, wait_timeout=wait_timeout
+                )
+        except LockError:
+            cls._update_statistics(
+                acquired=False, contended=contended, name=name,
+                wait_time=time.time() - start_time
+            )
+            raise
+        else:
+            cls._update_statistics(
+                acquired=True, contended=contended, name=name,
+                wait_time=time.time() - start_time
+            )
+            return result
+
+    @classmethod
+    def get_statistics(cls, name=None):
+        """
+        Return the acquisition and contention counters and the wait times of
+        the locks requested by this process. The counters are kept for the
+        most recently used lock names.
+        """
+        with cls._statistics_lock:
+            if name:
+                return dict(cls._statistics.get(name, {}))
+            else:
+                return {
+                    key: dict(value) for key, value in cls._statistics.items()
+                }
 
     @classmethod
     def purge_locks(cls):
@@ -1,4 +1,8 @@
 REDIS_LOCK_NAME_PREFIX = '_mayan_lock:'
+REDIS_LOCK_RELEASE_CHANNEL_PREFIX = '_mayan_lock_release:'
 REDIS_LOCK_VERSION_REQUIRED = (3, 3)
 REDIS_SCAN_KEYS_COUNT = 5000
 REDIS_USE_CONNECTION_POOL = True
+
+SHARDED_FILE_LOCK_DIRECTORY_PREFIX = 'mayan_locks_'
+SHARDED_FILE_LOCK_THREAD_LOCK_COUNT = 64
@@ -1,3 +1,5 @@
+import time
+
 import redis
 
 from django.utils.encoding import force_text
@@ -9,8 +11,9 @@ from ..settings import setting_backend_arguments
 
 from .base import LockingBackend
 from .literals import (
-    REDIS_LOCK_NAME_PREFIX, REDIS_LOCK_VERSION_REQUIRED,
-    REDIS_SCAN_KEYS_COUNT, REDIS_USE_CONNECTION_POOL
+    REDIS_LOCK_NAME_PREFIX, REDIS_LOCK_RELEASE_CHANNEL_PREFIX,
+    REDIS_LOCK_VERSION_REQUIRED, REDIS_SCAN_KEYS_COUNT,
+    REDIS_USE_CONNECTION_POOL
 )
 
 
@@ -25,6 +28,29 @@ class RedisLock(LockingBackend):
             redis_url = setting_backend_arguments.value.get('redis_url', None)
             cls._connection_pool = redis.ConnectionPool.from_url(url=redis_url)
 
+    @classmethod
+    def _wait_for_release(cls, name, timeout):
+        # Wake up as soon as the holder publishes the release of the lock
+        # instead of sleeping for the whole timeout.
+        pubsub = cls.get_redis_connection().pubsub(
+            ignore_subscribe_messages=True
+        )
+        deadline = time.time() + timeout
+        try:
+            pubsub.subscribe(cls.get_release_channel(name=name))
+
+            while True:
+                remaining = deadline - time.time()
+                # The subscription confirmation is returned as None.
+                if remaining <= 0 or pubsub.get_message(timeout=remaining):
+                    break
+        finally:
+            pubsub.close()
+
+    @staticmethod
+    def get_release_channel(name):
+        return '{}{}'.format(REDIS_LOCK_RELEASE_CHANNEL_PREFIX, name)
+
     @classmethod
     def get_redis_connection(cls):
         if REDIS_USE_CONNECTION_POOL:
@@ -77,3 +103,7 @@ class RedisLock(LockingBackend):
             self._redis_lock_instance.release()
         except redis.exceptions.LockNotOwnedError:
             return
+        else:
+            self.__class__.get_redis_connection().publish(
+                self.__class__.get_release_channel(name=self.name), 1
+            )
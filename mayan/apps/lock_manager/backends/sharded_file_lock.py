@@ -0,0 +1,147 @@
+import fcntl
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.utils.encoding import force_bytes, force_text
+
+from mayan.apps.storage.settings import setting_temporary_directory
+
+from ..exceptions import LockError
+
+from .base import LockingBackend
+from .literals import (
+    SHARDED_FILE_LOCK_DIRECTORY_PREFIX, SHARDED_FILE_LOCK_THREAD_LOCK_COUNT
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class ShardedFileLock(LockingBackend):
+    """
+    Local lock backend that stores each lock in its own file. The lock files
+    are distributed in subdirectories by the hash of the lock name. Access
+    to a lock file is serialized with a byte range lock on the file and
+    with one of a fixed set of thread locks, selected by the same hash,
+    for the threads of the same process. Locks of different names only
+    contend when their hashes share a thread lock.
+    """
+    _thread_locks = [
+        threading.Lock() for index in range(
+            SHARDED_FILE_LOCK_THREAD_LOCK_COUNT
+        )
+    ]
+
+    @classmethod
+    def _acquire_lock(cls, name, timeout):
+        return ShardedFileLock(name=name, timeout=timeout)
+
+    @classmethod
+    def _initialize(cls):
+        cls.lock_directory = os.path.join(
+            setting_temporary_directory.value, '{}{}'.format(
+                SHARDED_FILE_LOCK_DIRECTORY_PREFIX, hashlib.sha256(
+                    force_bytes(s=settings.SECRET_KEY)
+                ).hexdigest()
+            )
+        )
+        os.makedirs(name=cls.lock_directory, exist_ok=True)
+        logger.debug('lock_directory: %s', cls.lock_directory)
+
+    @classmethod
+    def _open_locked(cls, path):
+        """
+        Open and lock a lock file. Retry if the file was removed or replaced
+        while waiting for the lock.
+        """
+        while True:
+            file_descriptor = os.open(path, os.O_CREAT | os.O_RDWR)
+            fcntl.lockf(file_descriptor, fcntl.LOCK_EX, 1, 0)
+
+            try:
+                if os.stat(path).st_ino == os.fstat(file_descriptor).st_ino:
+                    return file_descriptor
+            except FileNotFoundError:
+                # The file was removed by its previous holder.
+                pass
+
+            os.close(file_descriptor)
+
+    @classmethod
+    def _purge_locks(cls):
+        for dirpath, dirnames, filenames in os.walk(top=cls.lock_directory):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                file_descriptor = cls._open_locked(path=path)
+                try:
+                    os.unlink(path)
+                finally:
+                    os.close(file_descriptor)
+
+    @classmethod
+    def get_lock_path(cls, name):
+        name_hash = hashlib.sha256(force_bytes(s=name)).hexdigest()
+
+        return (
+            os.path.join(cls.lock_directory, name_hash[:2], name_hash),
+            cls._thread_locks[
+                int(name_hash[:8], 16) % SHARDED_FILE_LOCK_THREAD_LOCK_COUNT
+            ]
+        )
+
+    def _init(self, name, timeout):
+        self.name = name
+        self.timeout = timeout
+        self.uuid = force_text(s=uuid.uuid4())
+        self.path, self.thread_lock = self.__class__.get_lock_path(name=name)
+
+        if self.timeout:
+            expiration = time.time() + self.timeout
+        else:
+            expiration = 0
+
+        os.makedirs(name=os.path.dirname(self.path), exist_ok=True)
+
+        with self.thread_lock:
+            file_descriptor = self.__class__._open_locked(path=self.path)
+            try:
+                data = force_text(s=os.read(file_descriptor, 128))
+
+                if data:
+                    lock_uuid, lock_expiration = data.split()
+                    lock_expiration = float(lock_expiration)
+
+                    # Someone already got this lock, check to see if it is
+                    # expired.
+                    if not lock_expiration or time.time() <= lock_expiration:
+                        raise LockError
+
+                os.lseek(file_descriptor, 0, os.SEEK_SET)
+                os.ftruncate(file_descriptor, 0)
+                os.write(
+                    file_descriptor, force_bytes(
+                        s='{} {}'.format(self.uuid, expiration)
+                    )
+                )
+            finally:
+                os.close(file_descriptor)
+
+    def _release(self):
+        with self.thread_lock:
+            file_descriptor = self.__class__._open_locked(path=self.path)
+            try:
+                data = force_text(s=os.read(file_descriptor, 128))
+
+                if not data or data.split()[0] == self.uuid:
+                    # Remove the file if it is ours or if it was released by
+                    # someone else after our lock expired.
+                    os.unlink(self.path)
+                else:
+                    # Lock expired and someone else acquired it
+                    pass
+            finally:
+                os.close(file_descriptor)
@@ -1,6 +1,21 @@
-DEFAULT_LOCK_MANAGER_BACKEND = 'mayan.apps.lock_manager.backends.file_lock.FileLock'
+DEFAULT_LOCK_MANAGER_BACKEND = 'mayan.apps.lock_manager.backends.sharded_file_lock.ShardedFileLock'
 DEFAULT_LOCK_MANAGER_BACKEND_ARGUMENTS = {}
 DEFAULT_LOCK_MANAGER_DEFAULT_LOCK_TIMEOUT = 30
+DEFAULT_LOCK_MANAGER_WAIT_TIMEOUT = 5
+
+BENCHMARK_LOCKS_BACKENDS = (
+    'mayan.apps.lock_manager.backends.file_lock.FileLock',
+    'mayan.apps.lock_manager.backends.model_lock.ModelLock',
+    'mayan.apps.lock_manager.backends.sharded_file_lock.ShardedFileLock'
+)
+BENCHMARK_LOCKS_DEFAULT_ITERATIONS = 1000
+BENCHMARK_LOCKS_DEFAULT_NAME_COUNT = 100
+BENCHMARK_LOCKS_DEFAULT_THREAD_COUNT = 1
+BENCHMARK_LOCKS_NAME_PREFIX = '_mayan_benchmark_lock_'
+
+LOCK_STATISTICS_MAXIMUM_NAMES = 1000
+LOCK_WAIT_BACKOFF_INITIAL = 0.01
+LOCK_WAIT_BACKOFF_MAXIMUM = 0.5
 
 PURGE_LOCKS_COMMAND = 'purgelocks'
 
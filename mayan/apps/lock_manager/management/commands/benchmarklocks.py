@@ -0,0 +1,108 @@
+import threading
+import time
+
+from django.core import management
+from django.db import connection
+from django.utils.module_loading import import_string
+
+from ...exceptions import LockError
+from ...literals import (
+    BENCHMARK_LOCKS_BACKENDS, BENCHMARK_LOCKS_DEFAULT_ITERATIONS,
+    BENCHMARK_LOCKS_DEFAULT_NAME_COUNT, BENCHMARK_LOCKS_DEFAULT_THREAD_COUNT,
+    BENCHMARK_LOCKS_NAME_PREFIX
+)
+
+
+class Command(management.BaseCommand):
+    help = 'Measure the acquire and release throughput of lock backends.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--backends', default=BENCHMARK_LOCKS_BACKENDS, dest='backends',
+            help='Dotted paths of the lock backends to measure.', nargs='+'
+        )
+        parser.add_argument(
+            '--iterations', default=BENCHMARK_LOCKS_DEFAULT_ITERATIONS,
+            dest='iterations', help='Lock acquisitions per thread.',
+            type=int
+        )
+        parser.add_argument(
+            '--names', default=BENCHMARK_LOCKS_DEFAULT_NAME_COUNT,
+            dest='names', help='Number of different lock names to use.',
+            type=int
+        )
+        parser.add_argument(
+            '--threads', default=BENCHMARK_LOCKS_DEFAULT_THREAD_COUNT,
+            dest='threads', help='Number of concurrent threads.', type=int
+        )
+
+    def benchmark(self, backend, iterations, names, threads):
+        results = {'contended': 0, 'acquired': 0}
+        results_lock = threading.Lock()
+
+        def worker(thread_index):
+            acquired = 0
+            contended = 0
+
+            try:
+                for iteration in range(iterations):
+                    name = '{}{}'.format(
+                        BENCHMARK_LOCKS_NAME_PREFIX,
+                        (thread_index + iteration) % names
+                    )
+                    try:
+                        lock = backend.acquire_lock(name=name)
+                    except LockError:
+                        contended += 1
+                    else:
+                        lock.release()
+                        acquired += 1
+            finally:
+                if threads > 1:
+                    connection.close()
+
+            with results_lock:
+                results['acquired'] += acquired
+                results['contended'] += contended
+
+        start_time = time.time()
+
+        if threads > 1:
+            thread_list = [
+                threading.Thread(
+                    kwargs={'thread_index': thread_index}, target=worker
+                ) for thread_index in range(threads)
+            ]
+            for thread in thread_list:
+                thread.start()
+            for thread in thread_list:
+                thread.join()
+        else:
+            worker(thread_index=0)
+
+        results['elapsed'] = time.time() - start_time
+
+        return results
+
+    def handle(self, *args, **options):
+        for backend_path in options['backends']:
+            backend = import_string(dotted_path=backend_path)
+            # Start from a clean state and initialize the backend outside
+            # of the measurement.
+            backend.purge_locks()
+
+            results = self.benchmark(
+                backend=backend, iterations=options['iterations'],
+                names=options['names'], threads=options['threads']
+            )
+
+            total = results['acquired'] + results['contended']
+            self.stdout.write(
+                '{}: {} acquire attempts, {} contended, {:.3f} seconds, '
+                '{:.1f} attempts per second.'.format(
+                    backend_path, total, results['contended'],
+                    results['elapsed'], total / results['elapsed'] if results['elapsed'] else 0
+                )
+            )
+
+            backend.purge_locks()
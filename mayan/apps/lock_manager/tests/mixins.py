@@ -34,6 +34,49 @@ class LockBackendTestMixin:
 
 
 class LockBackendTestCaseMixin:
+    def test_blocking_expired(self):
+        self.locking_backend.acquire_lock(name=TEST_LOCK_1, timeout=1)
+
+        # Waits until lock_1 expires.
+        lock_2 = self.locking_backend.acquire_lock(
+            blocking=True, name=TEST_LOCK_1, wait_timeout=5
+        )
+
+        # Cleanup
+        lock_2.release()
+
+    def test_blocking_wait_timeout(self):
+        lock_1 = self.locking_backend.acquire_lock(
+            name=TEST_LOCK_1, timeout=30
+        )
+
+        with self.assertRaises(expected_exception=LockError):
+            self.locking_backend.acquire_lock(
+                blocking=True, name=TEST_LOCK_1, wait_timeout=0.1
+            )
+
+        # Cleanup
+        lock_1.release()
+
+    def test_statistics(self):
+        statistics = self.locking_backend.get_statistics(name=TEST_LOCK_1)
+
+        lock_1 = self.locking_backend.acquire_lock(name=TEST_LOCK_1)
+        with self.assertRaises(expected_exception=LockError):
+            self.locking_backend.acquire_lock(name=TEST_LOCK_1)
+
+        # Cleanup
+        lock_1.release()
+
+        self.assertEqual(
+            self.locking_backend.get_statistics(name=TEST_LOCK_1)['acquired'],
+            statistics.get('acquired', 0) + 1
+        )
+        self.assertEqual(
+            self.locking_backend.get_statistics(name=TEST_LOCK_1)['contended'],
+            statistics.get('contended', 0) + 1
+        )
+
     def test_exclusive(self):
         lock_1 = self.locking_backend.acquire_lock(name=TEST_LOCK_1)
         with self.assertRaises(expected_exception=LockError):
@@ -23,6 +23,13 @@ class ModelLockBackendTestCase(
     backend_string = 'mayan.apps.lock_manager.backends.model_lock.ModelLock'
 
 
+class ShardedFileLockBackendTestCase(
+    LockBackendTestMixin, LockBackendTestCaseMixin, DefaultTimeoutTestMixin,
+    BaseTestCase
+):
+    backend_string = 'mayan.apps.lock_manager.backends.sharded_file_lock.ShardedFileLock'
+
+
 @skip('Skip until a Mock Redis server class is added.')
 @override_settings(
     LOCK_MANAGER_BACKEND_ARGUMENTS={'redis_url': 'redis://127.0.0.1:6379/0'}
@@ -1,5 +1,7 @@
+from io import StringIO
 from unittest import skip
 
+from django.core import management
 from django.test import override_settings
 
 from mayan.apps.testing.tests.base import BaseTestCase
@@ -23,6 +25,13 @@ class ModelLockBackendManagementCommandTestCase(
     backend_string = 'mayan.apps.lock_manager.backends.model_lock.ModelLock'
 
 
+class ShardedFileLockBackendManagementCommandTestCase(
+    LockBackendTestMixin, LockBackendManagementCommandTestCaseMixin,
+    BaseTestCase
+):
+    backend_string = 'mayan.apps.lock_manager.backends.sharded_file_lock.ShardedFileLock'
+
+
 @skip('Skip until a Mock Redis server class is added.')
 @override_settings(
     LOCK_MANAGER_BACKEND_ARGUMENTS={'redis_url': 'redis://127.0.0.1:6379/0'}
@@ -32,3 +41,16 @@ class RedisLockBackendManagementCommandTestCase(
     BaseTestCase
 ):
     backend_string = 'mayan.apps.lock_manager.backends.redis_lock.RedisLock'
+
+
+class BenchmarkLocksManagementCommandTestCase(BaseTestCase):
+    def test_benchmarklocks_command(self):
+        stdout = StringIO()
+        management.call_command(
+            'benchmarklocks', iterations=10, names=2, stdout=stdout
+        )
+
+        output = stdout.getvalue()
+        self.assertTrue('FileLock: 10 acquire attempts' in output)
+        self.assertTrue('ModelLock: 10 acquire attempts' in output)
+        self.assertTrue('ShardedFileLock: 10 acquire attempts' in output)
@@ -1,9 +1,79 @@
 from shutil import copyfileobj
+import os
+import threading
 
 import magic
 
 from mayan.apps.storage.utils import NamedTemporaryFile
 
+from .literals import MIMETYPE_FILE_REQUIRED_TYPES
+from .settings import setting_file_read_size
+
+_thread_local = threading.local()
+
+
+def _get_file_path(file_object):
+    """
+    Return the path of the file if the file object is backed by a file
+    of the local filesystem.
+    """
+    name = getattr(file_object, 'name', None)
+
+    if isinstance(name, str) and os.path.isfile(name):
+        return name
+
+
+def _get_magic(mime, mime_encoding):
+    """
+    Return a libmagic handle for the calling thread. Handles are not thread
+    safe and costly to create, they are reused by each thread.
+    """
+    try:
+        handles = _thread_local.handles
+    except AttributeError:
+        handles = _thread_local.handles = {}
+
+    key = (mime, mime_encoding)
+
+    try:
+        return handles[key]
+    except KeyError:
+        handles[key] = magic.Magic(mime=mime, mime_encoding=mime_encoding)
+        return handles[key]
+
+
+def _get_magic_result(file_object, magic_handle):
+    """
+    Identify the file using only its first bytes. Fallback to inspecting the
+    entire file if libmagic can't identify the format from them.
+    """
+    read_size = setting_file_read_size.value
+
+    file_object.seek(0)
+    if read_size:
+        data = file_object.read(read_size)
+        is_complete = len(data) < read_size
+    else:
+        data = file_object.read()
+        is_complete = True
+    file_object.seek(0)
+
+    result = magic_handle.from_buffer(buffer=data)
+
+    if is_complete or result.split(';')[0] not in MIMETYPE_FILE_REQUIRED_TYPES:
+        return result
+
+    file_path = _get_file_path(file_object=file_object)
+    if file_path:
+        return magic_handle.from_file(filename=file_path)
+
+    with NamedTemporaryFile() as temporary_file_object:
+        copyfileobj(fsrc=file_object, fdst=temporary_file_object)
+        file_object.seek(0)
+        temporary_file_object.flush()
+
+        return magic_handle.from_file(filename=temporary_file_object.name)
+
 
 def get_mimetype(file_object, mime=True, mimetype_only=False):
     """
@@ -13,27 +83,14 @@ def get_mimetype(file_object, mime=True, mimetype_only=False):
     file_mimetype = None
     file_mime_encoding = None
 
-    temporary_file_object = NamedTemporaryFile()
-    file_object.seek(0)
-    copyfileobj(fsrc=file_object, fdst=temporary_file_object)
-    file_object.seek(0)
-    temporary_file_object.seek(0)
-
-    kwargs = {'mime': mime}
+    magic_handle = _get_magic(mime=mime, mime_encoding=not mimetype_only)
+    result = _get_magic_result(
+        file_object=file_object, magic_handle=magic_handle
+    )
 
-    if not mimetype_only:
-        kwargs['mime_encoding'] = True
-
-    try:
-        mime = magic.Magic(**kwargs)
-
-        if mimetype_only:
-            file_mimetype = mime.from_file(filename=temporary_file_object.name)
-        else:
-            file_mimetype, file_mime_encoding = mime.from_file(
-                filename=temporary_file_object.name
-            ).split('; charset=')
-    finally:
-        temporary_file_object.close()
+    if mimetype_only:
+        file_mimetype = result
+    else:
+        file_mimetype, file_mime_encoding = result.split('; charset=')
 
     return file_mimetype, file_mime_encoding
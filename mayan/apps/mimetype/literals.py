@@ -0,0 +1,9 @@
+DEFAULT_MIMETYPE_FILE_READ_SIZE = 1024 * 1024
+
+# MIME types that libmagic may report when the header of the file is not
+# enough to identify the format. Files of these types are inspected
+# complete.
+MIMETYPE_FILE_REQUIRED_TYPES = (
+    'application/CDFV2', 'application/octet-stream',
+    'application/x-ole-storage', 'application/zip'
+)
@@ -0,0 +1,64 @@
+import os
+import time
+
+from django.core import management
+
+from ...api import get_mimetype
+
+
+class ReadCountingFile:
+    """
+    File object proxy that counts the bytes read from the file.
+    """
+    def __init__(self, file_object):
+        self.bytes_read = 0
+        self.file_object = file_object
+
+    def read(self, *args, **kwargs):
+        data = self.file_object.read(*args, **kwargs)
+        self.bytes_read += len(data)
+        return data
+
+    def seek(self, *args, **kwargs):
+        return self.file_object.seek(*args, **kwargs)
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Measure the time and the bytes read from the file to determine the '
+        'MIME type of files.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths', help='Files to analyze.', metavar='PATH', nargs='+'
+        )
+        parser.add_argument(
+            '--iterations', default=10, dest='iterations',
+            help='Number of times to analyze each file.', type=int
+        )
+
+    def handle(self, *args, **options):
+        for path in options['paths']:
+            with open(file=path, mode='rb') as file_object:
+                # The proxy hides the path of the file to measure the
+                # case of files from storage backends.
+                counting_file_object = ReadCountingFile(
+                    file_object=file_object
+                )
+
+                start_time = time.time()
+                for iteration in range(options['iterations']):
+                    mimetype, encoding = get_mimetype(
+                        file_object=counting_file_object
+                    )
+                elapsed = time.time() - start_time
+
+            self.stdout.write(
+                '{}: {}, {} bytes, {} bytes read per call, {:.2f} '
+                'milliseconds per call.'.format(
+                    path, mimetype, os.path.getsize(path),
+                    counting_file_object.bytes_read // options['iterations'],
+                    elapsed * 1000 / options['iterations']
+                )
+            )
@@ -1,3 +1,4 @@
+from io import BytesIO
 import resource
 import unittest
 
@@ -5,10 +6,17 @@ from django.test import override_settings, tag
 
 from mayan.apps.documents.models import Document
 from mayan.apps.documents.tests.base import DocumentTestMixin
-from mayan.apps.documents.tests.literals import TEST_PDF_DOCUMENT_FILENAME
+from mayan.apps.documents.tests.literals import (
+    TEST_COMPRESSED_DOCUMENT_PATH, TEST_DOCUMENT_PATH,
+    TEST_PDF_DOCUMENT_FILENAME
+)
 from mayan.apps.testing.literals import EXCLUDE_TEST_TAG
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..api import get_mimetype
+from ..management.commands.benchmarkmimetype import ReadCountingFile
+from ..settings import setting_file_read_size
+
 from .literals import MAXIMUM_HEAP_MEMORY
 
 
@@ -33,3 +41,55 @@ class MIMETypeTestCase(DocumentTestMixin, BaseTestCase):
         self._upload_test_document()
 
         self.assertEqual(Document.objects.count(), 1)
+
+
+class GetMIMETypeTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._file_read_size = setting_file_read_size.value
+        setting_file_read_size.set(value=1024)
+
+    def tearDown(self):
+        setting_file_read_size.set(value=self._file_read_size)
+        super().tearDown()
+
+    def _get_test_file_object(self, path):
+        with open(file=path, mode='rb') as file_object:
+            # Use an in memory copy without a path to test the case of
+            # files from storage backends.
+            return ReadCountingFile(file_object=BytesIO(file_object.read()))
+
+    def test_header_read(self):
+        file_object = self._get_test_file_object(path=TEST_DOCUMENT_PATH)
+
+        self.assertEqual(
+            get_mimetype(file_object=file_object, mimetype_only=True)[0],
+            'application/pdf'
+        )
+        self.assertEqual(file_object.bytes_read, 1024)
+
+    def test_full_read(self):
+        setting_file_read_size.set(value=0)
+        file_object = self._get_test_file_object(path=TEST_DOCUMENT_PATH)
+
+        self.assertEqual(
+            get_mimetype(file_object=file_object)[0], 'application/pdf'
+        )
+        self.assertEqual(
+            file_object.bytes_read, len(file_object.file_object.getvalue())
+        )
+
+    def test_file_required_type(self):
+        file_object = self._get_test_file_object(
+            path=TEST_COMPRESSED_DOCUMENT_PATH
+        )
+
+        self.assertEqual(
+            get_mimetype(file_object=file_object)[0], 'application/zip'
+        )
+        # The header is read and then the file is copied to be inspected
+        # complete.
+        self.assertEqual(
+            file_object.bytes_read,
+            1024 + len(file_object.file_object.getvalue())
+        )
@@ -251,6 +251,37 @@ class Menu:
             source_links.append(link)
             self.link_positions[link] = position or 0
 
+    @classmethod
+    def prefetch_access(cls, objects, request, names=None):
+        """
+        Check the access to the links of the menus for a list of objects in
+        bulk. The access decisions are cached for the request making the
+        later resolution of the menus of each object not cause additional
+        ACL queries.
+        """
+        AccessControlList = apps.get_model(
+            app_label='acls', model_name='AccessControlList'
+        )
+
+        if names:
+            menus = [cls.get(name=name) for name in names]
+        else:
+            menus = cls._registry.values()
+
+        objects = list(objects)
+        permissions = set()
+
+        for source_class in set(type(obj) for obj in objects):
+            for menu in menus:
+                permissions.update(
+                    menu.get_link_permissions(source_class=source_class)
+                )
+
+        if permissions:
+            AccessControlList.objects.get_permitted_objects(
+                objects=objects, permissions=permissions, user=request.user
+            )
+
     def add_proxy_inclusions(self, source):
         self.proxy_inclusions.add(source)
 
@@ -282,6 +313,19 @@ class Menu:
                 links=links, position=position, source=sources
             )
 
+    def get_link_permissions(self, source_class):
+        """
+        Return the permissions required by the links bound to a class.
+        """
+        result = set()
+
+        for bound_source, links in self.bound_links.items():
+            if inspect.isclass(bound_source) and issubclass(source_class, bound_source):
+                for link in links:
+                    result.update(getattr(link, 'permissions', ()))
+
+        return result
+
     def get_resolved_navigation_object_list(self, context, source):
         resolved_navigation_object_list = []
 
@@ -364,6 +408,12 @@ class Menu:
             context=context, source=source
         )
 
+        if len(resolved_navigation_object_list) > 1:
+            self.__class__.prefetch_access(
+                names=(self.name,), objects=resolved_navigation_object_list,
+                request=request
+            )
+
         for resolved_navigation_object in resolved_navigation_object_list:
             resolved_links = []
 
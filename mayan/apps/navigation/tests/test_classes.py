@@ -203,6 +203,38 @@ class MenuClassTestCase(GenericViewTestCase):
 
         self.assertEqual(self.menu.resolve(context=context), [])
 
+    def test_prefetch_access(self):
+        ModelPermission.register(
+            model=self.test_object._meta.model,
+            permissions=(self.test_permission,)
+        )
+        link = Link(
+            permissions=(self.test_permission,), text=TEST_LINK_TEXT,
+            view=TEST_VIEW_NAME
+        )
+        self.menu.bind_links(
+            links=(link,), sources=(self.test_object._meta.model,)
+        )
+
+        self.grant_access(
+            obj=self.test_object, permission=self.test_permission
+        )
+
+        response = self.get(viewname=TEST_VIEW_NAME)
+        context = Context({'request': response.wsgi_request})
+
+        Menu.prefetch_access(
+            names=(TEST_MENU_NAME,), objects=(self.test_object,),
+            request=response.wsgi_request
+        )
+
+        with self.assertNumQueries(num=0):
+            result = self.menu.resolve(
+                context=context, source=self.test_object
+            )
+
+        self.assertEqual(result[0]['links'][0].link, link)
+
 
 class SourceColumnClassTestCase(GenericViewTestCase):
     def setUp(self):
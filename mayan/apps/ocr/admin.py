@@ -8,7 +8,10 @@ from .models import (
 
 @admin.register(DocumentTypeOCRSettings)
 class DocumentTypeOCRSettingsAdmin(admin.ModelAdmin):
-    list_display = ('document_type', 'auto_ocr')
+    list_display = (
+        'document_type', 'auto_ocr', 'page_chunk_size',
+        'skip_text_layer_pages'
+    )
 
 
 @admin.register(DocumentVersionOCRError)
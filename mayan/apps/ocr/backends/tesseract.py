@@ -1,6 +1,7 @@
 import logging
 import os
 import shutil
+import threading
 
 import sh
 
@@ -12,7 +13,16 @@ from mayan.apps.storage.utils import TemporaryFile
 from ..classes import OCRBackendBase
 from ..exceptions import OCRError
 
-from .literals import DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT
+from .literals import (
+    DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_ENGINE_POOL_SIZE,
+    DEFAULT_TESSERACT_LANGUAGE, DEFAULT_TESSERACT_TIMEOUT
+)
+
+try:
+    # Optional in process binding of the Tesseract library.
+    import tesserocr
+except ImportError:
+    tesserocr = None
 
 logger = logging.getLogger(name=__name__)
 
@@ -59,18 +69,9 @@ class Tesseract(OCRBackendBase):
                     )
                     return force_text(s=result.stdout)
                 except Exception as exception:
-                    error_message = (
-                        'Exception calling Tesseract with language option: {}; {}'
-                    ).format(self.language, exception)
-
-                    if self.language not in self.languages:
-                        error_message = (
-                            '{}\nThe requested OCR language "{}" is not '
-                            'available and needs to be installed.\n'
-                        ).format(
-                            error_message, self.language
-                        )
-
+                    error_message = self.get_error_message(
+                        exception=exception
+                    )
                     logger.error(error_message, exc_info=True)
                     raise OCRError(error_message)
                 else:
@@ -78,6 +79,21 @@ class Tesseract(OCRBackendBase):
             finally:
                 temporary_image_file.close()
 
+    def get_error_message(self, exception):
+        error_message = (
+            'Exception calling Tesseract with language option: {}; {}'
+        ).format(self.language, exception)
+
+        if self.language not in self.languages:
+            error_message = (
+                '{}\nThe requested OCR language "{}" is not '
+                'available and needs to be installed.\n'
+            ).format(
+                error_message, self.language
+            )
+
+        return error_message
+
     def initialize(self):
         self.languages = ()
 
@@ -116,3 +132,132 @@ class Tesseract(OCRBackendBase):
         self.tesseract_binary_path = self.kwargs.get(
             'tesseract_path', DEFAULT_TESSERACT_BINARY_PATH
         )
+
+
+class TesseractAPI(Tesseract):
+    """
+    Tesseract backend that uses the library in process via the tesserocr
+    binding instead of executing the binary for each page. The engines
+    are kept loaded per language between pages, in each worker process,
+    to avoid loading the language models every time. The timeout
+    argument is not supported.
+    """
+    _engines = {}
+    _languages = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _engine_acquire(cls, language, tessdata_path):
+        with cls._lock:
+            try:
+                return cls._engines.get((language, tessdata_path), []).pop()
+            except IndexError:
+                # No idle engine for this language.
+                pass
+
+        keyword_arguments = {'lang': language}
+        if tessdata_path:
+            keyword_arguments['path'] = tessdata_path
+
+        return tesserocr.PyTessBaseAPI(**keyword_arguments)
+
+    @classmethod
+    def _engine_release(cls, engine, language, tessdata_path, pool_size):
+        engine.Clear()
+
+        with cls._lock:
+            engines = cls._engines.setdefault((language, tessdata_path), [])
+            if len(engines) < pool_size:
+                engines.append(engine)
+                return
+
+        engine.End()
+
+    @classmethod
+    def engines_end(cls):
+        """
+        Unload all the idle engines.
+        """
+        with cls._lock:
+            for engines in cls._engines.values():
+                for engine in engines:
+                    engine.End()
+
+            cls._engines.clear()
+
+    def execute(self, *args, **kwargs):
+        """
+        Recognize the text of the page image using a loaded engine
+        """
+        OCRBackendBase.execute(self, *args, **kwargs)
+
+        if not self.converter.image:
+            self.converter.seek_page(page_number=0)
+
+        language = self.language or DEFAULT_TESSERACT_LANGUAGE
+
+        try:
+            engine = self.__class__._engine_acquire(
+                language=language, tessdata_path=self.tessdata_path
+            )
+        except Exception as exception:
+            error_message = self.get_error_message(exception=exception)
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+
+        try:
+            engine.SetImage(self.converter.image)
+            result = engine.GetUTF8Text()
+        except Exception as exception:
+            # Don't reuse an engine in an unknown state.
+            engine.End()
+
+            error_message = self.get_error_message(exception=exception)
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+        else:
+            self.__class__._engine_release(
+                engine=engine, language=language,
+                pool_size=self.engine_pool_size,
+                tessdata_path=self.tessdata_path
+            )
+            return force_text(s=result)
+
+    def initialize(self):
+        self.languages = ()
+
+        if not tesserocr:
+            raise OCRError(
+                _('The tesserocr Python binding is not installed.')
+            )
+
+        # The environment is read by the library when the engines are
+        # created.
+        os.environ.update(self.environment)
+
+        with self.__class__._lock:
+            languages = self.__class__._languages.get(self.tessdata_path)
+
+        if languages is None:
+            if self.tessdata_path:
+                path, languages = tesserocr.get_languages(self.tessdata_path)
+            else:
+                path, languages = tesserocr.get_languages()
+
+            logger.debug(
+                'Tesseract version: %s', tesserocr.tesseract_version()
+            )
+
+            with self.__class__._lock:
+                self.__class__._languages[self.tessdata_path] = languages
+
+        self.languages = languages
+
+        logger.debug('Available languages: %s', ', '.join(self.languages))
+
+    def read_settings(self):
+        super().read_settings()
+        self.engine_pool_size = self.kwargs.get(
+            'engine_pool_size', DEFAULT_TESSERACT_ENGINE_POOL_SIZE
+        )
+        self.tessdata_path = self.kwargs.get('tessdata_path', None)
@@ -0,0 +1,66 @@
+import time
+
+from django.core import management
+from django.utils.module_loading import import_string
+
+from ...exceptions import OCRError
+from ...literals import DEFAULT_OCR_BACKEND
+from ...settings import setting_ocr_backend_arguments
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Compare the pages per minute of OCR backends. Each backend is '
+        'instantiated for every page, the same way the OCR tasks do.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths', help='Page image files to process.', metavar='PATH',
+            nargs='+'
+        )
+        parser.add_argument(
+            '--backend', action='append', dest='backends',
+            help='Full path of a backend to benchmark. Can be repeated. '
+            'Defaults to the Tesseract binary and library backends.'
+        )
+        parser.add_argument(
+            '--language', default=None, dest='language',
+            help='OCR language of the pages.'
+        )
+
+    def handle(self, *args, **options):
+        backends = options['backends'] or (
+            DEFAULT_OCR_BACKEND,
+            'mayan.apps.ocr.backends.tesseract.TesseractAPI'
+        )
+
+        for backend in backends:
+            backend_class = import_string(dotted_path=backend)
+
+            start_time = time.time()
+            try:
+                for path in options['paths']:
+                    with open(file=path, mode='rb') as file_object:
+                        backend_class(
+                            **setting_ocr_backend_arguments.value
+                        ).execute(
+                            file_object=file_object,
+                            language=options['language']
+                        )
+            except OCRError as exception:
+                self.stderr.write(
+                    '{}: unable to process the pages; {}'.format(
+                        backend, exception
+                    )
+                )
+                continue
+
+            elapsed = time.time() - start_time
+
+            self.stdout.write(
+                '{}: {} pages, {:.2f} pages per minute.'.format(
+                    backend, len(options['paths']),
+                    len(options['paths']) * 60 / elapsed
+                )
+            )
@@ -2,17 +2,60 @@ import logging
 
 from django.apps import apps
 from django.db import models
+from django.utils.translation import ugettext as _
 
+from mayan.apps.document_parsing.parsers import Parser
 from mayan.apps.documents.literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from mayan.apps.lock_manager.backends.base import LockingBackend
 
 from .classes import OCRBackendBase
 from .events import event_ocr_document_version_content_deleted
+from .literals import TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT
+from .utils import evaluate_text_layer
 
 logger = logging.getLogger(name=__name__)
 
 
 class DocumentVersionPageOCRContentManager(models.Manager):
+    def _get_text_layer_content(self, document_version_page):
+        """
+        Return the parsed text of the page if it has a usable text layer or
+        None otherwise, and the reason of the decision.
+        """
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+        DocumentFilePageContent = apps.get_model(
+            app_label='document_parsing', model_name='DocumentFilePageContent'
+        )
+
+        content_object = document_version_page.content_object
+
+        if not isinstance(content_object, DocumentFilePage):
+            return None, _('Page is not a document file page.')
+
+        try:
+            content = DocumentFilePageContent.objects.get(
+                document_file_page=content_object
+            ).content
+        except DocumentFilePageContent.DoesNotExist:
+            # The page was not parsed yet, parse it now.
+            Parser.parse_document_file_page(document_file_page=content_object)
+
+            try:
+                content = DocumentFilePageContent.objects.get(
+                    document_file_page=content_object
+                ).content
+            except DocumentFilePageContent.DoesNotExist:
+                return None, _('Page has no text layer.')
+
+        is_usable, reason = evaluate_text_layer(content=content)
+
+        if is_usable:
+            return content, reason
+        else:
+            return None, reason
+
     def delete_content_for(self, document_version, user=None):
         self.filter(document_version_page__document_version=document_version).delete()
 
@@ -38,27 +81,39 @@ class DocumentVersionPageOCRContentManager(models.Manager):
 
         try:
             document_version_page_lock = LockingBackend.get_backend().acquire_lock(
-                name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
-
+                blocking=True, name=lock_name,
+                timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
             )
         except Exception:
             raise
         else:
             try:
-                cache_filename = document_version_page.generate_image(
-                    _acquire_lock=False, user=user
-                )
+                document = document_version_page.document_version.document
 
-                with document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
-                    ocr_content = OCRBackendBase.get_instance().execute(
-                        file_object=file_object,
-                        language=document_version_page.document_version.document.language
+                if document.document_type.ocr_settings.skip_text_layer_pages:
+                    ocr_content, text_layer_reason = self._get_text_layer_content(
+                        document_version_page=document_version_page
                     )
-                    DocumentVersionPageOCRContent.objects.update_or_create(
-                        document_version_page=document_version_page, defaults={
-                            'content': ocr_content
-                        }
+                else:
+                    ocr_content, text_layer_reason = None, ''
+
+                if ocr_content is None:
+                    cache_filename = document_version_page.generate_image(
+                        _acquire_lock=False, user=user
                     )
+
+                    with document_version_page.cache_partition.get_file(filename=cache_filename, use_index=False).open() as file_object:
+                        ocr_content = OCRBackendBase.get_instance().execute(
+                            file_object=file_object,
+                            language=document.language
+                        )
+
+                DocumentVersionPageOCRContent.objects.update_or_create(
+                    document_version_page=document_version_page, defaults={
+                        'content': ocr_content,
+                        'text_layer_reason': text_layer_reason
+                    }
+                )
             except Exception as exception:
                 logger.error(
                     'OCR error for document version page: %d; %s',
@@ -74,6 +129,115 @@ class DocumentVersionPageOCRContentManager(models.Manager):
             finally:
                 document_version_page_lock.release()
 
+    def process_document_version_page_list(
+        self, document_version_page_list, user=None
+    ):
+        """
+        Process several pages of the same document version using one lock
+        and one OCR backend instance. The content is written in bulk, even
+        if a page fails, before raising the error.
+        """
+        document_version_page_list = list(document_version_page_list)
+
+        if not document_version_page_list:
+            return
+
+        document_version = document_version_page_list[0].document_version
+
+        logger.info(
+            'Processing pages: %d to %d of document version: %s',
+            document_version_page_list[0].page_number,
+            document_version_page_list[-1].page_number, document_version
+        )
+
+        lock_name = 'ocr_document_version_{}_pages_{}_{}'.format(
+            document_version.pk, document_version_page_list[0].pk,
+            document_version_page_list[-1].pk
+        )
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            blocking=True, name=lock_name, timeout=(
+                TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT + DOCUMENT_IMAGE_TASK_TIMEOUT * 2
+            ) * len(document_version_page_list)
+        )
+        try:
+            document = document_version.document
+            ocr_backend = None
+            results = {}
+            skip_text_layer_pages = document.document_type.ocr_settings.skip_text_layer_pages
+
+            try:
+                for document_version_page in document_version_page_list:
+                    if skip_text_layer_pages:
+                        content, text_layer_reason = self._get_text_layer_content(
+                            document_version_page=document_version_page
+                        )
+                    else:
+                        content, text_layer_reason = None, ''
+
+                    if content is None:
+                        if not ocr_backend:
+                            ocr_backend = OCRBackendBase.get_instance()
+
+                        cache_filename = document_version_page.generate_image(
+                            user=user
+                        )
+
+                        with document_version_page.cache_partition.get_file(filename=cache_filename, use_index=False).open() as file_object:
+                            content = ocr_backend.execute(
+                                file_object=file_object,
+                                language=document.language
+                            )
+
+                    results[document_version_page.pk] = (
+                        content, text_layer_reason
+                    )
+            except Exception as exception:
+                logger.error(
+                    'OCR error for document version page: %d; %s',
+                    document_version_page.pk, exception, exc_info=True
+                )
+                raise
+            finally:
+                if results:
+                    self.update_or_create_bulk(results=results)
+        finally:
+            lock.release()
+
+        logger.info(
+            'Finished processing pages: %d to %d of document version: %s',
+            document_version_page_list[0].page_number,
+            document_version_page_list[-1].page_number, document_version
+        )
+
+    def update_or_create_bulk(self, results):
+        """
+        Store the OCR content of several pages, `results` is a dictionary
+        of the content and text layer reason of each document version page
+        ID.
+        """
+        results = results.copy()
+
+        entries_update = []
+        for entry in self.filter(document_version_page_id__in=list(results)):
+            entry.content, entry.text_layer_reason = results.pop(
+                entry.document_version_page_id
+            )
+            entries_update.append(entry)
+
+        self.bulk_update(
+            fields=('content', 'text_layer_reason'), objs=entries_update
+        )
+        self.bulk_create(
+            objs=[
+                self.model(
+                    content=content,
+                    document_version_page_id=document_version_page_id,
+                    text_layer_reason=text_layer_reason
+                ) for document_version_page_id, (content, text_layer_reason) in results.items()
+            ]
+        )
+
 
 class DocumentTypeSettingsManager(models.Manager):
     def get_by_natural_key(self, document_type_natural_key):
@@ -0,0 +1,21 @@
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('ocr', '0010_auto_20210304_1215'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttypeocrsettings',
+            name='page_chunk_size',
+            field=models.PositiveIntegerField(
+                default=10, help_text='Number of document version pages '
+                'processed by each OCR task.', validators=[
+                    django.core.validators.MinValueValidator(limit_value=1)
+                ], verbose_name='Page chunk size'
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('ocr', '0011_documenttypeocrsettings_page_chunk_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttypeocrsettings',
+            name='skip_text_layer_pages',
+            field=models.BooleanField(
+                default=False, help_text='Use the parsed text of the pages '
+                'that have a usable text layer instead of performing OCR on '
+                'them.', verbose_name='Skip pages with a text layer'
+            ),
+        ),
+        migrations.AddField(
+            model_name='documentversionpageocrcontent',
+            name='text_layer_reason',
+            field=models.TextField(
+                blank=True, help_text='Result of the evaluation of the text '
+                'layer of the page, when enabled for the document type.',
+                verbose_name='Text layer reason'
+            ),
+        ),
+    ]
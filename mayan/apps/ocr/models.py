@@ -1,3 +1,4 @@
+from django.core import validators
 from django.db import models
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
@@ -6,6 +7,7 @@ from mayan.apps.documents.models.document_type_models import DocumentType
 from mayan.apps.documents.models.document_version_models import DocumentVersion
 from mayan.apps.documents.models.document_version_page_models import DocumentVersionPage
 
+from .literals import DEFAULT_OCR_PAGE_CHUNK_SIZE
 from .managers import (
     DocumentVersionPageOCRContentManager, DocumentTypeSettingsManager
 )
@@ -23,6 +25,20 @@ class DocumentTypeOCRSettings(models.Model):
         default=True,
         verbose_name=_('Automatically queue newly created documents for OCR.')
     )
+    page_chunk_size = models.PositiveIntegerField(
+        default=DEFAULT_OCR_PAGE_CHUNK_SIZE, help_text=_(
+            'Number of document version pages processed by each OCR task.'
+        ), validators=[
+            validators.MinValueValidator(limit_value=1)
+        ],
+        verbose_name=_('Page chunk size')
+    )
+    skip_text_layer_pages = models.BooleanField(
+        default=False, help_text=_(
+            'Use the parsed text of the pages that have a usable text layer '
+            'instead of performing OCR on them.'
+        ), verbose_name=_('Skip pages with a text layer')
+    )
 
     objects = DocumentTypeSettingsManager()
 
@@ -71,6 +87,12 @@ class DocumentVersionPageOCRContent(models.Model):
             'The actual text content extracted by the OCR backend.'
         ), verbose_name=_('Content')
     )
+    text_layer_reason = models.TextField(
+        blank=True, help_text=_(
+            'Result of the evaluation of the text layer of the page, when '
+            'enabled for the document type.'
+        ), verbose_name=_('Text layer reason')
+    )
 
     objects = DocumentVersionPageOCRContentManager()
 
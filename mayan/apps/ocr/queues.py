@@ -17,3 +17,7 @@ queue_ocr.add_task_type(
     dotted_path='mayan.apps.ocr.tasks.task_document_version_ocr_process',
     label=_('Document file OCR')
 )
+queue_ocr.add_task_type(
+    dotted_path='mayan.apps.ocr.tasks.task_document_version_page_list_ocr_process',
+    label=_('Document file page chunk OCR')
+)
@@ -5,11 +5,11 @@ from .models import DocumentVersionPageOCRContent, DocumentTypeOCRSettings
 
 class DocumentVersionPageOCRContentSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = ('content',)
+        fields = ('content', 'text_layer_reason')
         model = DocumentVersionPageOCRContent
 
 
 class DocumentTypeOCRSettingsSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = ('auto_ocr',)
+        fields = ('auto_ocr', 'page_chunk_size', 'skip_text_layer_pages')
         model = DocumentTypeOCRSettings
@@ -3,7 +3,9 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
-    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
+    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS,
+    DEFAULT_OCR_TEXT_LAYER_MINIMUM_ALPHANUMERIC_RATIO,
+    DEFAULT_OCR_TEXT_LAYER_MINIMUM_CHARACTERS
 )
 from .setting_migrations import OCRSettingMigration
 
@@ -26,3 +28,19 @@ setting_ocr_backend_arguments = namespace.add_setting(
     default=DEFAULT_OCR_BACKEND_ARGUMENTS,
     global_name='OCR_BACKEND_ARGUMENTS'
 )
+setting_text_layer_minimum_alphanumeric_ratio = namespace.add_setting(
+    default=DEFAULT_OCR_TEXT_LAYER_MINIMUM_ALPHANUMERIC_RATIO,
+    global_name='OCR_TEXT_LAYER_MINIMUM_ALPHANUMERIC_RATIO', help_text=_(
+        'Minimum ratio, from 0 to 1, of letters and digits to all the non '
+        'whitespace characters of the text layer of a page for it to be '
+        'used instead of OCR. Lower ratios indicate a text layer with '
+        'broken encoding.'
+    )
+)
+setting_text_layer_minimum_characters = namespace.add_setting(
+    default=DEFAULT_OCR_TEXT_LAYER_MINIMUM_CHARACTERS,
+    global_name='OCR_TEXT_LAYER_MINIMUM_CHARACTERS', help_text=_(
+        'Minimum number of non whitespace characters of the text layer of '
+        'a page for it to be used instead of OCR.'
+    )
+)
@@ -30,12 +30,18 @@ def task_document_version_ocr_process(self, document_version_id, user_id=None):
     )
 
     try:
+        page_chunk_size = document_version.document.document_type.ocr_settings.page_chunk_size
+        document_version_page_id_list = list(
+            document_version.pages.values_list('pk', flat=True)
+        )
+
         document_version_page_tasks = []
-        for document_version_page in document_version.pages.all():
+        for index in range(0, len(document_version_page_id_list), page_chunk_size):
             document_version_page_tasks.append(
-                task_document_version_page_ocr_process.s(
-                    document_version_page_id=document_version_page.pk,
-                    user_id=user_id
+                task_document_version_page_list_ocr_process.s(
+                    document_version_page_id_list=document_version_page_id_list[
+                        index:index + page_chunk_size
+                    ], user_id=user_id
                 )
             )
         chord(document_version_page_tasks)(
@@ -91,6 +97,49 @@ def task_document_version_page_ocr_process(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True, default_retry_delay=TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
+)
+def task_document_version_page_list_ocr_process(
+    self, document_version_page_id_list, user_id=None
+):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+    DocumentVersionPageOCRContent = apps.get_model(
+        app_label='ocr', model_name='DocumentVersionPageOCRContent'
+    )
+    DocumentVersionPage = apps.get_model(
+        app_label='documents', model_name='DocumentVersionPage'
+    )
+    document_version_page_list = DocumentVersionPage.objects.filter(
+        pk__in=document_version_page_id_list
+    ).select_related('document_version__document')
+
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    try:
+        DocumentVersionPageOCRContent.objects.process_document_version_page_list(
+            document_version_page_list=document_version_page_list,
+            user=user
+        )
+    except CachePartitionFile.DoesNotExist as exception:
+        logger.info(
+            'Document version page image not found. Possible cause '
+            'overloaded system or cache size too small. Retrying task.',
+        )
+        raise self.retry(exc=exception)
+    except LockError as exception:
+        raise self.retry(exc=exception)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+
 @app.task(bind=True, ignore_result=True)
 def task_document_version_ocr_finished(self, results, document_version_id, user_id=None):
     logger.info(
@@ -6,6 +6,7 @@ from mayan.apps.rest_api.tests.base import BaseAPITestCase
 from ..events import (
     event_ocr_document_version_finished, event_ocr_document_version_submitted
 )
+from ..literals import DEFAULT_OCR_PAGE_CHUNK_SIZE
 from ..permissions import (
     permission_document_type_ocr_setup, permission_document_version_ocr,
     permission_document_version_ocr_content_view
@@ -44,7 +45,13 @@ class DocumentTypeOCRSettingsAPIViewTestCase(
 
         response = self._request_test_document_type_ocr_settings_details_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, {'auto_ocr': False})
+        self.assertEqual(
+            response.data, {
+                'auto_ocr': False,
+                'page_chunk_size': DEFAULT_OCR_PAGE_CHUNK_SIZE,
+                'skip_text_layer_pages': False
+            }
+        )
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -68,7 +75,13 @@ class DocumentTypeOCRSettingsAPIViewTestCase(
 
         response = self._request_test_document_type_ocr_settings_patch_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, {'auto_ocr': True})
+        self.assertEqual(
+            response.data, {
+                'auto_ocr': True,
+                'page_chunk_size': DEFAULT_OCR_PAGE_CHUNK_SIZE,
+                'skip_text_layer_pages': False
+            }
+        )
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -92,7 +105,13 @@ class DocumentTypeOCRSettingsAPIViewTestCase(
 
         response = self._request_test_document_type_ocr_settings_put_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, {'auto_ocr': True})
+        self.assertEqual(
+            response.data, {
+                'auto_ocr': True,
+                'page_chunk_size': DEFAULT_OCR_PAGE_CHUNK_SIZE,
+                'skip_text_layer_pages': False
+            }
+        )
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -0,0 +1,39 @@
+import unittest
+
+from mayan.apps.documents.tests.base import GenericDocumentTestCase
+
+from ..backends.tesseract import TesseractAPI, tesserocr
+
+from .literals import TEST_DOCUMENT_VERSION_OCR_CONTENT
+
+
+@unittest.skipIf(not tesserocr, 'The tesserocr Python binding is not installed.')
+class TesseractAPIBackendTestCase(GenericDocumentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_document_version_page = self.test_document_version.pages.first()
+
+    def tearDown(self):
+        TesseractAPI.engines_end()
+        super().tearDown()
+
+    def _execute_test_backend(self):
+        cache_filename = self.test_document_version_page.generate_image()
+
+        with self.test_document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
+            return TesseractAPI().execute(
+                file_object=file_object, language='eng'
+            )
+
+    def test_execute(self):
+        content = self._execute_test_backend()
+
+        self.assertTrue(TEST_DOCUMENT_VERSION_OCR_CONTENT in content)
+
+    def test_engine_reuse(self):
+        self._execute_test_backend()
+        engine = TesseractAPI._engines[('eng', None)][0]
+
+        self._execute_test_backend()
+
+        self.assertEqual(TesseractAPI._engines[('eng', None)], [engine])
@@ -1,7 +1,15 @@
+import mock
+
 from django.test import override_settings
 
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
-from mayan.apps.documents.tests.literals import TEST_DEU_DOCUMENT_PATH
+from mayan.apps.documents.tests.literals import (
+    TEST_DEU_DOCUMENT_PATH, TEST_HYBRID_DOCUMENT
+)
+
+from ..classes import OCRBackendBase
+from ..models import DocumentVersionPageOCRContent
+from ..utils import evaluate_text_layer
 
 from .literals import (
     TEST_DOCUMENT_VERSION_OCR_CONTENT, TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_1,
@@ -16,6 +24,100 @@ class DocumentOCRTestCase(GenericDocumentTestCase):
         self.assertTrue(TEST_DOCUMENT_VERSION_OCR_CONTENT in content)
 
 
+class DocumentVersionPageListOCRTestCase(GenericDocumentTestCase):
+    def test_process_document_version_page_list(self):
+        DocumentVersionPageOCRContent.objects.process_document_version_page_list(
+            document_version_page_list=self.test_document_version.pages.all()
+        )
+
+        content = self.test_document_version.pages.first().ocr_content.content
+        self.assertTrue(TEST_DOCUMENT_VERSION_OCR_CONTENT in content)
+
+    def test_process_document_version_page_list_existing_content(self):
+        for repeat in range(2):
+            DocumentVersionPageOCRContent.objects.process_document_version_page_list(
+                document_version_page_list=self.test_document_version.pages.all()
+            )
+
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.filter(
+                document_version_page__document_version=self.test_document_version
+            ).count(), self.test_document_version.pages.count()
+        )
+
+
+class TextLayerOCRTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_HYBRID_DOCUMENT
+
+    def setUp(self):
+        super().setUp()
+        self.test_document_type.ocr_settings.skip_text_layer_pages = True
+        self.test_document_type.ocr_settings.save()
+
+    def _get_test_document_version_page_text_layer_characters(self):
+        content = self.test_document_version.pages.first().content_object.content.content
+
+        return [
+            character for character in content if not character.isspace()
+        ]
+
+    def _process_test_document_version_page(self):
+        # Only the first page of the test document has a text layer.
+        DocumentVersionPageOCRContent.objects.process_document_version_page_list(
+            document_version_page_list=(
+                self.test_document_version.pages.first(),
+            )
+        )
+
+    @override_settings(OCR_TEXT_LAYER_MINIMUM_CHARACTERS=1)
+    def test_text_layer_page_skip(self):
+        with mock.patch.object(OCRBackendBase, 'get_instance') as mock_get_instance:
+            self._process_test_document_version_page()
+
+        mock_get_instance.assert_not_called()
+
+        characters = self._get_test_document_version_page_text_layer_characters()
+        ratio = sum(
+            1 for character in characters if character.isalnum()
+        ) / len(characters)
+
+        test_document_version_page = self.test_document_version.pages.first()
+        self.assertEqual(
+            test_document_version_page.ocr_content.content,
+            test_document_version_page.content_object.content.content
+        )
+        self.assertEqual(
+            test_document_version_page.ocr_content.text_layer_reason,
+            'Text layer has %(count)d characters, %(ratio)d%% '
+            'alphanumeric. OCR skipped.' % {
+                'count': len(characters), 'ratio': ratio * 100
+            }
+        )
+
+    @override_settings(OCR_TEXT_LAYER_MINIMUM_CHARACTERS=100000)
+    def test_text_layer_page_too_short(self):
+        with mock.patch.object(OCRBackendBase, 'get_instance', wraps=OCRBackendBase.get_instance) as mock_get_instance:
+            self._process_test_document_version_page()
+
+        mock_get_instance.assert_called_once()
+
+        characters = self._get_test_document_version_page_text_layer_characters()
+
+        test_document_version_page = self.test_document_version.pages.first()
+        self.assertEqual(
+            test_document_version_page.ocr_content.text_layer_reason,
+            'Text layer has %d characters, the minimum is 100000.' % len(
+                characters
+            )
+        )
+
+    @override_settings(OCR_TEXT_LAYER_MINIMUM_CHARACTERS=1)
+    def test_text_layer_evaluate_broken_encoding(self):
+        is_usable, reason = evaluate_text_layer(content='\ufffd\ufffd\ufffd a')
+
+        self.assertFalse(is_usable)
+
+
 @override_settings(OCR_AUTO_OCR=True)
 class GermanOCRSupportTestCase(GenericDocumentTestCase):
     test_document_language = 'deu'
@@ -1,5 +1,42 @@
 from django.apps import apps
 from django.utils.encoding import force_text
+from django.utils.translation import ugettext as _
+
+from .settings import (
+    setting_text_layer_minimum_alphanumeric_ratio,
+    setting_text_layer_minimum_characters
+)
+
+
+def evaluate_text_layer(content):
+    """
+    Decide if the text layer of a page can be used instead of its OCR.
+    Returns a tuple of the decision and its reason.
+    """
+    characters = [character for character in content if not character.isspace()]
+    minimum_characters = setting_text_layer_minimum_characters.value
+
+    if not characters or len(characters) < minimum_characters:
+        return False, _(
+            'Text layer has %(count)d characters, the minimum is '
+            '%(minimum)d.'
+        ) % {'count': len(characters), 'minimum': minimum_characters}
+
+    ratio = sum(
+        1 for character in characters if character.isalnum()
+    ) / len(characters)
+    minimum_ratio = setting_text_layer_minimum_alphanumeric_ratio.value
+
+    if ratio < minimum_ratio:
+        return False, _(
+            'Text layer has %(ratio)d%% alphanumeric characters, the '
+            'minimum is %(minimum)d%%.'
+        ) % {'minimum': minimum_ratio * 100, 'ratio': ratio * 100}
+
+    return True, _(
+        'Text layer has %(count)d characters, %(ratio)d%% alphanumeric. '
+        'OCR skipped.'
+    ) % {'count': len(characters), 'ratio': ratio * 100}
 
 
 def get_instance_ocr_content(instance):
@@ -195,7 +195,7 @@ class DocumentTypeSettingsEditView(ExternalObjectViewMixin, SingleObjectEditView
     external_object_class = DocumentType
     external_object_permission = permission_document_type_ocr_setup
     external_object_pk_url_kwarg = 'document_type_id'
-    fields = ('auto_ocr',)
+    fields = ('auto_ocr', 'page_chunk_size', 'skip_text_layer_pages')
     post_action_redirect = reverse_lazy(
         viewname='documents:document_type_list'
     )
@@ -35,7 +35,7 @@ class LayerMaximumOrderAPIViewTestCase(
         response = self._request_document_file_page_image_api_view_with_maximum_layer_order()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        image_buffer = BytesIO(response.content)
+        image_buffer = BytesIO(response.getvalue())
         image = Image.open(fp=image_buffer)
 
         self.assertEqual(image.getpixel(xy=(0, 0)), (0, 0, 0))
@@ -1,15 +1,18 @@
 import logging
 from io import BytesIO, StringIO
+import tempfile
 
 from django.core.files.base import File
 from django.core.files.storage import Storage
 from django.utils.deconstruct import deconstructible
+from django.utils.encoding import force_bytes
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.class_mixins import AppsModuleLoaderMixin
 
 from .literals import DEFAULT_STORAGE_BACKEND
+from .settings import setting_temporary_directory
 
 logger = logging.getLogger(name=__name__)
 
@@ -198,3 +201,78 @@ class PassthroughStorage(Storage):
 
     def size(self, *args, **kwargs):
         return self.next_storage_backend.size(*args, **kwargs)
+
+
+class TeeFile(File):
+    """
+    Wrap a file object and copy the data read from it to a local temporary
+    file, calculating its hash and size on the way. Allows processing a
+    file that is being saved to a storage without reading it back from
+    the storage. Seeking to the start discards the data copied. Reading
+    from any other position than the end of the copied data marks the
+    copy as incomplete.
+    """
+    def __init__(self, file_object, hash_function, name=None):
+        super().__init__(
+            file=file_object, name=name or getattr(file_object, 'name', None)
+        )
+        self.hash_function = hash_function
+        self.is_complete = True
+        self.copy_file = tempfile.NamedTemporaryFile(
+            dir=setting_temporary_directory.value
+        )
+        self.file.seek(0)
+        self._reset()
+
+    def _reset(self):
+        self.copy_file.seek(0)
+        self.copy_file.truncate()
+        self.copy_size = 0
+        self.hash_object = self.hash_function()
+
+    def copy_close(self):
+        self.copy_file.close()
+
+    def copy_finish(self, block_size=-1):
+        """
+        Read the data not consumed by the storage and flush the copy.
+        """
+        while self.read(block_size):
+            """Read until the end of the file."""
+
+        self.copy_file.flush()
+
+    def copy_open(self):
+        """
+        Return a new file object for reading the copy. The `tee_file`
+        attribute of the file object points back to this instance.
+        """
+        file_object = File(
+            file=open(file=self.copy_file.name, mode='rb'),
+            name=self.copy_file.name
+        )
+        file_object.tee_file = self
+        return file_object
+
+    def read(self, *args, **kwargs):
+        if self.file.tell() != self.copy_size:
+            self.is_complete = False
+
+        data = self.file.read(*args, **kwargs)
+
+        if data:
+            data_bytes = force_bytes(s=data)
+            self.copy_file.write(data_bytes)
+            self.copy_size += len(data_bytes)
+            self.hash_object.update(data_bytes)
+
+        return data
+
+    def seek(self, *args, **kwargs):
+        result = self.file.seek(*args, **kwargs)
+
+        if self.file.tell() == 0:
+            self.is_complete = True
+            self._reset()
+
+        return result
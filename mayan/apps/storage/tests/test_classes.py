@@ -0,0 +1,59 @@
+import hashlib
+from io import BytesIO
+
+from django.core.files.storage import FileSystemStorage
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import TeeFile
+from ..utils import fs_cleanup, mkdtemp
+
+from .literals import TEST_FILE_CONTENTS_1, TEST_FILE_NAME
+
+
+class TeeFileTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.temporary_directory = mkdtemp()
+        self.test_storage = FileSystemStorage(
+            location=self.temporary_directory
+        )
+        self.test_tee_file = TeeFile(
+            file_object=BytesIO(TEST_FILE_CONTENTS_1),
+            hash_function=hashlib.sha256, name=TEST_FILE_NAME
+        )
+
+    def tearDown(self):
+        self.test_tee_file.copy_close()
+        fs_cleanup(filename=self.temporary_directory)
+        super().tearDown()
+
+    def test_storage_save_copy(self):
+        self.test_storage.save(
+            content=self.test_tee_file, name=TEST_FILE_NAME
+        )
+        self.test_tee_file.copy_finish()
+
+        self.assertTrue(self.test_tee_file.is_complete)
+        self.assertEqual(
+            self.test_tee_file.copy_size, len(TEST_FILE_CONTENTS_1)
+        )
+        self.assertEqual(
+            self.test_tee_file.hash_object.hexdigest(),
+            hashlib.sha256(TEST_FILE_CONTENTS_1).hexdigest()
+        )
+
+        with self.test_tee_file.copy_open() as file_object:
+            self.assertEqual(file_object.read(), TEST_FILE_CONTENTS_1)
+
+    def test_non_sequential_read(self):
+        self.test_tee_file.read(1)
+        self.test_tee_file.file.seek(2)
+        self.test_tee_file.read(1)
+
+        self.assertFalse(self.test_tee_file.is_complete)
+
+        self.test_tee_file.seek(0)
+
+        self.assertTrue(self.test_tee_file.is_complete)
+        self.assertEqual(self.test_tee_file.copy_size, 0)
@@ -1,4 +1,6 @@
+from collections import OrderedDict
 import hashlib
+import threading
 
 from django.template import Context, Engine, Template as DjangoTemplate
 from django.template.response import TemplateResponse
@@ -6,6 +8,8 @@ from django.urls import reverse
 
 from mayan.apps.common.settings import setting_home_view
 
+from .literals import TEMPLATE_CACHE_MAXIMUM_SIZE
+
 
 class AJAXTemplate:
     _registry = {}
@@ -52,16 +56,75 @@ class AJAXTemplate:
 
 
 class Template:
-    def __init__(self, template_string):
-        engine = Engine(
-            builtins=[
-                'mathfilters.templatetags.mathfilters',
-                'mayan.apps.templating.templatetags.templating_tags',
-            ]
+    """
+    Template using a shared engine. Compiled templates are kept in a least
+    recently used cache keyed by the hash of the template string.
+    """
+    _cache = OrderedDict()
+    _cache_hits = 0
+    _cache_maximum_size = TEMPLATE_CACHE_MAXIMUM_SIZE
+    _cache_misses = 0
+    _engine = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def cache_clear(cls):
+        with cls._lock:
+            cls._cache.clear()
+            cls._cache_hits = 0
+            cls._cache_misses = 0
+
+    @classmethod
+    def cache_info(cls):
+        return {
+            'hits': cls._cache_hits,
+            'maximum_size': cls._cache_maximum_size,
+            'misses': cls._cache_misses, 'size': len(cls._cache)
+        }
+
+    @classmethod
+    def get_compiled_template(cls, template_string):
+        key = hashlib.sha256(template_string.encode()).hexdigest()
+
+        with cls._lock:
+            try:
+                template = cls._cache[key]
+            except KeyError:
+                cls._cache_misses += 1
+            else:
+                cls._cache.move_to_end(key)
+                cls._cache_hits += 1
+                return template
+
+        # Compile outside of the lock. Syntax errors are raised to the
+        # caller and are not cached.
+        template = DjangoTemplate(
+            engine=cls.get_engine(), template_string=template_string
         )
 
-        self._template = DjangoTemplate(
-            engine=engine, template_string=template_string
+        with cls._lock:
+            cls._cache[key] = template
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls._cache_maximum_size:
+                cls._cache.popitem(last=False)
+
+        return template
+
+    @classmethod
+    def get_engine(cls):
+        if not cls._engine:
+            cls._engine = Engine(
+                builtins=[
+                    'mathfilters.templatetags.mathfilters',
+                    'mayan.apps.templating.templatetags.templating_tags',
+                ]
+            )
+
+        return cls._engine
+
+    def __init__(self, template_string):
+        self._template = self.get_compiled_template(
+            template_string=template_string
         )
 
     def render(self, context=None):
@@ -0,0 +1,53 @@
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import Template
+
+
+class TemplateCacheTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        Template.cache_clear()
+
+    def tearDown(self):
+        Template.cache_clear()
+        super().tearDown()
+
+    def test_template_cache_hit(self):
+        Template(template_string='{{ value }}')
+        template = Template(template_string='{{ value }}')
+
+        self.assertEqual(template.render(context={'value': 1}), '1')
+
+        cache_info = Template.cache_info()
+        self.assertEqual(cache_info['hits'], 1)
+        self.assertEqual(cache_info['misses'], 1)
+        self.assertEqual(cache_info['size'], 1)
+
+    def test_template_cache_context_isolation(self):
+        template = Template(template_string='{{ value }}')
+        self.assertEqual(template.render(context={'value': 1}), '1')
+
+        template = Template(template_string='{{ value }}')
+        self.assertEqual(template.render(context={'value': 2}), '2')
+
+    def test_template_cache_eviction(self):
+        cache_maximum_size = Template._cache_maximum_size
+        Template._cache_maximum_size = 2
+
+        try:
+            Template(template_string='{{ 1 }}')
+            Template(template_string='{{ 2 }}')
+            # Access the first template to make the second one the least
+            # recently used.
+            Template(template_string='{{ 1 }}')
+            Template(template_string='{{ 3 }}')
+
+            self.assertEqual(Template.cache_info()['size'], 2)
+
+            Template(template_string='{{ 1 }}')
+            self.assertEqual(Template.cache_info()['misses'], 3)
+
+            Template(template_string='{{ 2 }}')
+            self.assertEqual(Template.cache_info()['misses'], 4)
+        finally:
+            Template._cache_maximum_size = cache_maximum_size
@@ -3,6 +3,9 @@ from django.test import TestCase, TransactionTestCase
 from mayan.apps.acls.tests.mixins import ACLTestCaseMixin
 from mayan.apps.converter.tests.mixins import LayerTestCaseMixin
 from mayan.apps.events.tests.mixins import EventTestCaseMixin
+from mayan.apps.file_caching.tests.mixins import (
+    CachePartitionFileTestCaseMixin
+)
 from mayan.apps.permissions.tests.mixins import PermissionTestCaseMixin
 from mayan.apps.smart_settings.tests.mixins import SmartSettingsTestCaseMixin
 from mayan.apps.user_management.tests.mixins import UserTestMixin
@@ -18,8 +21,8 @@ from .mixins import (
 
 
 class BaseTestCaseMixin(
-    DelayTestCaseMixin, LayerTestCaseMixin, SilenceLoggerTestCaseMixin,
-    ConnectionsCheckTestCaseMixin, DownloadTestCaseMixin,
+    CachePartitionFileTestCaseMixin, DelayTestCaseMixin, LayerTestCaseMixin,
+    SilenceLoggerTestCaseMixin, ConnectionsCheckTestCaseMixin, DownloadTestCaseMixin,
     EventTestCaseMixin, RandomPrimaryKeyModelMonkeyPatchMixin,
     ACLTestCaseMixin, ModelTestCaseMixin, OpenFileCheckTestCaseMixin,
     PermissionTestCaseMixin, SmartSettingsTestCaseMixin,
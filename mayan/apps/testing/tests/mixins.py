@@ -574,7 +574,7 @@ class TestModelTestCaseMixin(ContentTypeTestCaseMixin, PermissionTestMixin):
         def save(instance, *args, **kwargs):
             # Custom .save() method to use random primary key values.
             if instance.pk:
-                return models.Model.self(instance, *args, **kwargs)
+                return models.Model.save(instance, *args, **kwargs)
             else:
                 instance.pk = RandomPrimaryKeyModelMonkeyPatchMixin.get_unique_primary_key(
                     model=instance._meta.model
@@ -21,6 +21,7 @@ from django.views.generic.list import ListView
 from pure_pagination.mixins import PaginationMixin
 
 from mayan.apps.acls.models import AccessControlList
+from mayan.apps.navigation.classes import Menu
 
 from .forms import ChoiceForm
 from .icons import (
@@ -887,6 +888,17 @@ class SingleObjectListView(
 
         return result
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        # Check the access to the links of all the objects of the page at
+        # once instead of once per object per link when rendering.
+        Menu.prefetch_access(
+            objects=context['object_list'], request=self.request
+        )
+
+        return context
+
     def get_paginate_by(self, queryset):
         return setting_paginate_by.value
 